@@ -0,0 +1,101 @@
+"""
+Synthetic CL and Keys API responses for parser benchmarks.
+
+Every generator yields the response body as chunks of bytes, the same way `json_stream.requests.load`
+consumes a streamed HTTP response, so a 1M validators payload is never materialised in memory.
+"""
+
+import json
+from typing import Iterable, Iterator
+
+CHUNK_SIZE = 64 * 1024
+
+FAR_FUTURE_EPOCH = '18446744073709551615'
+
+
+def _chunked(items: Iterable[dict]) -> Iterator[bytes]:
+    buffer = bytearray(b'{"data":[')
+    first = True
+    for item in items:
+        if not first:
+            buffer += b','
+        first = False
+        buffer += json.dumps(item, separators=(',', ':')).encode()
+        if len(buffer) >= CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b']}'
+    yield bytes(buffer)
+
+
+def pubkey(index: int) -> str:
+    return f'0x{index:096x}'
+
+
+def module_address(module_id: int) -> str:
+    return f'0x{module_id:040x}'
+
+
+def validators(count: int) -> Iterator[bytes]:
+    """Response of `eth/v1/beacon/states/{state_id}/validators`"""
+    return _chunked(
+        {
+            'index': str(index),
+            'balance': '32000000000',
+            'status': 'active_ongoing',
+            'validator': {
+                'pubkey': pubkey(index),
+                'withdrawal_credentials': f'0x01{index:062x}',
+                'effective_balance': '32000000000',
+                'slashed': False,
+                'activation_eligibility_epoch': '0',
+                'activation_epoch': '0',
+                'exit_epoch': FAR_FUTURE_EPOCH,
+                'withdrawable_epoch': FAR_FUTURE_EPOCH,
+            },
+        }
+        for index in range(count)
+    )
+
+
+def modules_operators(modules: int, operators_per_module: int) -> Iterator[bytes]:
+    """Response of Keys API `v1/operators`"""
+    return _chunked(
+        {
+            'module': {
+                'id': module_id,
+                'stakingModuleAddress': module_address(module_id),
+                'type': 'curated-onchain-v1',
+                'nonce': 1,
+            },
+            'operators': [
+                {
+                    'index': operator_index,
+                    'active': True,
+                    'name': f'Operator {module_id}#{operator_index}',
+                    'rewardAddress': module_address(operator_index),
+                    'stakingLimit': 10000,
+                    'stoppedValidators': 0,
+                    'totalSigningKeys': 10000,
+                    'usedSigningKeys': 10000,
+                    'moduleAddress': module_address(module_id),
+                }
+                for operator_index in range(operators_per_module)
+            ],
+        }
+        for module_id in range(1, modules + 1)
+    )
+
+
+def lido_keys(count: int, modules: int, operators_per_module: int) -> Iterator[bytes]:
+    """Response of Keys API `v1/keys?used=true`"""
+    return _chunked(
+        {
+            'key': pubkey(index),
+            'depositSignature': f'0x{index:0192x}',
+            'operatorIndex': index % operators_per_module,
+            'used': True,
+            'moduleAddress': module_address(index % modules + 1),
+        }
+        for index in range(count)
+    )
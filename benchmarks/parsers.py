@@ -0,0 +1,219 @@
+"""
+Benchmarks for the validators index and Lido keys parsers.
+
+Usage:
+    poetry run python -m benchmarks.parsers
+    poetry run python -m benchmarks.parsers --validators 100000 --keys 30000 --compare benchmarks/results/0.4.0.json
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tomllib
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+import json_stream
+
+from benchmarks import generators
+from src.providers.consensus.client import ConsensusClient
+from src.providers.keys_api.client import KeysAPIClient
+
+MODULES = 4
+OPERATORS_PER_MODULE = 500
+
+RESULTS_DIR = Path(__file__).parent / 'results'
+
+
+class _Items(list):
+    """Minimal stand-in for `TransientStreamingJSONList` over an already decoded list"""
+
+    def persistent(self):
+        return self
+
+
+@dataclass
+class Case:
+    parser: str
+    implementation: str
+    items: int
+    run: Callable[[], Any]
+
+
+@dataclass
+class Result:
+    parser: str
+    implementation: str
+    items: int
+    seconds: float
+    items_per_second: float
+    peak_memory_bytes: int
+    retained_memory_bytes: int
+    retained_allocations: int
+
+
+def _stream(payload: list[bytes]):
+    return json_stream.load(iter(payload))['data']
+
+
+def _loads(payload: list[bytes]):
+    return _Items(json.loads(b''.join(payload))['data'])
+
+
+def build_cases(validators_count: int, keys_count: int) -> list[Case]:
+    validators = list(generators.validators(validators_count))
+    operators = list(generators.modules_operators(MODULES, OPERATORS_PER_MODULE))
+    keys = list(generators.lido_keys(keys_count, MODULES, OPERATORS_PER_MODULE))
+    modules_operators_dict, _ = KeysAPIClient.parse_modules(_stream(operators))
+    operators_count = MODULES * OPERATORS_PER_MODULE
+
+    cases = []
+    for name, load in (('json_stream', _stream), ('json_loads', _loads)):
+        cases.append(
+            Case(
+                parser='ConsensusClient.parse_validators',
+                implementation=name,
+                items=validators_count,
+                run=lambda load=load: ConsensusClient.parse_validators(load(validators), {}),
+            )
+        )
+        cases.append(
+            Case(
+                parser='KeysAPIClient.parse_modules',
+                implementation=name,
+                items=operators_count,
+                run=lambda load=load: KeysAPIClient.parse_modules(load(operators)),
+            )
+        )
+        cases.append(
+            Case(
+                parser='KeysAPIClient.parse_keys',
+                implementation=name,
+                items=keys_count,
+                run=lambda load=load: KeysAPIClient.parse_keys(load(keys), modules_operators_dict),
+            )
+        )
+    return cases
+
+
+def measure(case: Case, repeats: int) -> Result:
+    timings = []
+    for _ in range(repeats):
+        gc.collect()
+        start = time.perf_counter()
+        result = case.run()
+        timings.append(time.perf_counter() - start)
+        del result
+
+    gc.collect()
+    tracemalloc.start()
+    result = case.run()
+    retained, peak = tracemalloc.get_traced_memory()
+    retained_allocations = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+    tracemalloc.stop()
+    del result
+
+    seconds = min(timings)
+    return Result(
+        parser=case.parser,
+        implementation=case.implementation,
+        items=case.items,
+        seconds=seconds,
+        items_per_second=case.items / seconds,
+        peak_memory_bytes=peak,
+        retained_memory_bytes=retained,
+        retained_allocations=retained_allocations,
+    )
+
+
+def compare(current: Iterable[Result], previous: dict, threshold: float) -> list[str]:
+    """Returns descriptions of cases that became slower or hungrier than `threshold` allows"""
+    baseline = {(r['parser'], r['implementation']): r for r in previous['results']}
+    regressions = []
+    for result in current:
+        old = baseline.get((result.parser, result.implementation))
+        if old is None:
+            continue
+        if result.items_per_second < old['items_per_second'] * (1 - threshold):
+            regressions.append(
+                f'{result.parser} [{result.implementation}] throughput: '
+                f'{old["items_per_second"]:.0f} -> {result.items_per_second:.0f} items/s'
+            )
+        if result.peak_memory_bytes > old['peak_memory_bytes'] * (1 + threshold):
+            regressions.append(
+                f'{result.parser} [{result.implementation}] peak memory: '
+                f'{old["peak_memory_bytes"]} -> {result.peak_memory_bytes} bytes'
+            )
+    return regressions
+
+
+def _version() -> str:
+    with open(Path(__file__).parent.parent / 'pyproject.toml', 'rb') as f:
+        return tomllib.load(f)['tool']['poetry']['version']
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--validators', type=int, default=1_000_000, help='Validators in synthetic CL response')
+    parser.add_argument('--keys', type=int, default=300_000, help='Keys in synthetic Keys API response')
+    parser.add_argument('--repeats', type=int, default=3, help='Timing runs per case, the best one is reported')
+    parser.add_argument('--only', action='append', default=[], help='Run only parsers containing this substring')
+    parser.add_argument('--output', type=Path, help='Results file. Default: benchmarks/results/<version>.json')
+    parser.add_argument('--compare', type=Path, help='Previous results file to check for regressions')
+    parser.add_argument('--threshold', type=float, default=0.1, help='Allowed relative regression')
+    args = parser.parse_args()
+
+    version = _version()
+    cases = [
+        case
+        for case in build_cases(args.validators, args.keys)
+        if not args.only or any(only in case.parser for only in args.only)
+    ]
+
+    results = []
+    for case in cases:
+        result = measure(case, args.repeats)
+        results.append(result)
+        print(
+            f'{result.parser:<35} {result.implementation:<12} '
+            f'{result.items_per_second:>12,.0f} items/s '
+            f'peak {result.peak_memory_bytes / 2**20:>9.1f} MiB '
+            f'retained {result.retained_memory_bytes / 2**20:>9.1f} MiB '
+            f'in {result.retained_allocations:,} blocks'
+        )
+
+    output = args.output or RESULTS_DIR / f'{version}.json'
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(
+            {
+                'version': version,
+                'python': sys.version,
+                'platform': platform.platform(),
+                'created_at': datetime.now(timezone.utc).isoformat(),
+                'params': {'validators': args.validators, 'keys': args.keys, 'repeats': args.repeats},
+                'results': [asdict(r) for r in results],
+            },
+            f,
+            indent=2,
+        )
+    print(f'Results are saved to {output}')
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for regression in regressions:
+            print(f'REGRESSION: {regression}')
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
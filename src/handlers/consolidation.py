@@ -4,16 +4,14 @@ from dataclasses import dataclass
 from unsync import unsync
 
 from src.alerts.common import CommonAlert
-from src.handlers.handler import WatcherHandler
+from src.handlers.handler import LidoContractsHandler
 from src.handlers.helpers import beaconchain, validator_pubkey_link
-from src.metrics.prometheus.duration_meter import duration_meter
+from src.metrics.prometheus.duration_meter import duration_meter, head_slot_exemplar
 from src.providers.consensus.typings import (
-    BlockDetailsResponse,
     ConsolidationRequest,
     FullBlockInfo,
     ValidatorStatus,
 )
-from src.utils.exit import ValidatorExitsInfo, get_last_requested_validator_exit_indexes
 from src.variables import ADDITIONAL_ALERTMANAGER_LABELS
 
 logger = logging.getLogger()
@@ -52,30 +50,29 @@ class RequestedToExitConsolidation:
     target_pubkey: str
 
 
-class ConsolidationHandler(WatcherHandler):
-    last_total_vebo_requests_processed = 0
-    last_requested_exit_indexes: dict[int, set[int]]
-
-    def __init__(self):
-        super().__init__()
-        self.last_requested_exit_indexes = {}
-
+class ConsolidationHandler(LidoContractsHandler):
     @unsync
-    @duration_meter()
-    def handle(self, watcher, head: FullBlockInfo):  # pylint: disable=too-many-branches
+    @duration_meter(head_slot_exemplar)
+    def handle(self, watcher, head: FullBlockInfo):
         if not head.message.body.execution_requests or not head.message.body.execution_requests.consolidations:
             logger.info({"msg": f"No consolidation requests in block [{head.message.slot}]"})
+            self.handle_in_order(watcher, None)
             return
+        self.handle_in_order(watcher, head)
 
-        slot = head.message.slot
+    def handle_block(self, watcher, block: FullBlockInfo) -> None:  # pylint: disable=too-many-branches
+        if (execution_requests := block.message.body.execution_requests) is None:
+            return
+        slot = block.message.slot
+        valid_withdrawal_addresses = watcher.valid_withdrawal_addresses
         user_wa = []
         user_wa_foreign_source_pubkey = []
         user_wa_foreign_target_pubkey = []
         user_wa_user_source_target_pubkey = []
         foreign_wa_user_source_pubkey = []
         foreign_wa_user_target_pubkey = []
-        for consolidation in head.message.body.execution_requests.consolidations:
-            if consolidation.source_address in watcher.valid_withdrawal_addresses:
+        for consolidation in execution_requests.consolidations:
+            if consolidation.source_address in valid_withdrawal_addresses:
                 user_wa.append(consolidation)
 
                 if consolidation.source_pubkey not in watcher.user_keys:
@@ -95,6 +92,10 @@ class ConsolidationHandler(WatcherHandler):
             # in the future we should check the type of validator WC:
             # if it is 0x02 and source_address == WCs of source validator - It's donation!
 
+        if user_wa_user_source_target_pubkey:
+            # Requested exits are read before any alert is sent, so the block is deferred as a whole
+            watcher.exit_requests.update(watcher, block.message.body.execution_payload.block_number)
+
         if user_wa:
             self._send_withdrawals_address(watcher, slot, user_wa)
         if user_wa_foreign_source_pubkey:
@@ -107,7 +108,7 @@ class ConsolidationHandler(WatcherHandler):
             self._send_foreign_withdrawal_address_user_target_pubkey(watcher, slot, foreign_wa_user_target_pubkey)
         if user_wa_user_source_target_pubkey:
             self._process_user_withdrawal_address_user_source_target_pubkey(
-                watcher, head, user_wa_user_source_target_pubkey
+                watcher, block, user_wa_user_source_target_pubkey
             )
 
     def _process_user_withdrawal_address_user_source_target_pubkey(
@@ -117,9 +118,7 @@ class ConsolidationHandler(WatcherHandler):
         pubkeys = list({pk for c in consolidations for pk in (c.source_pubkey, c.target_pubkey)})
         validators = watcher.consensus.get_validators(slot, pubkeys)
         pending_consolidations = watcher.consensus.get_pending_consolidations(slot)
-        self._update_last_requested_exit_indexes(watcher, block)
-
-        all_exit_indexes = set().union(*self.last_requested_exit_indexes.values())
+        all_exit_indexes = watcher.exit_requests.indexes
 
         over_deposit_consolidations = []
         invalid_status_consolidations = []
@@ -135,16 +134,16 @@ class ConsolidationHandler(WatcherHandler):
             if target_validator is None:
                 raise ValueError(f'Unknown target validator pubkey: {consolidation.target_pubkey}')
 
-            if int(source_validator.balance) + int(target_validator.balance) > 2049000000000:
+            if source_validator.balance + target_validator.balance > 2049000000000:
                 over_deposit_consolidations.append(
                     OverDepositConsolidation(
                         source_address=consolidation.source_address,
-                        source_index=int(source_validator.index),
+                        source_index=source_validator.index,
                         source_pubkey=consolidation.source_pubkey,
-                        source_balance=int(source_validator.balance),
-                        target_index=int(target_validator.index),
+                        source_balance=source_validator.balance,
+                        target_index=target_validator.index,
                         target_pubkey=consolidation.target_pubkey,
-                        target_balance=int(target_validator.balance),
+                        target_balance=target_validator.balance,
                     )
                 )
 
@@ -155,14 +154,14 @@ class ConsolidationHandler(WatcherHandler):
                 invalid_status_consolidations.append(
                     InvalidStatusConsolidation(
                         source_address=consolidation.source_address,
-                        source_index=int(source_validator.index),
+                        source_index=source_validator.index,
                         source_pubkey=consolidation.source_pubkey,
                         source_status=source_validator.status,
-                        source_exit_epoch=int(source_validator.validator.exit_epoch),
-                        target_index=int(target_validator.index),
+                        source_exit_epoch=source_validator.validator.exit_epoch,
+                        target_index=target_validator.index,
                         target_pubkey=consolidation.target_pubkey,
                         target_status=target_validator.status,
-                        target_exit_epoch=int(target_validator.validator.exit_epoch),
+                        target_exit_epoch=target_validator.validator.exit_epoch,
                     )
                 )
 
@@ -177,13 +176,13 @@ class ConsolidationHandler(WatcherHandler):
             if pending_consolidation is None:
                 rejected_consolidations.append(consolidation)
 
-            if int(source_validator.index) in all_exit_indexes or int(target_validator.index) in all_exit_indexes:
+            if source_validator.index in all_exit_indexes or target_validator.index in all_exit_indexes:
                 requested_to_exit_consolidations.append(
                     RequestedToExitConsolidation(
                         source_address=consolidation.source_address,
-                        source_index=int(source_validator.index),
+                        source_index=source_validator.index,
                         source_pubkey=consolidation.source_pubkey,
-                        target_index=int(target_validator.index),
+                        target_index=target_validator.index,
                         target_pubkey=consolidation.target_pubkey,
                     )
                 )
@@ -245,7 +244,7 @@ class ConsolidationHandler(WatcherHandler):
         summary = "🚨🚨🚨 Validator consolidation was rejected on CL"
         self._send_alert(watcher, slot, alert, summary, consolidations, ADDITIONAL_ALERTMANAGER_LABELS)
 
-    def _send_over_deposit(self, watcher, slot: str, consolidations: list[OverDepositConsolidation]):
+    def _send_over_deposit(self, watcher, slot: int, consolidations: list[OverDepositConsolidation]):
         alert = CommonAlert(name="HeadWatcherConsolidationOverDeposit", severity="critical")
         summary = "⚠️⚠️⚠️ Total balance of source and target validators during consolidation is greater than 2049 ETH"
         description = '\n\n'.join(
@@ -254,7 +253,7 @@ class ConsolidationHandler(WatcherHandler):
         description += f'\n\nSlot: {beaconchain(slot)}'
         self.send_alert(watcher, alert.build_body(summary, description, ADDITIONAL_ALERTMANAGER_LABELS))
 
-    def _send_invalid_status(self, watcher, slot: str, consolidations: list[InvalidStatusConsolidation]):
+    def _send_invalid_status(self, watcher, slot: int, consolidations: list[InvalidStatusConsolidation]):
         alert = CommonAlert(name="HeadWatcherConsolidationInvalidStatus", severity="critical")
         summary = "⚠️⚠️⚠️ Attempt to consolidate validators in unexpected status (source must be active_exiting, target must be active_ongoing)"
         description = '\n\n'.join(
@@ -263,7 +262,7 @@ class ConsolidationHandler(WatcherHandler):
         description += f'\n\nSlot: {beaconchain(slot)}'
         self.send_alert(watcher, alert.build_body(summary, description, ADDITIONAL_ALERTMANAGER_LABELS))
 
-    def _send_requested_to_exit(self, watcher, slot: str, consolidations: list[RequestedToExitConsolidation]):
+    def _send_requested_to_exit(self, watcher, slot: int, consolidations: list[RequestedToExitConsolidation]):
         alert = CommonAlert(name="HeadWatcherConsolidationRequestedToExit", severity="critical")
         summary = "⚠️⚠️⚠️ Attempt to consolidate validators that were requested to exit by VEBO"
         description = '\n\n'.join(
@@ -275,7 +274,7 @@ class ConsolidationHandler(WatcherHandler):
     def _send_alert(
         self,
         watcher,
-        slot: str,
+        slot: int,
         alert: CommonAlert,
         summary: str,
         consolidations: list[ConsolidationRequest],
@@ -336,17 +335,3 @@ class ConsolidationHandler(WatcherHandler):
                 f'Target pubkey: {validator_pubkey_link(consolidation.target_pubkey, keys)}',
             ]
         )
-
-    @duration_meter()
-    def _update_last_requested_exit_indexes(self, watcher, block: BlockDetailsResponse) -> None:
-        """Update local cache with last validator indexes requested to exit by VEBO"""
-
-        exits_info = ValidatorExitsInfo(
-            last_total_requests_processed=self.last_total_vebo_requests_processed,
-            last_requested_exit_indexes=self.last_requested_exit_indexes,
-        )
-
-        updated_exits_info = get_last_requested_validator_exit_indexes(watcher, block, exits_info)
-
-        self.last_total_vebo_requests_processed = updated_exits_info.last_total_requests_processed
-        self.last_requested_exit_indexes = updated_exits_info.last_requested_exit_indexes
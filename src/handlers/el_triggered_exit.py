@@ -3,26 +3,31 @@ import logging
 from unsync import unsync
 
 from src.alerts.common import CommonAlert
-from src.handlers.handler import WatcherHandler
+from src.handlers.handler import LidoContractsHandler
 from src.handlers.helpers import beaconchain, validator_pubkey_link
 from src.keys_source.base_source import NamedKey
-from src.metrics.prometheus.duration_meter import duration_meter
+from src.metrics.prometheus.duration_meter import duration_meter, head_slot_exemplar
 from src.providers.consensus.typings import FullBlockInfo, WithdrawalRequest
 from src.variables import ADDITIONAL_ALERTMANAGER_LABELS
 
 logger = logging.getLogger()
 
 
-class ElTriggeredExitHandler(WatcherHandler):
+class ElTriggeredExitHandler(LidoContractsHandler):
     @unsync
-    @duration_meter()
+    @duration_meter(head_slot_exemplar)
     def handle(self, watcher, head: FullBlockInfo):
         if not head.message.body.execution_requests or not head.message.body.execution_requests.withdrawals:
             logger.debug({"msg": f"No withdrawal requests in block [{head.message.slot}]"})
+            self.handle_in_order(watcher, None)
             return
+        self.handle_in_order(watcher, head)
 
-        slot = head.message.slot
-        withdrawals = head.message.body.execution_requests.withdrawals
+    def handle_block(self, watcher, block: FullBlockInfo) -> None:
+        if (execution_requests := block.message.body.execution_requests) is None:
+            return
+        slot = block.message.slot
+        withdrawals = execution_requests.withdrawals
         valid_withdrawal_addresses = watcher.valid_withdrawal_addresses
 
         user_withdrawals = [
@@ -62,20 +67,20 @@ class ElTriggeredExitHandler(WatcherHandler):
                 watcher, slot, requests_from_unknown_source_for_our_validators
             )
 
-    def _send_full_withdrawal_alert(self, watcher, slot: str, withdrawals: list[WithdrawalRequest]):
+    def _send_full_withdrawal_alert(self, watcher, slot: int, withdrawals: list[WithdrawalRequest]):
         alert = CommonAlert(name="HeadWatcherFullELWithdrawalObserved", severity="info")
         summary = "⚠️ Full withdrawal (exit) requested for our validator(s)"
         description = '\n\n'.join(self._describe_withdrawal(w, watcher.user_keys) for w in withdrawals)
         self._send_alert(watcher, alert, summary, description, slot)
 
-    def _send_partial_withdrawal_alert(self, watcher, slot: str, withdrawals: list[WithdrawalRequest]):
+    def _send_partial_withdrawal_alert(self, watcher, slot: int, withdrawals: list[WithdrawalRequest]):
         alert = CommonAlert(name="HeadWatcherPartialELWithdrawalObserved", severity="critical")
         summary = "🚨 Partial withdrawal observed for our validator(s) (unsupported)"
         description = '\n\n'.join(self._describe_withdrawal(w, watcher.user_keys) for w in withdrawals)
         self._send_alert(watcher, alert, summary, description, slot, ADDITIONAL_ALERTMANAGER_LABELS)
 
     def _send_request_from_our_source_for_foreign_validators_alert(
-        self, watcher, slot: str, withdrawals: list[WithdrawalRequest]
+        self, watcher, slot: int, withdrawals: list[WithdrawalRequest]
     ):
         alert = CommonAlert(name="HeadWatcherELRequestFromOurSourceForForeignValidators", severity="critical")
         summary = "🚨️ Withdrawal request from our source address for non-user validator(s) observed"
@@ -83,7 +88,7 @@ class ElTriggeredExitHandler(WatcherHandler):
         self._send_alert(watcher, alert, summary, description, slot, ADDITIONAL_ALERTMANAGER_LABELS)
 
     def _send_request_from_unknown_source_for_our_validators_alert(
-        self, watcher, slot: str, withdrawals: list[WithdrawalRequest]
+        self, watcher, slot: int, withdrawals: list[WithdrawalRequest]
     ):
         alert = CommonAlert(name="HeadWatcherELRequestFromUnknownSourceForOurValidators", severity="info")
         summary = "⚠️ Withdrawal request from unknown source address for our validator(s) observed"
@@ -91,18 +96,18 @@ class ElTriggeredExitHandler(WatcherHandler):
         self._send_alert(watcher, alert, summary, description, slot)
 
     def _send_alert(
-        self, watcher, alert: CommonAlert, summary: str, description: str, slot: str, additional_labels=None
+        self, watcher, alert: CommonAlert, summary: str, description: str, slot: int, additional_labels=None
     ):
         description += f'\n\nSlot: {beaconchain(slot)}'
         self.send_alert(watcher, alert.build_body(summary, description, additional_labels))
 
     @staticmethod
     def _is_full(withdrawal: WithdrawalRequest) -> bool:
-        return int(withdrawal.amount) == 0
+        return withdrawal.amount == 0
 
     @staticmethod
     def _is_partial(withdrawal: WithdrawalRequest) -> bool:
-        return int(withdrawal.amount) > 0
+        return withdrawal.amount > 0
 
     @staticmethod
     def _describe_withdrawal(withdrawal: WithdrawalRequest, user_keys: dict[str, NamedKey]) -> str:
@@ -1,34 +1,30 @@
 import logging
+import threading
+import time
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Literal, Optional
+from typing import Any, Literal, Optional
 
-from eth_abi import decode
 from unsync import unsync
-from web3 import Web3
 
-from src import variables
 from src.alerts.common import CommonAlert
+from src.constants import SECONDS_PER_SLOT
 from src.handlers.handler import WatcherHandler
-from src.keys_source.base_source import SourceType
-from src.metrics.prometheus.duration_meter import duration_meter
-from src.providers.consensus.typings import BlockDetailsResponse, FullBlockInfo
-from src.typings import BlockNumber
-from src.utils.events import get_events_in_range
-from src.utils.exit import ValidatorExitsInfo, get_last_requested_validator_exit_indexes
-from src.utils.types import bytes_to_hex_str
+from src.metrics.prometheus.duration_meter import duration_meter, head_slot_exemplar
+from src.providers.consensus.events import EventTopic
+from src.providers.consensus.typings import BlockVoluntaryExit, FullBlockInfo
+from src.typings import BlockNumber, SlotNumber, ValidatorIndex
 from src.variables import ADDITIONAL_ALERTMANAGER_LABELS, NETWORK_NAME
+from src.web3py.extensions import ContractsNotLoaded
 
 logger = logging.getLogger()
 
 Owner = Literal['user', 'other', 'unknown']
 
-BATCH_TUPLE_TYPE = '(bytes[],bytes)[]'
-
 
 @dataclass
 class ExitInfo:
-    index: str
+    index: ValidatorIndex
     owner: Owner
     pubkey: Optional[str] = None
     operator: Optional[str] = None
@@ -43,27 +39,81 @@ class ExitedOperatorValidators:
     validator_indexes: list[int]
 
 
-@dataclass(frozen=True)
-class ConsolidationBatchItem:
-    source_pubkeys: tuple[str, ...]
-    target_pubkey: str
-
-
 class ExitsHandler(WatcherHandler):
-    last_total_vebo_requests_processed = 0
-    last_requested_exit_indexes: dict[int, set[int]]
-    last_requested_consolidations: dict[int, set[ConsolidationBatchItem]]
-
     def __init__(self):
         super().__init__()
-        self.last_requested_exit_indexes = {}
-        self.last_requested_consolidations = {}
+        # Our validators whose exits were checked while in the pool. Removed when the exit is included in a block
+        self.exits_seen_in_pool: set[ValidatorIndex] = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self, watcher) -> None:
+        watcher.event_stream.subscribe(EventTopic.VOLUNTARY_EXIT, lambda e: self._on_pool_exit(watcher, e))
+
+    def tracked_state(self) -> dict[str, Any]:
+        return {
+            **super().tracked_state(),
+            'exits_seen_in_pool': self.exits_seen_in_pool,
+        }
 
     @unsync
-    @duration_meter()
+    @duration_meter(head_slot_exemplar)
     def handle(self, watcher, head: FullBlockInfo):
+        exits = self._classify(watcher, head.message.body.voluntary_exits)
+
+        if not exits:
+            logger.debug({'msg': f'No exits in block [{head.message.slot}]'})
+        else:
+            logger.info({'msg': f'Exits in block [{head.message.slot}]: {len(exits)}'})
+            self._send_alerts(watcher, head, exits)
+
+        if watcher.event_stream.disconnected:
+            try:
+                pool_exits = watcher.consensus.get_pool_voluntary_exits()
+            except Exception as e:  # pylint: disable=broad-except
+                # Pool check is an early warning only, exits are alerted anyway when included in a block
+                logger.warning({'msg': 'Can not get voluntary exits from the pool', 'exception': str(e)})
+                return
+            in_block = {e.index for e in exits}
+            pool_exits = [e for e in pool_exits if e.message.validator_index not in in_block]
+            self._process_pool_exits(
+                watcher, head.message.slot, head.message.body.execution_payload.block_number, pool_exits
+            )
+
+    @unsync
+    def _on_pool_exit(self, watcher, voluntary_exit: BlockVoluntaryExit):
+        # Run outside of the events stream thread, EL requests could take a while
+        try:
+            if (last_header := watcher.handled_headers.last) is None:
+                return
+            slot = SlotNumber(int((time.time() - watcher.genesis_time) / SECONDS_PER_SLOT))
+            self._process_pool_exits(watcher, slot, last_header.block_number, [voluntary_exit])
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error({'msg': 'Error while handling voluntary exit from the pool', 'exception': str(e)})
+
+    def _process_pool_exits(
+        self, watcher, slot: SlotNumber, block_number: BlockNumber, voluntary_exits: list[BlockVoluntaryExit]
+    ) -> None:
+        """Check exits of our validators before they are included, the block alert is skipped for them later"""
+        user_exits = [e for e in self._classify(watcher, voluntary_exits) if e.owner == 'user']
+        with self._lock:
+            user_exits = [e for e in user_exits if e.index not in self.exits_seen_in_pool]
+            self.exits_seen_in_pool.update(e.index for e in user_exits)
+        if not user_exits:
+            return
+        logger.info({'msg': f'Exits of our validators in the pool at slot [{slot}]: {len(user_exits)}'})
+        location = f'\n\nseen in the pool at slot: [{slot}](https://{NETWORK_NAME}.beaconcha.in/slot/{slot})'
+        try:
+            self._send_user_alerts(watcher, block_number, user_exits, location, in_pool=True)
+        except Exception:
+            # Exits are not checked, so they are alerted when included in a block
+            with self._lock:
+                self.exits_seen_in_pool.difference_update(e.index for e in user_exits)
+            raise
+
+    @staticmethod
+    def _classify(watcher, voluntary_exits: list[BlockVoluntaryExit]) -> list[ExitInfo]:
         exits = []
-        for voluntary_exit in head.message.body.voluntary_exits:
+        for voluntary_exit in voluntary_exits:
             validator_index = voluntary_exit.message.validator_index
             validator_key = watcher.indexed_validators_keys.get(validator_index)
             if validator_key is None:
@@ -88,99 +138,20 @@ class ExitsHandler(WatcherHandler):
                             owner='other',
                         )
                     )
-
-        if not exits:
-            logger.debug({'msg': f'No exits in block [{head.message.slot}]'})
-        else:
-            logger.info({'msg': f'Exits in block [{head.message.slot}]: {len(exits)}'})
-            self._send_alerts(watcher, head, exits)
+        return exits
 
     def _send_alerts(self, watcher, block: FullBlockInfo, exits):
         user_exits = [s for s in exits if s.owner == 'user']
         unknown_exits = [s for s in exits if s.owner == 'unknown']
+        with self._lock:
+            # Exits that were already checked in the pool, exit is included only once, so forget them
+            alerted_in_pool = {e.index for e in user_exits} & self.exits_seen_in_pool
+            self.exits_seen_in_pool -= alerted_in_pool
+        user_exits = [e for e in user_exits if e.index not in alerted_in_pool]
+        slot = block.message.slot
+        location = f'\n\nslot: [{slot}](https://{NETWORK_NAME}.beaconcha.in/slot/{slot})'
         if user_exits:
-            if variables.KEYS_SOURCE == SourceType.KEYS_API.value:
-                self._update_last_requested_exit_indexes(watcher, block)
-                self._update_last_consolidations(watcher, block)
-
-            all_expected = set().union(*self.last_requested_exit_indexes.values())
-            all_consolidation_pubkeys = set().union(
-                *(
-                    {item.target_pubkey, *item.source_pubkeys}
-                    for batch_items in self.last_requested_consolidations.values()
-                    for item in batch_items
-                )
-            )
-
-            by_operator_exits: defaultdict[tuple[int, int], ExitedOperatorValidators] = defaultdict(
-                lambda: ExitedOperatorValidators(module=0, operator='', validator_indexes=[])
-            )
-            by_operator_consolidations: defaultdict[tuple[int, int], ExitedOperatorValidators] = defaultdict(
-                lambda: ExitedOperatorValidators(module=0, operator='', validator_indexes=[])
-            )
-
-            for user_exit in user_exits:
-                key = (int(user_exit.module_index), int(user_exit.operator_index))
-
-                if user_exit.pubkey in all_consolidation_pubkeys:
-                    by_operator_consolidations[key].module = int(user_exit.module_index)
-                    by_operator_consolidations[key].operator = user_exit.operator
-                    by_operator_consolidations[key].validator_indexes.append(int(user_exit.index))
-
-                if (
-                    int(user_exit.index) not in all_expected
-                    and str(user_exit.module_index) not in watcher.disable_unexpected_exit_alerts
-                ):
-                    by_operator_exits[key].module = int(user_exit.module_index)
-                    by_operator_exits[key].operator = user_exit.operator
-                    by_operator_exits[key].validator_indexes.append(int(user_exit.index))
-
-            if by_operator_exits:
-                total_exits = 0
-                description = ''
-
-                for operator_exits in by_operator_exits.values():
-                    total_exits += len(operator_exits.validator_indexes)
-                    description += f'\n{operator_exits.module}#{operator_exits.operator} - '
-                    description += (
-                        "["
-                        + ', '.join(
-                            [
-                                f'[{validator_index}](http://{NETWORK_NAME}.beaconcha.in/validator/{validator_index})'
-                                for validator_index in operator_exits.validator_indexes
-                            ]
-                        )
-                        + "]"
-                    )
-                description += (
-                    f'\n\nslot: [{block.message.slot}](https://{NETWORK_NAME}.beaconcha.in/slot/{block.message.slot})'
-                )
-                alert = CommonAlert(name="HeadWatcherUserUnexpectedExit", severity="critical")
-                summary = f'🚨🚨🚨 {total_exits} Our validators were unexpectedly exited! 🚨🚨🚨'
-                self.send_alert(watcher, alert.build_body(summary, description, ADDITIONAL_ALERTMANAGER_LABELS))
-
-            if by_operator_consolidations:
-                description = ''
-                for operator_exits in by_operator_consolidations.values():
-                    description += f'\n{operator_exits.module}#{operator_exits.operator} - '
-                    description += (
-                        "["
-                        + ', '.join(
-                            [
-                                f'[{validator_index}](http://{NETWORK_NAME}.beaconcha.in/validator/{validator_index})'
-                                for validator_index in operator_exits.validator_indexes
-                            ]
-                        )
-                        + "]"
-                    )
-                description += (
-                    f'\n\nslot: [{block.message.slot}](https://{NETWORK_NAME}.beaconcha.in/slot/{block.message.slot})'
-                )
-                alert = CommonAlert(name="HeadWatcherUserExitForRequestedConsolidation", severity="critical")
-                summary = (
-                    "🚨🚨🚨 Voluntary exit of validators for which consolidation was requested in ConsolidationBus"
-                )
-                self.send_alert(watcher, alert.build_body(summary, description, ADDITIONAL_ALERTMANAGER_LABELS))
+            self._send_user_alerts(watcher, block.message.body.execution_payload.block_number, user_exits, location)
 
         if unknown_exits:
             summary = f'🚨 {len(unknown_exits)} unknown validators were exited!'
@@ -194,74 +165,95 @@ class ExitsHandler(WatcherHandler):
                 )
                 + "]"
             )
-            description += (
-                f'\n\nslot: [{block.message.slot}](https://{NETWORK_NAME}.beaconcha.in/slot/{block.message.slot})'
-            )
+            description += location
             alert = CommonAlert(name="HeadWatcherUnknownExit", severity="critical")
             self.send_alert(watcher, alert.build_body(summary, description, ADDITIONAL_ALERTMANAGER_LABELS))
 
-    @duration_meter()
-    def _update_last_requested_exit_indexes(self, watcher, block: BlockDetailsResponse) -> None:
-        """Update local cache with last validator indexes requested to exit by VEBO"""
-
-        # pylint: disable=duplicate-code
-        exits_info = ValidatorExitsInfo(
-            last_total_requests_processed=self.last_total_vebo_requests_processed,
-            last_requested_exit_indexes=self.last_requested_exit_indexes,
-        )
-
-        updated_exits_info = get_last_requested_validator_exit_indexes(watcher, block, exits_info)
-
-        self.last_total_vebo_requests_processed = updated_exits_info.last_total_requests_processed
-        self.last_requested_exit_indexes = updated_exits_info.last_requested_exit_indexes
-
-    @duration_meter()
-    def _update_last_consolidations(self, watcher, block: BlockDetailsResponse) -> None:
-        """Update local cache with information about last validator consolidations in ConsolidationBus"""
-        if not watcher.keys_source.modules_operators_dict:
-            return
-
-        if not watcher.execution.lido_contracts.consolidation_bus:
-            return
-
-        current_block_number = int(block.message.body.execution_payload.block_number)
-
-        logger.info({'msg': 'Getting last validator consolidations from ConsolidationBus'})
+    def _send_user_alerts(
+        self, watcher, block_number: BlockNumber, user_exits: list, location: str, in_pool: bool = False
+    ):
+        # Indexes are kept up to date by the watcher in background, so these calls are noop in most cases
+        try:
+            watcher.exit_requests.update(watcher, block_number)
+            watcher.consolidation_requests.update(watcher, block_number)
+            all_expected = watcher.exit_requests.indexes
+            verified = True
+        except ContractsNotLoaded as e:
+            # Requested exits are unknown yet, all the exits are alerted so unexpected ones are not lost
+            logger.warning(
+                {'msg': 'Exits of our validators are not checked against VEBO requests', 'exception': str(e)}
+            )
+            all_expected = set()
+            verified = False
+        all_consolidation_pubkeys = watcher.consolidation_requests.pubkeys
 
-        lookup_window = Web3.to_int(
-            watcher.execution.lido_contracts.oracle_daemon_config.functions.get(
-                'EXIT_EVENTS_LOOKBACK_WINDOW_IN_SLOTS'
-            ).call(block_identifier=current_block_number)
+        by_operator_exits: defaultdict[tuple[int, int], ExitedOperatorValidators] = defaultdict(
+            lambda: ExitedOperatorValidators(module=0, operator='', validator_indexes=[])
         )
-
-        last_cached_block = -1
-        if self.last_requested_consolidations:
-            last_cached_block = max(self.last_requested_consolidations)
-
-        l_block = max(last_cached_block + 1, current_block_number - lookup_window)
-
-        events = get_events_in_range(
-            watcher.execution.lido_contracts.consolidation_bus.events.RequestsAdded,
-            l_block=BlockNumber(l_block),
-            r_block=BlockNumber(current_block_number),
+        by_operator_consolidations: defaultdict[tuple[int, int], ExitedOperatorValidators] = defaultdict(
+            lambda: ExitedOperatorValidators(module=0, operator='', validator_indexes=[])
         )
 
-        for event in events:
-            if event['blockNumber'] not in self.last_requested_consolidations:
-                self.last_requested_consolidations[event['blockNumber']] = set()
-
-            consolidation_group = decode([BATCH_TUPLE_TYPE], event['args']['batchData'])[0]
-
-            for batch in consolidation_group:
-                source_pubkeys = tuple(bytes_to_hex_str(pubkey) for pubkey in batch[0])
-                target_pubkey = bytes_to_hex_str(batch[1])
-                self.last_requested_consolidations[event['blockNumber']].add(
-                    ConsolidationBatchItem(
-                        source_pubkeys=source_pubkeys,
-                        target_pubkey=target_pubkey,
+        for user_exit in user_exits:
+            key = (int(user_exit.module_index), int(user_exit.operator_index))
+
+            if user_exit.pubkey in all_consolidation_pubkeys:
+                by_operator_consolidations[key].module = int(user_exit.module_index)
+                by_operator_consolidations[key].operator = user_exit.operator
+                by_operator_consolidations[key].validator_indexes.append(user_exit.index)
+
+            if (
+                user_exit.index not in all_expected
+                and str(user_exit.module_index) not in watcher.disable_unexpected_exit_alerts
+            ):
+                by_operator_exits[key].module = int(user_exit.module_index)
+                by_operator_exits[key].operator = user_exit.operator
+                by_operator_exits[key].validator_indexes.append(user_exit.index)
+
+        if by_operator_exits:
+            total_exits = 0
+            description = ''
+
+            for operator_exits in by_operator_exits.values():
+                total_exits += len(operator_exits.validator_indexes)
+                description += f'\n{operator_exits.module}#{operator_exits.operator} - '
+                description += (
+                    "["
+                    + ', '.join(
+                        [
+                            f'[{validator_index}](http://{NETWORK_NAME}.beaconcha.in/validator/{validator_index})'
+                            for validator_index in operator_exits.validator_indexes
+                        ]
                     )
+                    + "]"
                 )
+            description += location
+            if not verified:
+                description += '\n\nNot checked against VEBO exit requests: Lido contracts are not loaded yet'
+            if in_pool:
+                alert = CommonAlert(name="HeadWatcherUserUnexpectedExitInPool", severity="critical")
+                summary = f'🚨🚨🚨 {total_exits} Our validators are unexpectedly exiting! Not included yet 🚨🚨🚨'
+            else:
+                alert = CommonAlert(name="HeadWatcherUserUnexpectedExit", severity="critical")
+                summary = f'🚨🚨🚨 {total_exits} Our validators were unexpectedly exited! 🚨🚨🚨'
+            self.send_alert(watcher, alert.build_body(summary, description, ADDITIONAL_ALERTMANAGER_LABELS))
 
-        for cached_block in list(self.last_requested_consolidations.keys()):
-            if cached_block < current_block_number - lookup_window:
-                del self.last_requested_consolidations[cached_block]
+        if by_operator_consolidations:
+            description = ''
+            for operator_exits in by_operator_consolidations.values():
+                description += f'\n{operator_exits.module}#{operator_exits.operator} - '
+                description += (
+                    "["
+                    + ', '.join(
+                        [
+                            f'[{validator_index}](http://{NETWORK_NAME}.beaconcha.in/validator/{validator_index})'
+                            for validator_index in operator_exits.validator_indexes
+                        ]
+                    )
+                    + "]"
+                )
+            description += location
+            name = "HeadWatcherUserExitForRequestedConsolidation" + ("InPool" if in_pool else "")
+            alert = CommonAlert(name=name, severity="critical")
+            summary = "🚨🚨🚨 Voluntary exit of validators for which consolidation was requested in ConsolidationBus"
+            self.send_alert(watcher, alert.build_body(summary, description, ADDITIONAL_ALERTMANAGER_LABELS))
@@ -0,0 +1,76 @@
+import logging
+
+from unsync import unsync
+
+from src.alerts.common import CommonAlert
+from src.constants import SLOTS_PER_EPOCH
+from src.handlers.handler import WatcherHandler
+from src.metrics.prometheus.duration_meter import duration_meter, head_slot_exemplar
+from src.metrics.prometheus.watcher import FINALITY_LAG, FINALIZED_EPOCH
+from src.providers.consensus.events import EventTopic
+from src.providers.consensus.typings import FinalizedCheckpointEvent, FullBlockInfo
+from src.typings import EpochNumber
+from src.variables import FINALITY_LAG_ALERT_THRESHOLD_IN_EPOCHS, NETWORK_NAME
+
+logger = logging.getLogger()
+
+
+class FinalityHandler(WatcherHandler):
+    """
+    Finalized epoch comes from `finalized_checkpoint` events.
+    Without events the finality checkpoints of the head state are requested, but only once per epoch.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.finalized_epoch: EpochNumber | None = None
+        self.requested_epoch: EpochNumber | None = None
+        self.alerted_finalized_epoch: EpochNumber | None = None
+
+    def subscribe(self, watcher) -> None:
+        watcher.event_stream.subscribe(EventTopic.FINALIZED_CHECKPOINT, self._on_finalized_checkpoint)
+
+    def _on_finalized_checkpoint(self, event: FinalizedCheckpointEvent) -> None:
+        self._set_finalized_epoch(event.epoch)
+
+    @unsync
+    @duration_meter(head_slot_exemplar)
+    def handle(self, watcher, head: FullBlockInfo):
+        epoch = EpochNumber(head.message.slot // SLOTS_PER_EPOCH)
+        if self.requested_epoch != epoch and (self.finalized_epoch is None or watcher.event_stream.disconnected):
+            try:
+                checkpoints = watcher.consensus.get_finality_checkpoints(head.message.slot)
+            except Exception as e:  # pylint: disable=broad-except
+                # Requested again with the next head
+                logger.warning({'msg': 'Can not get finality checkpoints', 'exception': str(e)})
+            else:
+                self.requested_epoch = epoch
+                self._set_finalized_epoch(checkpoints.finalized.epoch)
+
+        if self.finalized_epoch is None:
+            return
+
+        lag = epoch - self.finalized_epoch
+        FINALITY_LAG.set(lag)
+        if lag <= FINALITY_LAG_ALERT_THRESHOLD_IN_EPOCHS:
+            return
+        logger.warning({'msg': f'Finality lag is {lag} epochs', 'finalized_epoch': self.finalized_epoch})
+        if self.alerted_finalized_epoch != self.finalized_epoch:
+            self._send_lag_alert(watcher, epoch, lag)
+            self.alerted_finalized_epoch = self.finalized_epoch
+
+    def _set_finalized_epoch(self, epoch: EpochNumber) -> None:
+        # Event and the head state could be received in any order, finality never goes back
+        if self.finalized_epoch is None or epoch > self.finalized_epoch:
+            self.finalized_epoch = epoch
+            FINALIZED_EPOCH.set(epoch)
+
+    def _send_lag_alert(self, watcher, epoch: EpochNumber, lag: int):
+        alert = CommonAlert(name="HeadWatcherFinalityLag", severity="critical")
+        summary = f'⏳ Chain is not finalized for {lag} epochs'
+        finalized = self.finalized_epoch
+        description = (
+            f'Last finalized epoch: [{finalized}](https://{NETWORK_NAME}.beaconcha.in/epoch/{finalized})\n'
+            f'Head epoch: [{epoch}](https://{NETWORK_NAME}.beaconcha.in/epoch/{epoch})'
+        )
+        self.send_alert(watcher, alert.build_body(summary, description))
@@ -1,12 +1,20 @@
+import logging
 from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any
 
 from unsync import unsync
 
 from src.providers.alertmanager.typings import AlertBody
 from src.providers.consensus.typings import FullBlockInfo
+from src.web3py.extensions import ContractsNotLoaded
+
+logger = logging.getLogger()
 
 # Enough count for different handlers to store in memory
 KEEP_MAX_SENT_ALERTS = 10
+# Blocks waiting for Lido contracts, contracts are not loaded while EL is unavailable
+KEEP_MAX_DEFERRED_BLOCKS = 256
 
 
 class WatcherHandler(ABC):
@@ -24,6 +32,16 @@ class WatcherHandler(ABC):
         """
         pass  # pylint: disable=unnecessary-pass
 
+    def subscribe(self, watcher) -> None:
+        """
+        Implement this method to receive consensus client events, e.g. `watcher.event_stream.subscribe(...)`.
+        It is called once when the watcher is created.
+        """
+
+    def tracked_state(self) -> dict[str, Any]:
+        """In-memory state of handler to report its size. Extend it if handler keeps something else"""
+        return {'sent_alerts': self.sent_alerts}
+
     def alert_is_sent(self, current: AlertBody):
         # todo: make it better. every annotation can be unique
         return str(current.annotations) in [str(s.annotations) for s in self.sent_alerts]
@@ -31,6 +49,49 @@ class WatcherHandler(ABC):
     def send_alert(self, watcher, alert: AlertBody):
         if not self.alert_is_sent(alert):
             watcher.alertmanager.send_alerts([alert])
+            if watcher.slot_timer:
+                watcher.slot_timer.mark('alert_sent', self.__class__.__name__)
             self.sent_alerts.append(alert)
             if len(self.sent_alerts) > KEEP_MAX_SENT_ALERTS:
                 self.sent_alerts.pop(0)
+
+
+class LidoContractsHandler(WatcherHandler):
+    """
+    Handler of blocks that need Lido contracts. Blocks that come before the contracts are loaded
+    are kept and handled in order on the next heads, so their alerts are not lost
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.deferred_blocks: deque[FullBlockInfo] = deque()
+
+    def tracked_state(self) -> dict[str, Any]:
+        return {**super().tracked_state(), 'deferred_blocks': self.deferred_blocks}
+
+    @abstractmethod
+    def handle_block(self, watcher, block: FullBlockInfo) -> None:
+        """Implement this method to handle the block. It is deferred if `ContractsNotLoaded` is raised"""
+
+    def handle_in_order(self, watcher, head: FullBlockInfo | None) -> None:
+        """Handle deferred blocks and then the head. Pass None if the head has nothing to handle"""
+        if head is not None:
+            if len(self.deferred_blocks) >= KEEP_MAX_DEFERRED_BLOCKS:
+                dropped = self.deferred_blocks.popleft()
+                logger.error({'msg': f'Too many deferred blocks, block [{dropped.message.slot}] is not handled'})
+            self.deferred_blocks.append(head)
+
+        while self.deferred_blocks:
+            block = self.deferred_blocks.popleft()
+            try:
+                self.handle_block(watcher, block)
+            except ContractsNotLoaded as e:
+                self.deferred_blocks.appendleft(block)
+                logger.warning(
+                    {
+                        'msg': f'Block [{block.message.slot}] is deferred until Lido contracts are loaded',
+                        'deferred_blocks': len(self.deferred_blocks),
+                        'exception': str(e),
+                    }
+                )
+                return
@@ -0,0 +1,80 @@
+import logging
+import threading
+import time
+from typing import Any
+
+from unsync import unsync
+
+from src.alerts.common import CommonAlert
+from src.constants import SECONDS_PER_SLOT
+from src.handlers.slashing import Duty, SlashingHandler, SlashingInfo
+from src.metrics.prometheus.duration_meter import duration_meter, head_slot_exemplar
+from src.providers.consensus.events import EventTopic
+from src.providers.consensus.typings import FullBlockInfo
+from src.typings import SlotNumber, ValidatorIndex
+from src.variables import ADDITIONAL_ALERTMANAGER_LABELS, NETWORK_NAME
+
+logger = logging.getLogger()
+
+
+class PoolSlashingHandler(SlashingHandler):
+    """
+    Alert about slashings of our validators as soon as they get into the operations pool,
+    that is several slots earlier than SlashingHandler finds them in a block.
+    Slashings are received from the events stream. The pool is polled on every head while the stream is down.
+    """
+
+    def __init__(self):
+        super().__init__()
+        # Validator can be slashed only once, so it is enough to remember validators we have alerted about
+        self.seen_slashings: set[tuple[Duty, ValidatorIndex]] = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self, watcher) -> None:
+        watcher.event_stream.subscribe(EventTopic.PROPOSER_SLASHING, lambda s: self._on_event(watcher, [s], []))
+        watcher.event_stream.subscribe(EventTopic.ATTESTER_SLASHING, lambda s: self._on_event(watcher, [], [s]))
+
+    def tracked_state(self) -> dict[str, Any]:
+        return {**super().tracked_state(), 'seen_slashings': self.seen_slashings}
+
+    @unsync
+    @duration_meter(head_slot_exemplar)
+    def handle(self, watcher, head: FullBlockInfo):
+        if not watcher.event_stream.disconnected:
+            return
+        try:
+            proposer_slashings = watcher.consensus.get_pool_proposer_slashings()
+            attester_slashings = watcher.consensus.get_pool_attester_slashings()
+        except Exception as e:  # pylint: disable=broad-except
+            # Pool check is an early warning only, slashings are alerted anyway when included in a block
+            logger.warning({'msg': 'Can not get slashings from the pool', 'exception': str(e)})
+            return
+        self._process(watcher, head.message.slot, proposer_slashings, attester_slashings)
+
+    @unsync
+    def _on_event(self, watcher, proposer_slashings: list[dict], attester_slashings: list[dict]):
+        # Run outside of the events stream thread, so sending the alert does not delay next events
+        try:
+            slot = SlotNumber(int((time.time() - watcher.genesis_time) / SECONDS_PER_SLOT))
+            self._process(watcher, slot, proposer_slashings, attester_slashings)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error({'msg': 'Error while handling slashing from the pool', 'exception': str(e)})
+
+    def _process(self, watcher, slot: SlotNumber, proposer_slashings: list[dict], attester_slashings: list[dict]):
+        slashings = self._classify(watcher, proposer_slashings, attester_slashings)
+        with self._lock:
+            user_slashings = [
+                s for s in slashings if s.owner == 'user' and (s.duty, s.index) not in self.seen_slashings
+            ]
+            self.seen_slashings.update((s.duty, s.index) for s in user_slashings)
+        if not user_slashings:
+            return
+        logger.info({'msg': f'Slashings of our validators in the pool at slot [{slot}]: {len(user_slashings)}'})
+        self._send_pool_alert(watcher, slot, user_slashings)
+
+    def _send_pool_alert(self, watcher, slot: SlotNumber, user_slashings: list[SlashingInfo]):
+        summary = f'🚨🚨🚨 {len(user_slashings)} Our validators are being slashed! Not included in a block yet 🚨🚨🚨'
+        description = self._describe_user_slashings(user_slashings)
+        description += f'\n\nseen in the pool at slot: [{slot}](https://{NETWORK_NAME}.beaconcha.in/slot/{slot})'
+        alert = CommonAlert(name="HeadWatcherUserSlashingInPool", severity="critical")
+        self.send_alert(watcher, alert.build_body(summary, description, ADDITIONAL_ALERTMANAGER_LABELS))
@@ -1,11 +1,12 @@
 from prometheus_client import start_http_server
-from web3.middleware import simple_cache_middleware
 
 from src import variables
 from src.handlers.consolidation import ConsolidationHandler
 from src.handlers.el_triggered_exit import ElTriggeredExitHandler
 from src.handlers.exit import ExitsHandler
+from src.handlers.finality import FinalityHandler
 from src.handlers.fork import ForkHandler
+from src.handlers.pool_slashing import PoolSlashingHandler
 from src.handlers.slashing import SlashingHandler
 from src.keys_source.base_source import SourceType
 from src.keys_source.file_source import FileSource
@@ -16,7 +17,7 @@ from src.metrics.prometheus.basic import BUILD_INFO
 from src.utils.build import get_build_info
 from src.watcher import Watcher
 from src.web3py.extensions import FallbackProviderModule, LidoContracts
-from src.web3py.middleware import metrics_collector
+from src.web3py.middleware import el_cache, metrics_collector
 from src.web3py.typings import Web3
 
 logger = logging.getLogger()
@@ -46,7 +47,7 @@ def main():
             }
         )
         web3.middleware_onion.add(metrics_collector)
-        web3.middleware_onion.add(simple_cache_middleware)
+        web3.middleware_onion.add(el_cache)
     elif variables.KEYS_SOURCE == SourceType.FILE.value:
         keys_source = FileSource()
         web3 = None
@@ -59,9 +60,10 @@ def main():
 
     handlers = [
         SlashingHandler(),
+        PoolSlashingHandler(),
         ForkHandler(),
         ExitsHandler(),
-        # FinalityHandler(), ???
+        FinalityHandler(),
         ConsolidationHandler(),
         ElTriggeredExitHandler(),
     ]
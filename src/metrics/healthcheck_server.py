@@ -1,10 +1,18 @@
+import json
 import threading
 from datetime import datetime, timedelta
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
 
 import requests
 
 from src import variables
+from src.metrics.profiler import (
+    ProfilerIsBusy,
+    sample_stacks,
+    to_collapsed,
+    to_speedscope,
+)
 from src.variables import MAX_CYCLE_LIFETIME_IN_SECONDS
 
 _last_pulse = datetime.now()
@@ -21,6 +29,10 @@ class PulseRequestHandler(SimpleHTTPRequestHandler):
     def do_GET(self):
         global _last_pulse
 
+        if variables.PROFILER_ENABLED and urlparse(self.path).path == '/profile/':
+            self._profile()
+            return
+
         if self.path == '/pulse/':
             _last_pulse = datetime.now()
 
@@ -33,6 +45,52 @@ class PulseRequestHandler(SimpleHTTPRequestHandler):
             self.end_headers()
             self.wfile.write(b'{"metrics": "ok", "reason": "ok"}\n')
 
+    def _profile(self):
+        """
+        Sampling profile of all threads.
+        Query params:
+        seconds - profile duration, limited by PROFILER_MAX_DURATION_IN_SECONDS. Default: 10
+        interval - sampling interval in seconds. Default: 0.01
+        format - `collapsed` (flamegraph.pl compatible) or `speedscope` (JSON). Default: collapsed
+        """
+        query = parse_qs(urlparse(self.path).query)
+        try:
+            seconds = min(float(query.get('seconds', ['10'])[0]), variables.PROFILER_MAX_DURATION_IN_SECONDS)
+            interval = max(float(query.get('interval', ['0.01'])[0]), 0.001)
+        except ValueError:
+            self.send_response(400)
+            self.end_headers()
+            self.wfile.write(b'{"reason": "seconds and interval must be numbers"}\n')
+            return
+        output_format = query.get('format', ['collapsed'])[0]
+        if output_format not in ('collapsed', 'speedscope'):
+            self.send_response(400)
+            self.end_headers()
+            self.wfile.write(b'{"reason": "format must be collapsed or speedscope"}\n')
+            return
+
+        try:
+            stacks = sample_stacks(seconds, interval)
+        except ProfilerIsBusy:
+            self.send_response(409)
+            self.end_headers()
+            self.wfile.write(b'{"reason": "another profile is in progress"}\n')
+            return
+
+        if output_format == 'speedscope':
+            name = f'ethereum-head-watcher {datetime.now().isoformat()}'
+            body = json.dumps(to_speedscope(stacks, interval, name)).encode()
+            content_type = 'application/json'
+        else:
+            body = to_collapsed(stacks).encode()
+            content_type = 'text/plain'
+
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
     def log_request(self, *args, **kwargs):
         # Disable non-error logs
         pass
@@ -44,6 +102,9 @@ def start_pulse_server():
     If bot didn't call pulse for a while (5 minutes but should be changed individually)
     healthcheck in docker returns 1 and bot will be restarted
     """
-    server = HTTPServer(('localhost', variables.HEALTHCHECK_SERVER_PORT), RequestHandlerClass=PulseRequestHandler)
+    # Threading server, so a long profile request doesn't block Docker healthcheck
+    server = ThreadingHTTPServer(
+        ('localhost', variables.HEALTHCHECK_SERVER_PORT), RequestHandlerClass=PulseRequestHandler
+    )
     thread = threading.Thread(target=server.serve_forever, daemon=True)
     thread.start()
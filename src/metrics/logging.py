@@ -1,17 +1,39 @@
+import atexit
 import json
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable
 
-from src.variables import LOG_LEVEL
+from src.variables import LOG_LEVEL, LOG_QUEUE_MAX_SIZE
+
+# `default=str` keeps the record instead of failing on values that are not JSON serializable (exceptions, bytes)
+_encoder = json.JSONEncoder(default=str)
+
+
+class Lazy:
+    """
+    Log message value that is evaluated only when the record is formatted (in the logging thread).
+    Example: logger.debug({'msg': 'State', 'state': Lazy(lambda: expensive_dump(state))})
+    """
+
+    __slots__ = ('func',)
+
+    def __init__(self, func: Callable[[], Any]):
+        self.func = func
 
 
 class JsonFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
-        message = record.msg if isinstance(record.msg, dict) else {'msg': record.getMessage()}
+        if isinstance(record.msg, dict):
+            message = {k: v.func() if isinstance(v, Lazy) else v for k, v in record.msg.items()}
+        else:
+            message = {'msg': record.getMessage()}
 
         if 'value' in message:
             message['value'] = str(message['value'])
 
-        to_json_msg = json.dumps(
+        to_json_msg = _encoder.encode(
             {
                 'name': record.name,
                 'levelname': record.levelname,
@@ -25,10 +47,31 @@ class JsonFormatter(logging.Formatter):
         return to_json_msg
 
 
+class DeferredQueueHandler(QueueHandler):
+    """
+    Puts records to the queue as is. Formatting and writing are done by the listener thread,
+    so logging doesn't add latency to the caller (e.g. head handling) even if stdout consumer is slow.
+    Values of the message are encoded later, so pass copies of containers that are changed after the call
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        # Block instead of dropping records if the writer is far behind
+        self.queue.put(record)  # type: ignore[attr-defined]
+
+
 handler = logging.StreamHandler()
 handler.setFormatter(JsonFormatter())
 
+log_queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_MAX_SIZE)
+listener = QueueListener(log_queue, handler, respect_handler_level=True)
+listener.start()
+# Flush records left in the queue on exit
+atexit.register(listener.stop)
+
 logging.basicConfig(
     level=LOG_LEVEL,
-    handlers=[handler],
+    handlers=[DeferredQueueHandler(log_queue)],
 )
@@ -0,0 +1,105 @@
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import CodeType, FrameType
+
+Stack = tuple[str, tuple[CodeType, ...]]
+
+# Only one profile at a time, concurrent samplers would just skew each other
+_lock = threading.Lock()
+
+
+class ProfilerIsBusy(Exception):
+    pass
+
+
+def sample_stacks(duration: float, interval: float) -> Counter[Stack]:
+    """
+    Samples stacks of all threads (except the sampling one) every `interval` seconds during `duration` seconds.
+    Nothing runs between profiles, so there is no overhead when the profiler is idle.
+    Returns counter of (thread name, code objects from the outermost call to the innermost one).
+    """
+    if not _lock.acquire(blocking=False):  # pylint: disable=consider-using-with
+        raise ProfilerIsBusy('Another profile is in progress')
+
+    try:
+        stacks: Counter[Stack] = Counter()
+        sampler = threading.get_ident()
+        deadline = time.perf_counter() + duration
+        while time.perf_counter() < deadline:
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():  # pylint: disable=protected-access
+                if ident == sampler:
+                    continue
+                codes = []
+                current: FrameType | None = frame
+                while current is not None:
+                    codes.append(current.f_code)
+                    current = current.f_back
+                stacks[(names.get(ident, str(ident)), tuple(reversed(codes)))] += 1
+            time.sleep(interval)
+        return stacks
+    finally:
+        _lock.release()
+
+
+def _frame_name(code: CodeType) -> str:
+    return f'{code.co_name} ({_relative(code.co_filename)}:{code.co_firstlineno})'
+
+
+def _relative(path: str) -> str:
+    try:
+        return os.path.relpath(path)
+    except ValueError:
+        return path
+
+
+def to_collapsed(stacks: Counter[Stack]) -> str:
+    """Brendan Gregg's collapsed stacks format, supported by flamegraph.pl, speedscope, etc."""
+    lines = [
+        ';'.join([thread, *(_frame_name(code) for code in codes)]) + f' {count}'
+        for (thread, codes), count in stacks.most_common()
+    ]
+    return '\n'.join(lines) + '\n'
+
+
+def to_speedscope(stacks: Counter[Stack], interval: float, name: str) -> dict:
+    """Docs: https://github.com/jlfwong/speedscope/wiki/Importing-from-custom-sources"""
+    frames: list[dict] = []
+    frame_indexes: dict[CodeType, int] = {}
+    profiles: dict[str, dict] = {}
+
+    for (thread, codes), count in stacks.items():
+        sample = []
+        for code in codes:
+            if code not in frame_indexes:
+                frame_indexes[code] = len(frames)
+                frames.append({'name': code.co_name, 'file': _relative(code.co_filename), 'line': code.co_firstlineno})
+            sample.append(frame_indexes[code])
+
+        profile = profiles.setdefault(
+            thread,
+            {
+                'type': 'sampled',
+                'name': thread,
+                'unit': 'seconds',
+                'startValue': 0,
+                'endValue': 0,
+                'samples': [],
+                'weights': [],
+            },
+        )
+        profile['samples'].append(sample)
+        profile['weights'].append(count * interval)
+        profile['endValue'] += count * interval
+
+    return {
+        '$schema': 'https://www.speedscope.app/file-format-schema.json',
+        'name': name,
+        'exporter': 'ethereum-head-watcher',
+        'activeProfileIndex': 0,
+        'shared': {'frames': frames},
+        'profiles': list(profiles.values()),
+    }
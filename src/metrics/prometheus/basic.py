@@ -1,6 +1,6 @@
 from enum import Enum
 
-from prometheus_client import Histogram, Info
+from prometheus_client import Counter, Histogram, Info
 
 from src.variables import PROMETHEUS_PREFIX
 
@@ -37,6 +37,13 @@ EL_REQUESTS_DURATION = Histogram(
     namespace=PROMETHEUS_PREFIX,
 )
 
+EL_CACHE_REQUESTS = Counter(
+    'el_cache_requests',
+    'Lookups of EL responses cache',
+    ['result'],
+    namespace=PROMETHEUS_PREFIX,
+)
+
 KEYS_API_REQUESTS_DURATION = Histogram(
     'keys_api_requests_duration',
     'Duration of requests to Keys API',
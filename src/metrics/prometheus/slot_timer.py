@@ -0,0 +1,27 @@
+import time
+
+from src.constants import SECONDS_PER_SLOT
+from src.metrics.prometheus.watcher import HEAD_STAGE_DELAY
+
+
+class SlotTimer:
+    """
+    Tracks delays of head handling stages relative to the slot start.
+    Stages: header_received -> block_decoded -> handler_finished (per handler) -> handled,
+    alert_sent is marked every time a handler posts an alert.
+    """
+
+    def __init__(self, genesis_time: int, slot: int, observe: bool = True):
+        self.slot = slot
+        self.slot_start = genesis_time + slot * SECONDS_PER_SLOT
+        # Delays of old slots (e.g. `SLOTS_RANGE` processing) are meaningless for latency SLO
+        self.observe = observe
+        self.stages: dict[str, float] = {}
+
+    def mark(self, stage: str, handler: str = '') -> float:
+        delay = time.time() - self.slot_start
+        # Keep the first occurrence, e.g. the first alert sent by handler
+        self.stages.setdefault(f'{handler}.{stage}' if handler else stage, round(delay, 3))
+        if self.observe:
+            HEAD_STAGE_DELAY.labels(stage=stage, handler=handler).observe(delay)
+        return delay
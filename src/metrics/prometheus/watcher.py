@@ -1,4 +1,4 @@
-from prometheus_client import Gauge
+from prometheus_client import Gauge, Histogram
 
 from src.variables import PROMETHEUS_PREFIX
 
@@ -25,3 +25,37 @@ VALIDATORS_INDEX_SLOT_NUMBER = Gauge(
     "Validators index last updated slot number",
     namespace=PROMETHEUS_PREFIX,
 )
+
+FINALIZED_EPOCH = Gauge(
+    "finalized_epoch",
+    "Last finalized epoch",
+    namespace=PROMETHEUS_PREFIX,
+)
+
+FINALITY_LAG = Gauge(
+    "finality_lag_in_epochs",
+    "Number of epochs between the head epoch and the last finalized epoch",
+    namespace=PROMETHEUS_PREFIX,
+)
+
+HEAD_STAGE_DELAY = Histogram(
+    "head_stage_delay",
+    "Delay in seconds from the slot start to the head handling stage",
+    ["stage", "handler"],
+    namespace=PROMETHEUS_PREFIX,
+    buckets=(0.5, 1, 2, 3, 4, 5, 6, 8, 10, 12, 16, 24, 36, 48, 60, float("inf")),
+)
+
+STATE_ENTRIES = Gauge(
+    "state_entries",
+    "Number of entries in watcher in-memory state",
+    ["name"],
+    namespace=PROMETHEUS_PREFIX,
+)
+
+STATE_SIZE = Gauge(
+    "state_size",
+    "Approximate size in bytes of watcher in-memory state",
+    ["name"],
+    namespace=PROMETHEUS_PREFIX,
+)
@@ -2,6 +2,7 @@ import logging
 from dataclasses import asdict
 
 from src import variables
+from src.metrics.logging import Lazy
 from src.metrics.prometheus.basic import ALERTMANAGER_REQUESTS_DURATION
 from src.providers.alertmanager.typings import AlertBody
 from src.providers.http_provider import HTTPProvider
@@ -25,12 +26,19 @@ class AlertmanagerClient(HTTPProvider):
     ALERTS = "api/v2/alerts"
 
     def send_alerts(self, alerts: list[AlertBody]):
+        if variables.DRY_RUN:
+            # Alerts are converted only if the record is written, in the logging thread
+            logger.info(
+                {'msg': 'Dry run mode enabled. No alerts will be sent', 'alerts': Lazy(lambda: self._to_sent(alerts))}
+            )
+            return
+        to_sent = self._to_sent(alerts)
+        logger.info({'msg': f'Sending {len(alerts)} alerts', 'alerts': to_sent})
+        self.post(self.ALERTS, should_parse_json_response=False, query_body=to_sent)
+
+    @staticmethod
+    def _to_sent(alerts: list[AlertBody]) -> list[dict]:
         to_sent = [asdict(alert) for alert in alerts]
         for alert in to_sent:
             alert['labels']['network'] = NETWORK_NAME
-        if not variables.DRY_RUN:
-            logger.info({'msg': f'Sending {len(alerts)} alerts', 'alerts': to_sent})
-            self.post(self.ALERTS, should_parse_json_response=False, query_body=to_sent)
-        else:
-            logger.info({'msg': 'Dry run mode enabled. No alerts will be sent', 'alerts': to_sent})
-            return
+        return to_sent
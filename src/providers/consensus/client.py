@@ -12,12 +12,14 @@ from src.providers.consensus.typings import (
     BlockDetailsResponse,
     BlockHeaderResponseData,
     BlockRootResponse,
+    BlockVoluntaryExit,
+    FinalityCheckpoints,
     GenesisResponse,
     PendingConsolidation,
     Validator,
 )
 from src.providers.http_provider import HTTPProvider, NotOkResponse
-from src.typings import BlockRoot, Infinity, SlotNumber
+from src.typings import BlockRoot, Infinity, SlotNumber, ValidatorIndex
 from src.variables import (
     CL_REQUEST_RETRY_COUNT,
     CL_REQUEST_SLEEP_BEFORE_RETRY_IN_SECONDS,
@@ -50,9 +52,13 @@ class ConsensusClient(HTTPProvider):
     API_GET_BLOCK_DETAILS = 'eth/v2/beacon/blocks/{}'
     API_GET_VALIDATORS = 'eth/v1/beacon/states/{}/validators'
     API_GET_PENDING_CONSOLIDATIONS = 'eth/v1/beacon/states/{}/pending_consolidations'
+    API_GET_FINALITY_CHECKPOINTS = 'eth/v1/beacon/states/{}/finality_checkpoints'
     API_GET_SPEC = 'eth/v1/config/spec'
     API_GET_GENESIS = 'eth/v1/beacon/genesis'
     API_GET_EVENTS = 'eth/v1/events'
+    API_GET_POOL_ATTESTER_SLASHINGS = 'eth/v2/beacon/pool/attester_slashings'
+    API_GET_POOL_PROPOSER_SLASHINGS = 'eth/v1/beacon/pool/proposer_slashings'
+    API_GET_POOL_VOLUNTARY_EXITS = 'eth/v1/beacon/pool/voluntary_exits'
 
     def get_config_spec(self):
         """Spec: https://ethereum.github.io/beacon-APIs/#/Config/getSpec"""
@@ -162,6 +168,60 @@ class ConsensusClient(HTTPProvider):
             raise ValueError("Expected list response from getPendingConsolidations")
         return list(PendingConsolidation.from_response(**item) for item in data)
 
+    def get_finality_checkpoints(self, state_id: Union[SlotNumber, BlockRoot, LiteralState]) -> FinalityCheckpoints:
+        """Spec: https://ethereum.github.io/beacon-APIs/#/Beacon/getStateFinalityCheckpoints"""
+        data, _ = self.get(
+            self.API_GET_FINALITY_CHECKPOINTS,
+            path_params=(state_id,),
+            force_raise=self.__raise_last_missed_slot_error,
+            timeout=2.5,
+            retry_strategy=Retry(
+                total=1, backoff_factor=0.5, status_forcelist=self.HTTP_REQUEST_RETRY_STATUS_FORCELIST
+            ),
+        )
+        if not isinstance(data, dict):
+            raise ValueError("Expected mapping response from getStateFinalityCheckpoints")
+        return FinalityCheckpoints.from_response(**data)
+
+    def get_pool_attester_slashings(self) -> list[dict]:
+        """Spec: https://ethereum.github.io/beacon-APIs/#/Beacon/getPoolAttesterSlashingsV2"""
+        data, _ = self.get(
+            self.API_GET_POOL_ATTESTER_SLASHINGS,
+            timeout=2.5,
+            retry_strategy=Retry(
+                total=1, backoff_factor=0.5, status_forcelist=self.HTTP_REQUEST_RETRY_STATUS_FORCELIST
+            ),
+        )
+        if not isinstance(data, list):
+            raise ValueError("Expected list response from getPoolAttesterSlashingsV2")
+        return data
+
+    def get_pool_proposer_slashings(self) -> list[dict]:
+        """Spec: https://ethereum.github.io/beacon-APIs/#/Beacon/getPoolProposerSlashings"""
+        data, _ = self.get(
+            self.API_GET_POOL_PROPOSER_SLASHINGS,
+            timeout=2.5,
+            retry_strategy=Retry(
+                total=1, backoff_factor=0.5, status_forcelist=self.HTTP_REQUEST_RETRY_STATUS_FORCELIST
+            ),
+        )
+        if not isinstance(data, list):
+            raise ValueError("Expected list response from getPoolProposerSlashings")
+        return data
+
+    def get_pool_voluntary_exits(self) -> list[BlockVoluntaryExit]:
+        """Spec: https://ethereum.github.io/beacon-APIs/#/Beacon/getPoolVoluntaryExits"""
+        data, _ = self.get(
+            self.API_GET_POOL_VOLUNTARY_EXITS,
+            timeout=2.5,
+            retry_strategy=Retry(
+                total=1, backoff_factor=0.5, status_forcelist=self.HTTP_REQUEST_RETRY_STATUS_FORCELIST
+            ),
+        )
+        if not isinstance(data, list):
+            raise ValueError("Expected list response from getPoolVoluntaryExits")
+        return [BlockVoluntaryExit.from_response(**item) for item in data]
+
     def get_validators_stream(self, slot_number: SlotNumber | LiteralState) -> Response:
         """Spec: https://ethereum.github.io/beacon-APIs/#/Beacon/getStateValidators"""
         stream = self.get_stream(
@@ -170,20 +230,25 @@ class ConsensusClient(HTTPProvider):
         )
         return stream
 
-    def get_chain_reorg_stream(self) -> Response:
-        """Spec: https://consensys.github.io/teku/#tag/Events/operation/getEvents"""
+    def get_events_stream(self, topics: list[str], last_event_id: str | None = None) -> Response:
+        """Spec: https://ethereum.github.io/beacon-APIs/#/Events/eventstream"""
+        headers = {'Accept': 'text/event-stream'}
+        if last_event_id is not None:
+            headers['Last-Event-ID'] = last_event_id
         stream = self.get_stream(
             self.API_GET_EVENTS,
-            query_params={"topics": "chain_reorg"},
+            query_params={"topics": topics},
             timeout=Infinity,
-            headers={'Accept': 'text/event-stream'},
+            headers=headers,
         )
         return stream
 
     @staticmethod
-    def parse_validators(data: TransientStreamingJSONList, current_indexes: dict[str, str]) -> dict[str, str]:
+    def parse_validators(
+        data: TransientStreamingJSONList, current_indexes: dict[ValidatorIndex, str]
+    ) -> dict[ValidatorIndex, str]:
         for validator in data.persistent():
-            if (index := validator['index']) in current_indexes:
+            if (index := ValidatorIndex(int(validator['index']))) in current_indexes:
                 continue
             current_indexes[index] = validator['validator']['pubkey']
         return current_indexes
@@ -0,0 +1,121 @@
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from enum import StrEnum
+from typing import Any, Callable
+
+import sseclient
+
+from src.providers.consensus.client import ConsensusClient
+from src.providers.consensus.typings import (
+    BlockEvent,
+    BlockVoluntaryExit,
+    ChainReorgEvent,
+    FinalizedCheckpointEvent,
+    HeadEvent,
+)
+from src.utils.decorators import thread_as_daemon
+from src.variables import (
+    EVENTS_STREAM_MAX_RECONNECT_DELAY_IN_SECONDS,
+    EVENTS_STREAM_MIN_RECONNECT_DELAY_IN_SECONDS,
+)
+
+logger = logging.getLogger()
+
+
+class EventTopic(StrEnum):
+    # https://ethereum.github.io/beacon-APIs/#/Events/eventstream
+    HEAD = 'head'
+    BLOCK = 'block'
+    CHAIN_REORG = 'chain_reorg'
+    FINALIZED_CHECKPOINT = 'finalized_checkpoint'
+    VOLUNTARY_EXIT = 'voluntary_exit'
+    ATTESTER_SLASHING = 'attester_slashing'
+    PROPOSER_SLASHING = 'proposer_slashing'
+
+
+# Slashings are passed as raw dicts, the same way as they are stored in the block body
+EVENT_PARSERS: dict[EventTopic, Callable[[dict], Any]] = {
+    EventTopic.HEAD: lambda data: HeadEvent.from_response(**data),
+    EventTopic.BLOCK: lambda data: BlockEvent.from_response(**data),
+    EventTopic.CHAIN_REORG: lambda data: ChainReorgEvent.from_response(**data),
+    EventTopic.FINALIZED_CHECKPOINT: lambda data: FinalizedCheckpointEvent.from_response(**data),
+    EventTopic.VOLUNTARY_EXIT: lambda data: BlockVoluntaryExit.from_response(**data),
+    EventTopic.ATTESTER_SLASHING: lambda data: data,
+    EventTopic.PROPOSER_SLASHING: lambda data: data,
+}
+
+
+class EventStream:
+    """
+    All the subscribed topics are received over the one connection to the consensus client.
+    Connection is re-established with exponential backoff (hosts are tried in order)
+    and resumed from the last received event id if the node supports it.
+
+    Subscribe before `start` is called, the topics list is sent when connecting.
+    """
+
+    def __init__(self, consensus: ConsensusClient):
+        self.consensus = consensus
+        self.subscribers: dict[EventTopic, list[Callable[[Any], None]]] = defaultdict(list)
+        self.last_event_id: str | None = None
+        self.connected = threading.Event()
+        self.listener: threading.Thread | None = None
+
+    def subscribe(self, topic: EventTopic, callback: Callable[[Any], None]) -> None:
+        self.subscribers[topic].append(callback)
+
+    @property
+    def disconnected(self) -> bool:
+        """Listener is started, but there is no connection to the node right now"""
+        return self.listener is not None and not self.connected.is_set()
+
+    def start(self) -> None:
+        """Start listener thread if there are subscribers and it is not running yet"""
+        if self.subscribers and (self.listener is None or not self.listener.is_alive()):
+            self.listener = self._listen()
+
+    @thread_as_daemon
+    def _listen(self) -> None:
+        delay = EVENTS_STREAM_MIN_RECONNECT_DELAY_IN_SECONDS
+        while True:
+            try:
+                for _ in self._receive():
+                    # Connection is alive, next failure starts backoff from the beginning
+                    delay = EVENTS_STREAM_MIN_RECONNECT_DELAY_IN_SECONDS
+                logger.warning({'msg': 'Events stream is closed by the node'})
+            except Exception as e:  # pylint: disable=broad-except
+                logger.error({'msg': 'Error while listening events', 'exception': str(e)})
+            self.connected.clear()
+            time.sleep(delay)
+            delay = min(delay * 2, EVENTS_STREAM_MAX_RECONNECT_DELAY_IN_SECONDS)
+
+    def _receive(self):
+        topics = [str(topic) for topic in self.subscribers]
+        logger.info({'msg': f'Listening events: {topics}', 'last_event_id': self.last_event_id})
+        response = self.consensus.get_events_stream(topics, self.last_event_id)
+        self.connected.set()
+        # Read chunks as soon as they arrive, fixed size chunks could hold the end of the event
+        client = sseclient.SSEClient(response.iter_content(chunk_size=None))
+        for event in client.events():
+            if event.id:
+                self.last_event_id = event.id
+            self._dispatch(event.event, event.data)
+            yield
+
+    def _dispatch(self, topic: str, data: str) -> None:
+        if topic not in EVENT_PARSERS or not (callbacks := self.subscribers.get(EventTopic(topic))):
+            # Unknown topic or nobody is interested in it (e.g. the node sent a heartbeat)
+            return
+        try:
+            event = EVENT_PARSERS[EventTopic(topic)](json.loads(data))
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error({'msg': f'Can not parse [{topic}] event', 'data': data, 'exception': str(e)})
+            return
+        for callback in callbacks:
+            try:
+                callback(event)
+            except Exception as e:  # pylint: disable=broad-except
+                logger.error({'msg': f'Error while handling [{topic}] event', 'exception': str(e)})
@@ -2,7 +2,15 @@ from dataclasses import dataclass
 from enum import StrEnum
 from typing import Optional
 
-from src.typings import BlockRoot, StateRoot
+from src.typings import (
+    BlockNumber,
+    BlockRoot,
+    EpochNumber,
+    Gwei,
+    SlotNumber,
+    StateRoot,
+    ValidatorIndex,
+)
 from src.utils.dataclass import FromResponse, Nested
 
 
@@ -27,16 +35,16 @@ class BlockRootResponse(FromResponse):
     root: BlockRoot
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockHeaderMessage(Nested, FromResponse):
-    slot: str
-    proposer_index: str
+    slot: SlotNumber
+    proposer_index: ValidatorIndex
     parent_root: BlockRoot
     state_root: StateRoot
     body_root: str
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockHeader(Nested, FromResponse):
     message: BlockHeaderMessage
     signature: str
@@ -58,53 +66,53 @@ class BlockHeaderFullResponse(Nested, FromResponse):
     finalized: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockExecutionPayload(FromResponse):
-    block_number: str
+    block_number: BlockNumber
 
 
-@dataclass
+@dataclass(slots=True)
 class VoluntaryExit(FromResponse):
-    validator_index: str
+    validator_index: ValidatorIndex
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockVoluntaryExit(Nested, FromResponse):
     message: VoluntaryExit
     signature: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ConsolidationRequest(FromResponse):
     source_address: str
     source_pubkey: str
     target_pubkey: str
 
 
-@dataclass
+@dataclass(slots=True)
 class WithdrawalRequest(FromResponse):
     source_address: str
     validator_pubkey: str
-    amount: str
+    amount: Gwei
 
 
-@dataclass
+@dataclass(slots=True)
 class DepositRequest(FromResponse):
     pubkey: str
     withdrawal_credentials: str
-    amount: str
+    amount: Gwei
     signature: str
     index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionRequests(Nested, FromResponse):
     deposits: list[DepositRequest]
     withdrawals: list[WithdrawalRequest]
     consolidations: list[ConsolidationRequest]
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockBody(Nested, FromResponse):
     execution_payload: BlockExecutionPayload
     voluntary_exits: list[BlockVoluntaryExit]
@@ -113,10 +121,10 @@ class BlockBody(Nested, FromResponse):
     execution_requests: Optional[ExecutionRequests] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockMessage(Nested, FromResponse):
-    slot: str
-    proposer_index: str
+    slot: SlotNumber
+    proposer_index: ValidatorIndex
     parent_root: str
     state_root: StateRoot
     body: BlockBody
@@ -129,10 +137,10 @@ class BlockDetailsResponse(Nested, FromResponse):
     signature: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PendingConsolidation(Nested, FromResponse):
-    source_index: str
-    target_index: str
+    source_index: ValidatorIndex
+    target_index: ValidatorIndex
 
 
 @dataclass
@@ -140,15 +148,53 @@ class FullBlockInfo(BlockDetailsResponse, BlockHeaderResponseData):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class ChainReorgEvent(FromResponse):
     # https://ethereum.github.io/beacon-APIs/#/Beacon/getChainReorgEvents
-    depth: str
-    slot: str
+    depth: int
+    slot: SlotNumber
     old_head_block: BlockRoot
     new_head_block: BlockRoot
 
 
+@dataclass(slots=True)
+class Checkpoint(FromResponse):
+    epoch: EpochNumber
+    root: BlockRoot
+
+
+@dataclass(slots=True)
+class FinalityCheckpoints(Nested, FromResponse):
+    # https://ethereum.github.io/beacon-APIs/#/Beacon/getStateFinalityCheckpoints
+    previous_justified: Checkpoint
+    current_justified: Checkpoint
+    finalized: Checkpoint
+
+
+@dataclass(slots=True)
+class HeadEvent(FromResponse):
+    # https://ethereum.github.io/beacon-APIs/#/Events/eventstream
+    slot: SlotNumber
+    block: BlockRoot
+    state: StateRoot
+    epoch_transition: bool
+
+
+@dataclass(slots=True)
+class BlockEvent(FromResponse):
+    # https://ethereum.github.io/beacon-APIs/#/Events/eventstream
+    slot: SlotNumber
+    block: BlockRoot
+
+
+@dataclass(slots=True)
+class FinalizedCheckpointEvent(FromResponse):
+    # https://ethereum.github.io/beacon-APIs/#/Events/eventstream
+    block: BlockRoot
+    state: StateRoot
+    epoch: EpochNumber
+
+
 class ValidatorStatus(StrEnum):
     PENDING_INITIALIZED = 'pending_initialized'
     PENDING_QUEUED = 'pending_queued'
@@ -164,22 +210,21 @@ class ValidatorStatus(StrEnum):
     WITHDRAWAL_DONE = 'withdrawal_done'
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidatorState(FromResponse):
-    # All uint variables presents in str
     pubkey: str
     withdrawal_credentials: str
-    effective_balance: str
+    effective_balance: Gwei
     slashed: bool
-    activation_eligibility_epoch: str
-    activation_epoch: str
-    exit_epoch: str
-    withdrawable_epoch: str
+    activation_eligibility_epoch: EpochNumber
+    activation_epoch: EpochNumber
+    exit_epoch: EpochNumber
+    withdrawable_epoch: EpochNumber
 
 
-@dataclass
+@dataclass(slots=True)
 class Validator(Nested, FromResponse):
-    index: str
-    balance: str
+    index: ValidatorIndex
+    balance: Gwei
     status: ValidatorStatus
     validator: ValidatorState
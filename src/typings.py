@@ -3,6 +3,7 @@ from typing import NewType
 EpochNumber = NewType('EpochNumber', int)
 SlotNumber = NewType('SlotNumber', int)
 BlockNumber = NewType('BlockNumber', int)
+ValidatorIndex = NewType('ValidatorIndex', int)
 BlockRoot = NewType('BlockRoot', str)
 StateRoot = NewType('StateRoot', str)
 
@@ -0,0 +1,28 @@
+import queue
+from typing import Generic, TypeVar
+
+T = TypeVar('T')
+
+
+class EventChannel(Generic[T]):
+    """
+    Thread-safe FIFO between a producer thread (e.g. SSE listener) and a consumer (e.g. handler).
+    Consumer takes everything that has been put so far in one call.
+    """
+
+    def __init__(self):
+        self._queue: queue.SimpleQueue[T] = queue.SimpleQueue()
+
+    def put(self, item: T) -> None:
+        self._queue.put(item)
+
+    def drain(self) -> list[T]:
+        items = []
+        while True:
+            try:
+                items.append(self._queue.get_nowait())
+            except queue.Empty:
+                return items
+
+    def __len__(self) -> int:
+        return self._queue.qsize()
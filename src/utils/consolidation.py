@@ -0,0 +1,100 @@
+import logging
+import threading
+from dataclasses import dataclass
+
+from eth_abi import decode
+
+from src.keys_source.keys_api_source import KeysApiSource
+from src.typings import BlockNumber
+from src.utils.events import get_events_in_range
+from src.utils.types import bytes_to_hex_str
+
+logger = logging.getLogger()
+
+BATCH_TUPLE_TYPE = '(bytes[],bytes)[]'
+
+
+@dataclass(frozen=True)
+class ConsolidationBatchItem:
+    source_pubkeys: tuple[str, ...]
+    target_pubkey: str
+
+
+class ConsolidationRequestsIndex:
+    """
+    Validator consolidations requested in ConsolidationBus within the exit events lookback window.
+    One instance is owned by the watcher and shared by all the handlers.
+    """
+
+    def __init__(self):
+        self.by_block: dict[BlockNumber, set[ConsolidationBatchItem]] = {}
+        # Source and target pubkeys of all the items from `by_block`
+        self.pubkeys: set[str] = set()
+        self.last_block_number: BlockNumber | None = None
+        self._lock = threading.Lock()
+
+    def __contains__(self, pubkey: str) -> bool:
+        return pubkey in self.pubkeys
+
+    def __len__(self) -> int:
+        return len(self.by_block)
+
+    def add(self, block_number: BlockNumber, item: ConsolidationBatchItem) -> None:
+        self.by_block.setdefault(block_number, set()).add(item)
+        self.pubkeys.update((item.target_pubkey, *item.source_pubkeys))
+
+    def update(self, watcher, current_block_number: BlockNumber) -> None:
+        """Read consolidations requested in ConsolidationBus since the last update. Noop if block is already read"""
+        if not isinstance(watcher.keys_source, KeysApiSource) or not watcher.keys_source.modules_operators_dict:
+            return
+
+        if not watcher.execution.lido_contracts.consolidation_bus:
+            return
+
+        # pylint: disable=duplicate-code
+        with self._lock:
+            if self.last_block_number is not None and current_block_number <= self.last_block_number:
+                return
+            self._update(watcher, current_block_number)
+            self.last_block_number = current_block_number
+
+    def _update(self, watcher, current_block_number: BlockNumber) -> None:
+        logger.info({'msg': 'Getting last validator consolidations from ConsolidationBus'})
+
+        lookup_window = watcher.execution.lido_contracts.get_exit_events_lookback_window()
+
+        last_cached_block = -1
+        if self.last_block_number is not None:
+            last_cached_block = self.last_block_number
+
+        l_block = max(last_cached_block + 1, current_block_number - lookup_window)
+
+        events = get_events_in_range(
+            watcher.execution.lido_contracts.consolidation_bus.events.RequestsAdded,
+            l_block=BlockNumber(l_block),
+            r_block=BlockNumber(current_block_number),
+            keep_from=BlockNumber(current_block_number - lookup_window),
+        )
+
+        for event in events:
+            consolidation_group = decode([BATCH_TUPLE_TYPE], event['args']['batchData'])[0]
+
+            for batch in consolidation_group:
+                self.add(
+                    BlockNumber(event['blockNumber']),
+                    ConsolidationBatchItem(
+                        source_pubkeys=tuple(bytes_to_hex_str(pubkey) for pubkey in batch[0]),
+                        target_pubkey=bytes_to_hex_str(batch[1]),
+                    ),
+                )
+
+        outdated = [block for block in self.by_block if block < current_block_number - lookup_window]
+        if outdated:
+            for block in outdated:
+                del self.by_block[block]
+            self.pubkeys = {
+                pubkey
+                for items in self.by_block.values()
+                for item in items
+                for pubkey in (item.target_pubkey, *item.source_pubkeys)
+            }
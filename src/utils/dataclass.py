@@ -1,7 +1,17 @@
 import functools
 from dataclasses import dataclass, fields, is_dataclass
 from types import GenericAlias
-from typing import Callable, Self, Sequence, TypeVar, Union, get_args, get_origin
+from typing import (
+    Any,
+    Callable,
+    Self,
+    Sequence,
+    TypeVar,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+)
 
 
 class DecodeToDataclassException(Exception):
@@ -16,6 +26,64 @@ def try_extract_underlying_type_from_optional(field):
     return None
 
 
+Converter = Callable[[Any], Any]
+
+
+@functools.cache
+def _field_names(cls: type) -> frozenset[str]:
+    return frozenset(field.name for field in fields(cls))
+
+
+def _dataclass_factory(field_type) -> Callable[..., Any]:
+    if issubclass(field_type, FromResponse):
+        return field_type.from_response
+    return field_type
+
+
+def _dataclass_converter(factory: Callable[..., Any]) -> Converter:
+    return lambda value: factory(**value) if isinstance(value, dict) else value
+
+
+def _sequence_converter(origin: Callable[..., Any], factory: Callable[..., Any]) -> Converter:
+    return lambda values: origin(factory(**x) if isinstance(x, dict) else x for x in values)
+
+
+def _unwrap_new_type(field_type):
+    while hasattr(field_type, '__supertype__'):
+        field_type = field_type.__supertype__
+    return field_type
+
+
+@functools.cache
+def _int_fields(cls: type) -> tuple[str, ...]:
+    """
+    Fields typed as `int` (or NewType over it, e.g. `SlotNumber`).
+    CL API returns uint64 values as strings, they are converted once at decode time.
+    """
+    return tuple(field.name for field in fields(cls) if _unwrap_new_type(field.type) is int)
+
+
+@functools.cache
+def _nested_converters(cls: type) -> tuple[tuple[str, Converter], ...]:
+    """
+    Converters for fields that hold dataclasses, lists of dataclasses or optional dataclasses.
+    Resolved once per class, so instantiation doesn't inspect type hints.
+    """
+    converters = []
+    for field in fields(cls):
+        if isinstance(field.type, GenericAlias):
+            item_type = field.type.__args__[0]
+            if is_dataclass(item_type):
+                origin = cast(Callable[..., Any], field.type.__origin__)
+                converters.append((field.name, _sequence_converter(origin, _dataclass_factory(item_type))))
+        elif is_dataclass(field.type):
+            converters.append((field.name, _dataclass_converter(_dataclass_factory(field.type))))
+        elif (underlying := try_extract_underlying_type_from_optional(field.type)) and is_dataclass(underlying):
+            # None is not a dict, so it stays as is
+            converters.append((field.name, _dataclass_converter(_dataclass_factory(underlying))))
+    return tuple(converters)
+
+
 @dataclass
 class Nested:
     """
@@ -23,31 +91,12 @@ class Nested:
     Also works with lists of dataclasses
     """
 
+    # Allows subclasses to be declared with `@dataclass(slots=True)`
+    __slots__ = ()
+
     def __post_init__(self):
-        for field in fields(self):
-            if isinstance(field.type, GenericAlias):
-                field_type = field.type.__args__[0]
-                if is_dataclass(field_type):
-                    factory = self.__get_dataclass_factory(field_type)
-                    setattr(
-                        self,
-                        field.name,
-                        field.type.__origin__(
-                            map(lambda x: factory(**x) if not is_dataclass(x) else x, getattr(self, field.name))
-                        ),
-                    )
-            elif is_dataclass(field.type) and not is_dataclass(getattr(self, field.name)):
-                factory = self.__get_dataclass_factory(field.type)
-                setattr(self, field.name, factory(**getattr(self, field.name)))
-            elif getattr(self, field.name) and (underlying := try_extract_underlying_type_from_optional(field.type)):
-                factory = self.__get_dataclass_factory(underlying)
-                setattr(self, field.name, factory(**getattr(self, field.name)))
-
-    @staticmethod
-    def __get_dataclass_factory(field_type):
-        if issubclass(field_type, FromResponse):
-            return field_type.from_response
-        return field_type
+        for name, convert in _nested_converters(type(self)):
+            setattr(self, name, convert(getattr(self, name)))
 
 
 T = TypeVar('T')
@@ -59,10 +108,17 @@ class FromResponse:
     Class for extending dataclass with custom from_response method, ignored extra fields
     """
 
+    __slots__ = ()
+
     @classmethod
     def from_response(cls, **kwargs) -> Self:
-        class_field_names = [field.name for field in fields(cls)]
-        return cls(**{k: v for k, v in kwargs.items() if k in class_field_names})
+        class_field_names = _field_names(cls)  # type: ignore[arg-type]
+        if not class_field_names.issuperset(kwargs):
+            kwargs = {k: v for k, v in kwargs.items() if k in class_field_names}
+        for name in _int_fields(cls):  # type: ignore[arg-type]
+            if isinstance(value := kwargs.get(name), str):
+                kwargs[name] = int(value)
+        return cls(**kwargs)
 
 
 def list_of_dataclasses(
@@ -1,37 +1,152 @@
 import logging
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Iterator
 
 from web3.contract.contract import ContractEvent
 from web3.types import EventData
 
 from src.typings import BlockNumber
-from src.variables import EVENTS_SEARCH_STEP
+from src.utils.events_cache import REORG_SAFE_DEPTH, get_events_cache
+from src.variables import (
+    EVENTS_CACHE_DIR,
+    EVENTS_SEARCH_CONCURRENCY,
+    EVENTS_SEARCH_STEP,
+)
 
 logger = logging.getLogger()
 
+# Step is doubled after this number of accepted chunks in a row, so a limit hit on a dense range is not kept for the
+# rest of the scan. Every try of a longer step costs one rejected request at most
+STEP_GROW_AFTER_CHUNKS = 8
+
 
 class InconsistentEvents(Exception):
     pass
 
 
-def get_events_in_range(event: ContractEvent, l_block: BlockNumber, r_block: BlockNumber) -> Iterator[EventData]:
-    """Fetch all the events in the given blocks range (closed interval)"""
-    if l_block > r_block:
-        raise ValueError(f"{l_block=} > {r_block=}")
+class _RangeScanner:
+    """
+    Fetch events by chunks. Chunk rejected by EL (too long range or too many events in response) is split in halves.
+    Next chunks are not longer than the accepted half. The step grows back up to `EVENTS_SEARCH_STEP`
+    after `STEP_GROW_AFTER_CHUNKS` chunks in a row are accepted.
+    """
 
-    while True:
-        to_block = min(r_block, BlockNumber(l_block + EVENTS_SEARCH_STEP))
+    def __init__(self, event: ContractEvent):
+        self.event = event
+        self.step = EVENTS_SEARCH_STEP
+        self._accepted_in_row = 0
+        self._lock = threading.Lock()
 
-        logger.info({"msg": f"Fetching {event.event_name} events in range [{l_block}:{to_block}]"})
+    def fetch(self, l_block: BlockNumber, r_block: BlockNumber) -> list[EventData]:
+        logger.info({"msg": f"Fetching {self.event.event_name} events in range [{l_block}:{r_block}]"})
 
-        for e in event.get_logs(fromBlock=l_block, toBlock=to_block):
-            if not l_block <= e['blockNumber'] <= to_block:
+        try:
+            events = self.event.get_logs(fromBlock=l_block, toBlock=r_block)
+        except ValueError as e:
+            # JSON-RPC error, network errors are not fixed by splitting the range
+            if l_block == r_block:
+                raise
+            middle = BlockNumber((l_block + r_block) // 2)
+            logger.warning(
+                {'msg': f'EL rejected range [{l_block}:{r_block}], splitting it in halves', 'exception': str(e)}
+            )
+            with self._lock:
+                self.step = min(self.step, middle - l_block)
+                self._accepted_in_row = 0
+            return self.fetch(l_block, middle) + self.fetch(BlockNumber(middle + 1), r_block)
+
+        for event in events:
+            if not l_block <= event['blockNumber'] <= r_block:
                 raise InconsistentEvents(
-                    f"Event block {e['blockNumber']} is outside requested range [{l_block}:{to_block}]"
+                    f"Event block {event['blockNumber']} is outside requested range [{l_block}:{r_block}]"
                 )
-            yield e
+        self._on_accepted(r_block - l_block)
+        return list(events)
+
+    def _on_accepted(self, length: int) -> None:
+        with self._lock:
+            # Only chunks of the current step tell that it is not over the limit
+            if length < self.step:
+                return
+            self._accepted_in_row += 1
+            if self._accepted_in_row >= STEP_GROW_AFTER_CHUNKS and self.step < EVENTS_SEARCH_STEP:
+                self.step = min(EVENTS_SEARCH_STEP, self.step * 2 + 1)
+                self._accepted_in_row = 0
+
+
+def get_events_in_range(
+    event: ContractEvent, l_block: BlockNumber, r_block: BlockNumber, keep_from: BlockNumber | None = None
+) -> Iterator[EventData]:
+    """
+    Fetch all the events in the given blocks range (closed interval).
+    Cached events before `keep_from` are not needed by the caller anymore and are dropped
+    """
+    if l_block > r_block:
+        raise ValueError(f"{l_block=} > {r_block=}")
+
+    if EVENTS_CACHE_DIR:
+        yield from _get_cached_events_in_range(event, l_block, r_block, keep_from)
+    else:
+        yield from _fetch_events_in_range(event, l_block, r_block)
+
+
+def _get_cached_events_in_range(
+    event: ContractEvent, l_block: BlockNumber, r_block: BlockNumber, keep_from: BlockNumber | None
+) -> list[EventData]:
+    """
+    Stored events are taken from the cache, the rest of the range is fetched from EL.
+    Events of the last `REORG_SAFE_DEPTH` blocks are not stored, so they are fetched again next time
+    """
+    cache = get_events_cache(EVENTS_CACHE_DIR, event)
+    with cache.lock:
+        if keep_from is not None:
+            cache.trim(keep_from)
+
+        events = []
+        fetch_from = l_block
+        if (
+            cache.from_block is not None
+            and cache.to_block is not None
+            and cache.from_block <= l_block <= cache.to_block + REORG_SAFE_DEPTH + EVENTS_SEARCH_STEP
+        ):
+            # Not stored tail of the previous call is fetched again, so the cached range is extended without gaps
+            events = cache.get(l_block, r_block)
+            fetch_from = BlockNumber(cache.to_block + 1)
+
+        if fetch_from > r_block:
+            return events
+
+        safe_block = BlockNumber(r_block - REORG_SAFE_DEPTH)
+        to_store = []
+        for e in _fetch_events_in_range(event, fetch_from, r_block):
+            if e['blockNumber'] <= safe_block:
+                to_store.append(e)
+            if e['blockNumber'] >= l_block:
+                events.append(e)
+
+        if safe_block >= fetch_from:
+            cache.extend(fetch_from, safe_block, to_store)
+        return events
+
+
+def _fetch_events_in_range(event: ContractEvent, l_block: BlockNumber, r_block: BlockNumber) -> Iterator[EventData]:
+    """Up to `EVENTS_SEARCH_CONCURRENCY` chunks are fetched at once, events are yielded in blocks order"""
+    scanner = _RangeScanner(event)
+    pending: deque[Future[list[EventData]]] = deque()
+    next_block = l_block
 
-        if to_block == r_block:
-            break
+    with ThreadPoolExecutor(max_workers=EVENTS_SEARCH_CONCURRENCY) as executor:
+        try:
+            while next_block <= r_block or pending:
+                while next_block <= r_block and len(pending) < EVENTS_SEARCH_CONCURRENCY:
+                    to_block = min(r_block, BlockNumber(next_block + scanner.step))
+                    pending.append(executor.submit(scanner.fetch, next_block, to_block))
+                    next_block = BlockNumber(to_block + 1)
 
-        l_block = BlockNumber(to_block + 1)
+                yield from pending.popleft().result()
+        finally:
+            # Scan is stopped by error or by consumer, chunks that are not started yet are not needed
+            for future in pending:
+                future.cancel()
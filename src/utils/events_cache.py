@@ -0,0 +1,150 @@
+import json
+import logging
+import os
+import threading
+from bisect import bisect_left, bisect_right
+from collections.abc import Mapping
+from typing import Any
+
+from hexbytes import HexBytes
+from web3.contract.contract import ContractEvent
+from web3.datastructures import AttributeDict
+from web3.types import EventData
+
+from src.constants import SLOTS_PER_EPOCH
+from src.typings import BlockNumber
+
+logger = logging.getLogger()
+
+# Blocks that are not finalized yet (usually) could be reorged, their events are not stored
+REORG_SAFE_DEPTH = 2 * SLOTS_PER_EPOCH
+# Appended chunks are compacted to one line with the trimmed events, so the file doesn't grow unbounded
+COMPACT_AFTER_CHUNKS = 256
+
+
+class EventsCache:
+    """
+    Events of one contract event in continuous blocks range [from_block, to_block] stored in JSONL file.
+    Every line is a chunk `{"from_block": ..., "to_block": ..., "events": [...]}` following the previous one.
+    The file is only appended and compacted to one line on the start and every `COMPACT_AFTER_CHUNKS` chunks,
+    so a broken write spoils the last line only.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.from_block: BlockNumber | None = None
+        self.to_block: BlockNumber | None = None
+        # Sorted by block number
+        self.events: list[EventData] = []
+        self.lock = threading.Lock()
+        self._chunks_in_file = 0
+        self._load()
+
+    def get(self, l_block: BlockNumber, r_block: BlockNumber) -> list[EventData]:
+        start = bisect_left(self.events, l_block, key=_block_number)
+        end = bisect_right(self.events, r_block, key=_block_number)
+        return self.events[start:end]
+
+    def trim(self, from_block: BlockNumber) -> None:
+        """Forget events before the block. The file is trimmed on the next compaction"""
+        if self.from_block is None or self.to_block is None or from_block <= self.from_block:
+            return
+        if from_block > self.to_block:
+            self.from_block, self.to_block, self.events = None, None, []
+            return
+        del self.events[: bisect_left(self.events, from_block, key=_block_number)]
+        self.from_block = from_block
+
+    def extend(self, from_block: BlockNumber, to_block: BlockNumber, events: list[EventData]) -> None:
+        """Store events of the range. Range that does not follow the cached one replaces the cache"""
+        chunk = {'from_block': from_block, 'to_block': to_block, 'events': events}
+        if self.to_block is None or from_block != self.to_block + 1:
+            self.from_block = from_block
+            self.to_block = to_block
+            self.events = list(events)
+            self._write([chunk], mode='w')
+            return
+
+        self.to_block = to_block
+        self.events.extend(events)
+        if self._chunks_in_file >= COMPACT_AFTER_CHUNKS:
+            self._compact()
+        else:
+            self._write([chunk], mode='a')
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, encoding='utf-8') as f:
+            lines = f.readlines()
+
+        for line in lines:
+            try:
+                chunk = json.loads(line, object_hook=_decode)
+            except json.JSONDecodeError:
+                logger.warning({'msg': f'Ignoring broken tail of events cache {self.path}'})
+                break
+            if self.to_block is not None and chunk['from_block'] != self.to_block + 1:
+                logger.warning({'msg': f'Ignoring non-continuous tail of events cache {self.path}'})
+                break
+            if self.from_block is None:
+                self.from_block = chunk['from_block']
+            self.to_block = chunk['to_block']
+            self.events.extend(chunk['events'])
+
+        self._compact()
+        logger.info({'msg': f'Events cache {self.path} loaded: [{self.from_block}:{self.to_block}]'})
+
+    def _compact(self) -> None:
+        if self.from_block is not None and self.to_block is not None:
+            self._write([{'from_block': self.from_block, 'to_block': self.to_block, 'events': self.events}], mode='w')
+
+    def _write(self, chunks: list[dict[str, Any]], mode: str) -> None:
+        lines = ''.join(json.dumps(_encode(chunk)) + '\n' for chunk in chunks)
+        if mode == 'a':
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(lines)
+            self._chunks_in_file += len(chunks)
+            return
+        # Write to the temporary file first, so the cache is not lost if the process stops in the middle
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(lines)
+        os.replace(tmp_path, self.path)
+        self._chunks_in_file = len(chunks)
+
+
+_caches: dict[str, EventsCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_events_cache(directory: str, event: ContractEvent) -> EventsCache:
+    path = os.path.join(directory, f'{event.address.lower()}_{event.event_name}.jsonl')
+    with _caches_lock:
+        if path not in _caches:
+            os.makedirs(directory, exist_ok=True)
+            _caches[path] = EventsCache(path)
+        return _caches[path]
+
+
+def _block_number(event: EventData) -> BlockNumber:
+    return BlockNumber(event['blockNumber'])
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, bytes):
+        return {'__bytes__': value.hex()}
+    if isinstance(value, Mapping):
+        return {k: _encode(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(v) for v in value]
+    return value
+
+
+def _decode(value: dict[str, Any]) -> Any:
+    if '__bytes__' in value:
+        return HexBytes(value['__bytes__'])
+    if 'blockNumber' in value:
+        return AttributeDict(value)
+    return value
@@ -1,74 +1,91 @@
 import logging
-from dataclasses import dataclass
-
-from web3 import Web3
+import threading
 
 from src.keys_source.keys_api_source import KeysApiSource
-from src.providers.consensus.typings import BlockDetailsResponse
-from src.typings import BlockNumber
+from src.typings import BlockNumber, ValidatorIndex
 from src.utils.events import get_events_in_range
 
 logger = logging.getLogger()
 
 
-@dataclass
-class ValidatorExitsInfo:
-    last_total_requests_processed: int
-    last_requested_exit_indexes: dict[int, set[int]]
-
-
-def get_last_requested_validator_exit_indexes(
-    watcher, block: BlockDetailsResponse, exits_info: ValidatorExitsInfo
-) -> ValidatorExitsInfo:
-    """Read last validator indexes requested to exit by VEBO"""
-    if not isinstance(watcher.keys_source, KeysApiSource):
-        return exits_info
-
-    current_block_number = int(block.message.body.execution_payload.block_number)
-
-    # todo:
-    #  should we look at the refSlot for report?
-    #  compere local last processed refSlot and calculated refSlot (get from contract + frame size)
-    #  instead of getting total_requests_processed every block with lido exits
-    total_requests_processed = (
-        watcher.execution.lido_contracts.validators_exit_bus_oracle.functions.getTotalRequestsProcessed().call(
-            block_identifier=current_block_number
+class ValidatorExitRequestsIndex:
+    """
+    Validator indexes requested to exit by VEBO within the exit events lookback window.
+    One instance is owned by the watcher and shared by all the handlers.
+    """
+
+    def __init__(self):
+        self.by_block: dict[BlockNumber, set[ValidatorIndex]] = {}
+        # All the indexes from `by_block`, to check if validator was requested to exit
+        self.indexes: set[ValidatorIndex] = set()
+        self.last_total_requests_processed = 0
+        self.last_block_number: BlockNumber | None = None
+        self._lock = threading.Lock()
+
+    def __contains__(self, index: ValidatorIndex) -> bool:
+        return index in self.indexes
+
+    def __len__(self) -> int:
+        return len(self.by_block)
+
+    def add(self, block_number: BlockNumber, index: ValidatorIndex) -> None:
+        self.by_block.setdefault(block_number, set()).add(index)
+        self.indexes.add(index)
+
+    def reset_requests_counter(self) -> None:
+        """
+        Counter of the new VEBO is not comparable with the previous one. Read requests are kept,
+        the next update continues from the last read block with the new contract
+        """
+        with self._lock:
+            self.last_total_requests_processed = 0
+
+    def update(self, watcher, current_block_number: BlockNumber) -> None:
+        """Read validator indexes requested to exit by VEBO since the last update. Noop if block is already read"""
+        if not isinstance(watcher.keys_source, KeysApiSource):
+            return
+
+        # Follower and handlers could ask for the update at once, the second one finds the index up to date
+        with self._lock:
+            if self.last_block_number is not None and current_block_number <= self.last_block_number:
+                return
+            self._update(watcher, current_block_number)
+            self.last_block_number = current_block_number
+
+    def _update(self, watcher, current_block_number: BlockNumber) -> None:
+        # todo:
+        #  should we look at the refSlot for report?
+        #  compere local last processed refSlot and calculated refSlot (get from contract + frame size)
+        #  instead of getting total_requests_processed every block with lido exits
+        total_requests_processed, lookup_window = watcher.execution.lido_contracts.get_exit_requests_state(
+            current_block_number
         )
-    )
-
-    if total_requests_processed <= exits_info.last_total_requests_processed:
-        return exits_info
 
-    logger.info({'msg': 'Getting last validator indexes requested to exit by VEBO'})
+        if total_requests_processed <= self.last_total_requests_processed:
+            return
 
-    # pylint: disable=duplicate-code
-    lookup_window = Web3.to_int(
-        watcher.execution.lido_contracts.oracle_daemon_config.functions.get(
-            'EXIT_EVENTS_LOOKBACK_WINDOW_IN_SLOTS'
-        ).call(block_identifier=current_block_number)
-    )
+        logger.info({'msg': 'Getting last validator indexes requested to exit by VEBO'})
 
-    last_cached_block = -1
-    if exits_info.last_requested_exit_indexes:
-        last_cached_block = max(exits_info.last_requested_exit_indexes)
+        last_cached_block = -1
+        if self.by_block:
+            last_cached_block = max(self.by_block)
 
-    l_block = max(last_cached_block + 1, current_block_number - lookup_window)
+        l_block = max(last_cached_block + 1, current_block_number - lookup_window)
 
-    events = get_events_in_range(
-        watcher.execution.lido_contracts.validators_exit_bus_oracle.events.ValidatorExitRequest,
-        l_block=BlockNumber(l_block),
-        r_block=BlockNumber(current_block_number),
-    )
-
-    for event in events:
-        if event['blockNumber'] not in exits_info.last_requested_exit_indexes:
-            exits_info.last_requested_exit_indexes[event['blockNumber']] = set()
-        exits_info.last_requested_exit_indexes[event['blockNumber']].add(event['args']['validatorIndex'])
+        events = get_events_in_range(
+            watcher.execution.lido_contracts.validators_exit_bus_oracle.events.ValidatorExitRequest,
+            l_block=BlockNumber(l_block),
+            r_block=BlockNumber(current_block_number),
+            keep_from=BlockNumber(current_block_number - lookup_window),
+        )
 
-    for cached_block in list(exits_info.last_requested_exit_indexes.keys()):
-        if cached_block < current_block_number - lookup_window:
-            del exits_info.last_requested_exit_indexes[cached_block]
+        for event in events:
+            self.add(BlockNumber(event['blockNumber']), ValidatorIndex(event['args']['validatorIndex']))
 
-    exits_info.last_total_requests_processed = total_requests_processed
+        outdated = [block for block in self.by_block if block < current_block_number - lookup_window]
+        if outdated:
+            for block in outdated:
+                del self.by_block[block]
+            self.indexes = set().union(*self.by_block.values())
 
-    return exits_info
+        self.last_total_requests_processed = total_requests_processed
@@ -0,0 +1,75 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import Iterator
+
+from src.providers.consensus.typings import FullBlockInfo
+from src.typings import BlockNumber, BlockRoot, SlotNumber
+
+
+@dataclass(frozen=True, slots=True)
+class HeaderSummary:
+    """Part of the handled block that is needed to check chain reorgs"""
+
+    root: BlockRoot
+    parent_root: BlockRoot
+    slot: SlotNumber
+    block_number: BlockNumber
+
+    @classmethod
+    def from_block(cls, block: FullBlockInfo) -> 'HeaderSummary':
+        return cls(
+            root=block.root,
+            parent_root=block.header.message.parent_root,
+            slot=block.header.message.slot,
+            block_number=block.message.body.execution_payload.block_number,
+        )
+
+
+class HeadersHistory:
+    """
+    Bounded window of the last handled headers.
+    Only summaries are kept, so block bodies are released right after the head is handled.
+    Oldest header is evicted when the window is full, lookups by root and by slot are O(1).
+    """
+
+    def __init__(self, depth: int):
+        self._headers: deque[HeaderSummary] = deque()
+        self._by_root: dict[BlockRoot, HeaderSummary] = {}
+        self._root_by_slot: dict[SlotNumber, BlockRoot] = {}
+        self.depth = depth
+
+    def append(self, header: HeaderSummary) -> None:
+        if len(self._headers) >= self.depth:
+            self._evict()
+        self._headers.append(header)
+        self._by_root[header.root] = header
+        self._root_by_slot[header.slot] = header.root
+
+    def get(self, root: BlockRoot) -> HeaderSummary | None:
+        return self._by_root.get(root)
+
+    def get_by_slot(self, slot: SlotNumber) -> HeaderSummary | None:
+        root = self._root_by_slot.get(slot)
+        return self._by_root.get(root) if root is not None else None
+
+    @property
+    def last(self) -> HeaderSummary | None:
+        return self._headers[-1] if self._headers else None
+
+    def _evict(self) -> None:
+        header = self._headers.popleft()
+        # The same header could be appended again after the reorg, so keep the index if it is still in the window
+        if self._by_root.get(header.root) is header:
+            del self._by_root[header.root]
+        slot = header.slot
+        if self._root_by_slot.get(slot) == header.root and self._by_root.get(header.root) is None:
+            del self._root_by_slot[slot]
+
+    def __len__(self) -> int:
+        return len(self._headers)
+
+    def __iter__(self) -> Iterator[HeaderSummary]:
+        return iter(self._headers)
+
+    def __bool__(self) -> bool:
+        return bool(self._headers)
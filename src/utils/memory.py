@@ -0,0 +1,36 @@
+import sys
+from collections import deque
+from dataclasses import fields, is_dataclass
+from itertools import islice
+from typing import Any
+
+# Containers are estimated by the first items only, so it is cheap even for millions of entries
+SAMPLE_SIZE = 100
+
+
+def approximate_size(obj: Any, sample_size: int = SAMPLE_SIZE) -> int:
+    """
+    Approximate deep size of object in bytes.
+    Size of a container is extrapolated from the first `sample_size` items.
+    Objects shared between items are counted for each item, so it is the upper bound.
+    """
+    size = sys.getsizeof(obj)
+    try:
+        if isinstance(obj, dict):
+            sample = list(islice(obj.items(), sample_size))
+            if sample:
+                sampled = sum(approximate_size(k, sample_size) + approximate_size(v, sample_size) for k, v in sample)
+                size += sampled * len(obj) // len(sample)
+        elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+            sample = list(islice(obj, sample_size))
+            if sample:
+                size += sum(approximate_size(item, sample_size) for item in sample) * len(obj) // len(sample)
+        elif hasattr(obj, '__dict__') and not isinstance(obj, type):
+            size += approximate_size(vars(obj), sample_size)
+        elif is_dataclass(obj) and not isinstance(obj, type):
+            # Slotted dataclass
+            size += sum(approximate_size(getattr(obj, f.name), sample_size) for f in fields(obj))
+    except RuntimeError:
+        # Container was changed by another thread during iteration, return shallow size
+        pass
+    return size
@@ -0,0 +1,32 @@
+import threading
+import time
+from typing import Any, Callable, Hashable
+
+
+class TTLCache:
+    """Values with per-key time to live. Value is loaded again when it is expired or invalidated"""
+
+    def __init__(self):
+        self._values: dict[Hashable, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, key: Hashable, load: Callable[[], Any], ttl: float) -> Any:
+        with self._lock:
+            if (cached := self._values.get(key)) is not None and cached[0] > time.monotonic():
+                return cached[1]
+        # Value is loaded without the lock, concurrent loads of the same key just give the same value
+        value = load()
+        with self._lock:
+            self._values[key] = (time.monotonic() + ttl, value)
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._values.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
@@ -2,6 +2,8 @@ import json
 import os
 
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+# Max records waiting to be written by the logging thread
+LOG_QUEUE_MAX_SIZE = int(os.getenv('LOG_QUEUE_MAX_SIZE', 10000))
 
 # - Providers-
 CONSENSUS_CLIENT_URI = os.getenv('CONSENSUS_CLIENT_URI', '').split(',')
@@ -21,6 +23,13 @@ SLOTS_RANGE = os.getenv('SLOTS_RANGE')
 
 CYCLE_SLEEP_IN_SECONDS = int(os.getenv('CYCLE_SLEEP_IN_SECONDS', 1))
 
+# Delay before reconnecting to the events stream, doubled after each failed attempt
+EVENTS_STREAM_MIN_RECONNECT_DELAY_IN_SECONDS = float(os.getenv('EVENTS_STREAM_MIN_RECONNECT_DELAY_IN_SECONDS', 1))
+EVENTS_STREAM_MAX_RECONNECT_DELAY_IN_SECONDS = float(os.getenv('EVENTS_STREAM_MAX_RECONNECT_DELAY_IN_SECONDS', 60))
+
+# How many last handled headers are kept to check chain reorgs. 96 slots is 3 epochs
+HANDLED_HEADERS_HISTORY_DEPTH = int(os.getenv('HANDLED_HEADERS_HISTORY_DEPTH', 96))
+
 KEYS_SOURCE = os.getenv('KEYS_SOURCE', 'keys_api')
 
 KEYS_FILE_PATH = os.getenv('KEYS_FILE_PATH', './docker/validators/keys.yml')
@@ -40,15 +49,24 @@ CL_REQUEST_RETRY_COUNT = int(os.getenv('CL_REQUEST_RETRY_COUNT', 3))
 CL_REQUEST_SLEEP_BEFORE_RETRY_IN_SECONDS = float(os.getenv('CL_REQUEST_SLEEP_BEFORE_RETRY_IN_SECONDS', 5))
 
 EL_REQUEST_TIMEOUT = float(os.getenv('EL_REQUEST_TIMEOUT', 5))
+EL_CACHE_MAX_SIZE = int(os.getenv('EL_CACHE_MAX_SIZE', 1000))
 EVENTS_SEARCH_STEP = int(os.getenv('EVENTS_SEARCH_STEP', 10000))
+EVENTS_SEARCH_CONCURRENCY = int(os.getenv('EVENTS_SEARCH_CONCURRENCY', 4))
+EVENTS_CACHE_DIR = os.getenv('EVENTS_CACHE_DIR', '')
 
 LIDO_LOCATOR_ADDRESS = os.getenv('LIDO_LOCATOR_ADDRESS', '')
 LIDO_CONSOLIDATION_BUS_ADDRESS = os.getenv('LIDO_CONSOLIDATION_BUS_ADDRESS', '')
+# Lido locator could be upgraded, contracts addresses are read again with this interval. 32 epochs is ~3.4 hours
+CONTRACTS_REFRESH_INTERVAL_IN_EPOCHS = int(os.getenv('CONTRACTS_REFRESH_INTERVAL_IN_EPOCHS', 32))
+MULTICALL3_ADDRESS = os.getenv('MULTICALL3_ADDRESS', '0xcA11bde05977b3631167028862bE2a173976CA11')
 
 VALID_WITHDRAWAL_ADDRESSES = [x.lower() for x in os.getenv('VALID_WITHDRAWAL_ADDRESSES', '').split(',') if x]
 
 DISABLE_UNEXPECTED_EXIT_ALERTS = [x.strip() for x in os.getenv('DISABLE_UNEXPECTED_EXIT_ALERTS', '').split(',') if x]
 
+# Finality is normally 2 epochs behind the head
+FINALITY_LAG_ALERT_THRESHOLD_IN_EPOCHS = int(os.getenv('FINALITY_LAG_ALERT_THRESHOLD_IN_EPOCHS', 4))
+
 # - Metrics -
 PROMETHEUS_PORT = int(os.getenv('PROMETHEUS_PORT', 9000))
 PROMETHEUS_PREFIX = os.getenv("PROMETHEUS_PREFIX", "ethereum_head_watcher")
@@ -57,6 +75,10 @@ HEALTHCHECK_SERVER_PORT = int(os.getenv('HEALTHCHECK_SERVER_PORT', 9010))
 
 MAX_CYCLE_LIFETIME_IN_SECONDS = int(os.getenv("MAX_CYCLE_LIFETIME_IN_SECONDS", 3000))
 
+# Sampling profiler on healthcheck server. Disabled by default
+PROFILER_ENABLED = os.getenv('PROFILER_ENABLED', 'false').lower() == 'true'
+PROFILER_MAX_DURATION_IN_SECONDS = float(os.getenv('PROFILER_MAX_DURATION_IN_SECONDS', 60))
+
 
 def check_uri_required_variables():
     errors = []
@@ -1,41 +1,52 @@
-import json
 import logging
 import threading
 import time
 from dataclasses import asdict
-from functools import cached_property
-from typing import Optional
+from typing import Any, Optional
 
 import json_stream.requests
-import sseclient
 from unsync import Unfuture, unsync
 
 from src import variables
 from src.constants import SECONDS_PER_SLOT, SLOTS_PER_EPOCH
 from src.handlers.handler import WatcherHandler
 from src.keys_source.base_source import BaseSource, NamedKey
-from src.metrics.prometheus.duration_meter import duration_meter
+from src.metrics.prometheus.duration_meter import duration_meter, head_slot_exemplar
+from src.metrics.prometheus.slot_timer import SlotTimer
 from src.metrics.prometheus.watcher import (
+    GENESIS_TIME,
     KEYS_SOURCE_SLOT_NUMBER,
     SLOT_NUMBER,
+    STATE_ENTRIES,
+    STATE_SIZE,
     VALIDATORS_INDEX_SLOT_NUMBER,
 )
 from src.providers.alertmanager.client import AlertmanagerClient
 from src.providers.consensus.client import ConsensusClient
+from src.providers.consensus.events import EventStream, EventTopic
 from src.providers.consensus.typings import (
     BlockHeaderResponseData,
     ChainReorgEvent,
     FullBlockInfo,
 )
 from src.providers.http_provider import NotOkResponse
-from src.utils.decorators import thread_as_daemon
-from src.variables import CYCLE_SLEEP_IN_SECONDS, SLOTS_RANGE
+from src.typings import BlockNumber, ValidatorIndex
+from src.utils.channel import EventChannel
+from src.utils.consolidation import ConsolidationRequestsIndex
+from src.utils.exit import ValidatorExitRequestsIndex
+from src.utils.headers_history import HeadersHistory, HeaderSummary
+from src.utils.memory import approximate_size
+from src.variables import (
+    CONTRACTS_REFRESH_INTERVAL_IN_EPOCHS,
+    CYCLE_SLEEP_IN_SECONDS,
+    HANDLED_HEADERS_HISTORY_DEPTH,
+    SLOTS_RANGE,
+)
+from src.web3py.extensions import LidoContracts
 from src.web3py.typings import Web3
 
 logger = logging.getLogger()
 
-KEEP_MAX_HANDLED_HEADERS_COUNT = 96  # Keep only the last 96 slots (3 epochs) for chain reorgs check
-
 
 class Watcher:
     def __init__(self, handlers: list[WatcherHandler], keys_source: BaseSource, web3: Web3 | None = None):
@@ -45,29 +56,49 @@ class Watcher:
         self.keys_source: BaseSource = keys_source
         self.alertmanager: AlertmanagerClient = AlertmanagerClient(variables.ALERTMANAGER_URI)
         self.genesis_time: int = int(self.consensus.get_genesis().genesis_time)
+        GENESIS_TIME.set(self.genesis_time)
         self.handlers: list[WatcherHandler] = handlers
         # Tasks
         self.validators_updater: Unfuture = None
         self.keys_updater: Unfuture = None
-        self.chain_reorg_event_listener: threading.Thread | None = None
+        self.state_metrics_updater: Unfuture = None
+        self.execution_requests_updater: Unfuture = None
+        self.contracts_updater: Unfuture = None
+        self.contracts_refreshed_epoch: int | None = None
         self.user_keys: dict[str, NamedKey] = {}
-        self.indexed_validators_keys: dict[str, str] = {}
-        self.chain_reorgs: dict[str, ChainReorgEvent] = {}
-        self.handled_headers: list[BlockHeaderResponseData] = []
+        self.indexed_validators_keys: dict[ValidatorIndex, str] = {}
+        self.exit_requests: ValidatorExitRequestsIndex = ValidatorExitRequestsIndex()
+        self.consolidation_requests: ConsolidationRequestsIndex = ConsolidationRequestsIndex()
+        self.chain_reorgs: EventChannel[ChainReorgEvent] = EventChannel()
+        self.new_head = threading.Event()
+        self.event_stream = EventStream(self.consensus)
+        self.event_stream.subscribe(EventTopic.CHAIN_REORG, self._on_chain_reorg)
+        self.event_stream.subscribe(EventTopic.HEAD, lambda _: self.new_head.set())
+        # Last handled headers for chain reorgs check
+        self.handled_headers: HeadersHistory = HeadersHistory(HANDLED_HEADERS_HISTORY_DEPTH)
+        self.slot_timer: SlotTimer | None = None
         self.disable_unexpected_exit_alerts: list[str] = variables.DISABLE_UNEXPECTED_EXIT_ALERTS
+        for handler in self.handlers:
+            handler.subscribe(self)
 
     def run(self, slots_range: Optional[str] = SLOTS_RANGE):
         def _run(slot_to_handle='head'):
             current_head = self._get_header_full_info(slot_to_handle)
             if not current_head:
                 logger.debug({'msg': f'No new head, waiting {CYCLE_SLEEP_IN_SECONDS} seconds'})
-                time.sleep(CYCLE_SLEEP_IN_SECONDS)
+                self._wait_for_new_head()
                 return
 
             if self.keys_updater is None or self.keys_updater.done():
                 self.keys_updater = self._update_user_keys(current_head)
             if self.validators_updater is None or self.validators_updater.done():
                 self.validators_updater = self._update_validators()
+            if self.state_metrics_updater is None or self.state_metrics_updater.done():
+                self.state_metrics_updater = self._update_state_metrics()
+            if self.execution_requests_updater is None or self.execution_requests_updater.done():
+                self.execution_requests_updater = self._update_execution_requests(current_head)
+            if self.contracts_updater is None or self.contracts_updater.done():
+                self.contracts_updater = self._update_contracts(current_head)
 
             logger.info({'msg': f'New head [{current_head.header.message.slot}]'})
 
@@ -76,8 +107,14 @@ class Watcher:
             self._handle_head(current_head)
 
             SLOT_NUMBER.set(current_head.header.message.slot)
-            logger.info({'msg': f'Head [{current_head.header.message.slot}] is handled'})
-            time.sleep(CYCLE_SLEEP_IN_SECONDS)
+            logger.info(
+                {
+                    'msg': f'Head [{current_head.header.message.slot}] is handled',
+                    # Copy, the record is written later in the logging thread
+                    'stages': dict(self.slot_timer.stages) if self.slot_timer else {},
+                }
+            )
+            self._wait_for_new_head()
 
         logger.info({'msg': f'Watcher started. Handlers: {[handler.__class__.__name__ for handler in self.handlers]}'})
 
@@ -91,25 +128,31 @@ class Watcher:
                         pass
                 self.keys_updater.result()
                 self.validators_updater.result()
+                self.execution_requests_updater.result()
         else:
             while True:
                 try:
-                    # Run event listener task very first time or re-run after error
-                    if self.chain_reorg_event_listener is None or not self.chain_reorg_event_listener.is_alive():
-                        self.chain_reorg_event_listener = self.listen_chain_reorg_event()
+                    # Run events listener very first time or re-run if it has been stopped
+                    self.event_stream.start()
                     _run()
                 except Exception as e:  # pylint: disable=broad-except
                     logger.error({'msg': 'Error while handling head', 'exception': str(e)})
                     time.sleep(CYCLE_SLEEP_IN_SECONDS)
 
-    @duration_meter()
+    @duration_meter(head_slot_exemplar)
     def _handle_head(self, head: FullBlockInfo):
+        timer = self.slot_timer
         tasks = [h.handle(self, head) for h in self.handlers]
+        if timer:
+            for handler, task in zip(self.handlers, tasks):
+                task.concurrent_future.add_done_callback(
+                    lambda _, name=handler.__class__.__name__: timer.mark('handler_finished', name)
+                )
         for t in tasks:
             t.result()
-        self.handled_headers.append(head)
-        if len(self.handled_headers) > KEEP_MAX_HANDLED_HEADERS_COUNT:
-            self.handled_headers.pop(0)
+        if timer:
+            timer.mark('handled')
+        self.handled_headers.append(HeaderSummary.from_block(head))
 
     @unsync
     @duration_meter()
@@ -149,7 +192,86 @@ class Watcher:
         if new_keys:
             self.user_keys = new_keys
             logger.warning({'msg': f'User keys updated: [{len(self.user_keys)}]'})
-        KEYS_SOURCE_SLOT_NUMBER.set(int(header.header.message.slot))
+        KEYS_SOURCE_SLOT_NUMBER.set(header.header.message.slot)
+
+    @unsync
+    @duration_meter()
+    def _update_execution_requests(self, head: FullBlockInfo) -> None:
+        """
+        Follow VEBO and ConsolidationBus events on every head,
+        so the handlers find the indexes up to date and don't scan EL on the alert path
+        """
+        if self.execution is None or not self.execution.lido_contracts.loaded.is_set():
+            return
+        block_number = head.message.body.execution_payload.block_number
+        try:
+            self.exit_requests.update(self, block_number)
+            self.consolidation_requests.update(self, block_number)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error({'msg': 'Can not update execution requests indexes', 'exception': str(e)})
+
+    @unsync
+    def _update_contracts(self, head: FullBlockInfo) -> None:
+        """
+        Lido locator could be upgraded, so contracts addresses are read again every
+        `CONTRACTS_REFRESH_INTERVAL_IN_EPOCHS`. Handlers keep using the old contracts until the new ones are checked.
+        OracleDaemonConfig updates are checked with the same interval
+        """
+        if self.execution is None or not self.execution.lido_contracts.loaded.is_set():
+            return
+        lido_contracts = self.execution.lido_contracts
+        epoch = head.message.slot // SLOTS_PER_EPOCH
+        block_number = head.message.body.execution_payload.block_number
+        if self.contracts_refreshed_epoch is None:
+            # Contracts have just been loaded
+            self.contracts_refreshed_epoch = epoch
+            self._check_config_updates(lido_contracts, block_number)
+            return
+        if epoch - self.contracts_refreshed_epoch < CONTRACTS_REFRESH_INTERVAL_IN_EPOCHS:
+            return
+        self.contracts_refreshed_epoch = epoch
+        try:
+            self._refresh_contracts(lido_contracts)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error({'msg': 'Can not refresh Lido contracts addresses', 'exception': str(e)})
+        self._check_config_updates(lido_contracts, block_number)
+
+    @staticmethod
+    def _check_config_updates(lido_contracts: LidoContracts, block_number: BlockNumber) -> None:
+        try:
+            lido_contracts.invalidate_updated_config(block_number)
+        except Exception as e:  # pylint: disable=broad-except
+            # Config values are forgotten anyway when their TTL expires
+            logger.error({'msg': 'Can not check OracleDaemonConfig updates', 'exception': str(e)})
+
+    @duration_meter()
+    def _refresh_contracts(self, lido_contracts: LidoContracts) -> None:
+        logger.info({'msg': 'Refreshing Lido contracts addresses'})
+        if lido_contracts.has_contract_address_changed():
+            logger.warning({'msg': 'Lido contracts addresses have been changed'})
+            self.exit_requests.reset_requests_counter()
+
+    @unsync
+    @duration_meter()
+    def _update_state_metrics(self) -> None:
+        """Report size of in-memory state to find out which structure is growing"""
+        for name, state in self.tracked_state().items():
+            STATE_ENTRIES.labels(name=name).set(len(state))
+            STATE_SIZE.labels(name=name).set(approximate_size(state))
+
+    def tracked_state(self) -> dict[str, Any]:
+        state: dict[str, Any] = {
+            'indexed_validators_keys': self.indexed_validators_keys,
+            'user_keys': self.user_keys,
+            'exit_requests': self.exit_requests.by_block,
+            'consolidation_requests': self.consolidation_requests.by_block,
+            'handled_headers': self.handled_headers,
+            'chain_reorgs': self.chain_reorgs,
+        }
+        for handler in self.handlers:
+            for name, handler_state in handler.tracked_state().items():
+                state[f'{handler.__class__.__name__}.{name}'] = handler_state
+        return state
 
     @duration_meter()
     def _get_header_full_info(self, slot=None) -> FullBlockInfo | None:
@@ -157,7 +279,7 @@ class Watcher:
             """Callback that will be called if we can't get valid head block from beacon node"""
             data, _ = result
             diff = time.time() - ((int(data['header']['message']['slot']) * SECONDS_PER_SLOT) + self.genesis_time)
-            if len(self.handled_headers) > 0 and diff > SECONDS_PER_SLOT * 4:
+            if self.handled_headers and diff > SECONDS_PER_SLOT * 4:
                 # head didn't change for more than 4 slots (1/8 of epoch)
                 return True
             return False
@@ -167,31 +289,30 @@ class Watcher:
         current_head = self.consensus.get_block_header(
             slot, force_use_fallback_callback if slot == 'head' else lambda _: False
         )
-        if len(self.handled_headers) > 0 and int(current_head.header.message.slot) == int(
-            self.handled_headers[-1].header.message.slot
-        ):
+        last_handled = self.handled_headers.last
+        if last_handled and current_head.header.message.slot == last_handled.slot:
             return None
+        timer = SlotTimer(self.genesis_time, current_head.header.message.slot, observe=slot == 'head')
+        timer.mark('header_received')
         current_block = self.consensus.get_block_details(current_head.root)
-        return FullBlockInfo(**asdict(current_head), **asdict(current_block))
+        full_info = FullBlockInfo(**asdict(current_head), **asdict(current_block))
+        timer.mark('block_decoded')
+        self.slot_timer = timer
+        return full_info
 
-    @thread_as_daemon
-    def listen_chain_reorg_event(self):
-        try:
-            logger.info({'msg': 'Listening chain reorg events'})
-            response = self.consensus.get_chain_reorg_stream()
-            client = sseclient.SSEClient(response)
-            for event in client.events():
-                logger.warning({'msg': f'Chain reorg event: {event.data}'})
-                event = ChainReorgEvent.from_response(**json.loads(event.data))
-                lock = threading.Lock()
-                with lock:
-                    self.chain_reorgs[event.slot] = event
-        except Exception as e:  # pylint: disable=broad-except
-            logger.error({'msg': 'Error while listening chain reorg events', 'exception': str(e)})
+    def _on_chain_reorg(self, event: ChainReorgEvent) -> None:
+        logger.warning({'msg': f'Chain reorg event: {event}'})
+        self.chain_reorgs.put(event)
+
+    def _wait_for_new_head(self) -> None:
+        """Sleep until the node reports a new head, but not longer than the cycle sleep"""
+        self.new_head.wait(CYCLE_SLEEP_IN_SECONDS)
+        self.new_head.clear()
 
-    @cached_property
-    def valid_withdrawal_addresses(self):
+    @property
+    def valid_withdrawal_addresses(self) -> set[str]:
         addresses = set(variables.VALID_WITHDRAWAL_ADDRESSES)
         if not addresses and self.execution:
-            addresses = {self.execution.lido_contracts.lido_locator.functions.withdrawalVault().call().lower()}
+            # Withdrawal vault address is cached for a while, it changes only with locator upgrade
+            addresses = {self.execution.lido_contracts.get_withdrawal_vault()}
         return addresses
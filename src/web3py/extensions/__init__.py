@@ -1,2 +1,2 @@
-from src.web3py.extensions.contracts import LidoContracts
+from src.web3py.extensions.contracts import ContractsNotLoaded, LidoContracts
 from src.web3py.extensions.fallback import FallbackProviderModule
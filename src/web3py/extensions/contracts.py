@@ -1,17 +1,45 @@
+import functools
 import json
 import logging
+import threading
+from collections import OrderedDict
 from time import sleep
-from typing import Optional
+from typing import Any, Optional, Sequence, cast
 
 from web3 import Web3
+from web3._utils.abi import get_abi_output_types
 from web3.contract import Contract
-from web3.exceptions import BadFunctionCallOutput
+from web3.contract.contract import ContractFunction
+from web3.exceptions import BadFunctionCallOutput, MismatchedABI
 from web3.module import Module
+from web3.types import BlockIdentifier
 
 from src import variables
+from src.typings import BlockNumber
+from src.utils.decorators import thread_as_daemon
+from src.utils.ttl_cache import TTLCache
 
 logger = logging.getLogger()
 
+# Batches of the last blocks are memoised, handlers and background updates read the same values for the head
+BATCH_CALL_MEMO_SIZE = 32
+
+EXIT_EVENTS_LOOKBACK_WINDOW_KEY = 'EXIT_EVENTS_LOOKBACK_WINDOW_IN_SLOTS'
+# Time to live of slow-changing values. OracleDaemonConfig values are also forgotten when their change is found
+CONFIG_TTL_IN_SECONDS = {
+    EXIT_EVENTS_LOOKBACK_WINDOW_KEY: 24 * 60 * 60,
+    'withdrawalVault': 60 * 60,
+}
+
+# Contracts that are set when loading is finished, `ContractsNotLoaded` is raised if they are accessed earlier
+LOADED_CONTRACTS = frozenset(
+    ('lido_locator', 'accounting_oracle', 'validators_exit_bus_oracle', 'oracle_daemon_config', 'multicall')
+)
+
+
+class ContractsNotLoaded(Exception):
+    pass
+
 
 class LidoContracts(Module):
     lido_locator: Contract
@@ -19,17 +47,34 @@ class LidoContracts(Module):
     validators_exit_bus_oracle: Contract
     oracle_daemon_config: Contract
     consolidation_bus: Optional[Contract] = None
+    multicall: Contract
 
     def __init__(self, w3: Web3):
         super().__init__(w3)
-        self._load_contracts()
+        self._batch_call_memo: OrderedDict[tuple, list[Any]] = OrderedDict()
+        self._batch_call_lock = threading.Lock()
+        self.config = TTLCache()
+        self._config_checked_block: BlockNumber | None = None
+        # Only exits and consolidations handlers need EL, so the watcher starts without waiting for contracts
+        self.loaded = threading.Event()
+        self._load_in_background()
+
+    def __getattr__(self, name):
+        # Called only for attributes that are not set yet
+        if name in LOADED_CONTRACTS:
+            # Not waited for, so the head handling is not stuck if EL is down
+            raise ContractsNotLoaded(f'Lido contracts are not loaded yet, can not get {name}')
+        raise AttributeError(f'{self.__class__.__name__!r} object has no attribute {name!r}')
 
     def __setattr__(self, key, value):
-        current_value = getattr(self, key, None)
+        self._log_address_change(key, value)
+        super().__setattr__(key, value)
+
+    def _log_address_change(self, key, value):
+        current_value = self.__dict__.get(key)
         if isinstance(current_value, Contract) and isinstance(value, Contract):
             if value.address != current_value.address:
                 logger.info({'msg': f'Contract {key} has been changed to {value.address}'})
-        super().__setattr__(key, value)
 
     def has_contract_address_changed(self) -> bool:
         addresses = [contract.address for contract in self.__dict__.values() if isinstance(contract, Contract)]
@@ -37,60 +82,182 @@ class LidoContracts(Module):
         new_addresses = [contract.address for contract in self.__dict__.values() if isinstance(contract, Contract)]
         return addresses != new_addresses
 
-    def _check_contracts(self):
+    @thread_as_daemon
+    def _load_in_background(self):
+        while True:
+            try:
+                self._load_contracts()
+            except Exception as e:  # pylint: disable=broad-except
+                logger.error({'msg': 'Can not load Lido contracts. Sleep for 1 minute.', 'exception': str(e)})
+                sleep(60)
+                continue
+            logger.info({'msg': 'Lido contracts are loaded'})
+            self.loaded.set()
+            return
+
+    def _check_contracts(self, contracts: dict[str, Contract]):
         """This is startup check that checks that contract are deployed and has valid implementation"""
         try:
-            self.accounting_oracle.functions.getContractVersion().call()
-            self.validators_exit_bus_oracle.functions.getContractVersion().call()
+            self.batch_call(
+                [
+                    contracts['accounting_oracle'].functions.getContractVersion(),
+                    contracts['validators_exit_bus_oracle'].functions.getContractVersion(),
+                ],
+                'latest',
+            )
         except BadFunctionCallOutput:
             logger.info(
                 {
                     'msg': 'getContractVersion method from accounting_oracle and validators_exit_bus_oracle '
                     'doesn\'t return any data. Probably addresses from Lido Locator refer to the wrong '
-                    'implementation or contracts don\'t exist. Sleep for 1 minute.'
+                    'implementation or contracts don\'t exist.'
                 }
             )
-            sleep(60)
-            self._load_contracts()
-        else:
-            return
+            raise
 
     def _load_contracts(self):
+        self.multicall = self._contract(variables.MULTICALL3_ADDRESS, 'Multicall3', decode_tuples=False)
+
         # Contract that stores all lido contract addresses
-        self.lido_locator = self.w3.eth.contract(
-            address=variables.LIDO_LOCATOR_ADDRESS,
-            abi=self.load_abi('LidoLocator'),
-            decode_tuples=True,
+        lido_locator = self._contract(variables.LIDO_LOCATOR_ADDRESS, 'LidoLocator')
+        # All the addresses are read in one request
+        accounting_oracle, validators_exit_bus_oracle, oracle_daemon_config = self.batch_call(
+            [
+                lido_locator.functions.accountingOracle(),
+                lido_locator.functions.validatorsExitBusOracle(),
+                lido_locator.functions.oracleDaemonConfig(),
+            ],
+            'latest',
         )
 
-        self.accounting_oracle = self.w3.eth.contract(
-            address=self.lido_locator.functions.accountingOracle().call(),
-            abi=self.load_abi('AccountingOracle'),
-            decode_tuples=True,
+        contracts = {
+            'lido_locator': lido_locator,
+            'accounting_oracle': self._contract(accounting_oracle, 'AccountingOracle'),
+            'validators_exit_bus_oracle': self._contract(validators_exit_bus_oracle, 'ValidatorsExitBusOracle'),
+            'oracle_daemon_config': self._contract(oracle_daemon_config, 'OracleDaemonConfig'),
+        }
+        if variables.LIDO_CONSOLIDATION_BUS_ADDRESS:
+            contracts['consolidation_bus'] = self._contract(
+                variables.LIDO_CONSOLIDATION_BUS_ADDRESS, 'ConsolidationBus'
+            )
+
+        self._check_contracts(contracts)
+        for name, contract in contracts.items():
+            self._log_address_change(name, contract)
+        # All the contracts are swapped at once, readers never see a mix of old and new ones
+        self.__dict__.update(contracts)
+        # Values could be read from the previous contracts
+        self.config.clear()
+        with self._batch_call_lock:
+            self._batch_call_memo.clear()
+
+    def _contract(self, address: str, abi_name: str, decode_tuples: bool = True) -> Contract:
+        return cast(
+            Contract,
+            self.w3.eth.contract(
+                address=Web3.to_checksum_address(address),
+                abi=self.load_abi(abi_name),
+                decode_tuples=decode_tuples,
+            ),
         )
 
-        self.validators_exit_bus_oracle = self.w3.eth.contract(
-            address=self.lido_locator.functions.validatorsExitBusOracle().call(),
-            abi=self.load_abi('ValidatorsExitBusOracle'),
-            decode_tuples=True,
+    def get_exit_requests_state(self, block_identifier: BlockIdentifier) -> tuple[int, int]:
+        """Total number of exit requests processed by VEBO at the block and lookback window for exit events in slots"""
+        (total_requests_processed,) = self.batch_call(
+            [self.validators_exit_bus_oracle.functions.getTotalRequestsProcessed()], block_identifier
         )
+        return total_requests_processed, self.get_exit_events_lookback_window()
 
-        self.oracle_daemon_config = self.w3.eth.contract(
-            address=self.lido_locator.functions.oracleDaemonConfig().call(),
-            abi=self.load_abi('OracleDaemonConfig'),
-            decode_tuples=True,
+    def get_exit_events_lookback_window(self) -> int:
+        return self.config.get(
+            EXIT_EVENTS_LOOKBACK_WINDOW_KEY,
+            lambda: Web3.to_int(self.oracle_daemon_config.functions.get(EXIT_EVENTS_LOOKBACK_WINDOW_KEY).call()),
+            CONFIG_TTL_IN_SECONDS[EXIT_EVENTS_LOOKBACK_WINDOW_KEY],
         )
 
-        if variables.LIDO_CONSOLIDATION_BUS_ADDRESS:
-            self.consolidation_bus = self.w3.eth.contract(
-                address=variables.LIDO_CONSOLIDATION_BUS_ADDRESS,
-                abi=self.load_abi('ConsolidationBus'),
-                decode_tuples=True,
+    def get_withdrawal_vault(self) -> str:
+        return self.config.get(
+            'withdrawalVault',
+            lambda: self.lido_locator.functions.withdrawalVault().call().lower(),
+            CONFIG_TTL_IN_SECONDS['withdrawalVault'],
+        )
+
+    def invalidate_updated_config(self, block_number: BlockNumber) -> None:
+        """Forget OracleDaemonConfig values that were set, updated or unset since the last check"""
+        if self._config_checked_block is None:
+            # Values read from now on are not older than this block
+            self._config_checked_block = block_number
+            return
+        if block_number <= self._config_checked_block:
+            return
+
+        logs = self.oracle_daemon_config.w3.eth.get_logs(
+            {
+                'address': self.oracle_daemon_config.address,
+                'fromBlock': self._config_checked_block + 1,
+                'toBlock': block_number,
+            }
+        )
+        events = self.oracle_daemon_config.events
+        for log in logs:
+            for event in (events.ConfigValueSet(), events.ConfigValueUpdated(), events.ConfigValueUnset()):
+                try:
+                    key = event.process_log(log)['args']['key']
+                except MismatchedABI:
+                    continue
+                logger.info({'msg': f'OracleDaemonConfig value {key} has been changed'})
+                self.config.invalidate(key)
+                break
+        self._config_checked_block = block_number
+
+    def batch_call(self, calls: Sequence[ContractFunction], block_identifier: BlockIdentifier) -> list[Any]:
+        """
+        Call view functions in one `eth_call` to Multicall3. Results for the exact block are memoised.
+        If the batch fails (e.g. Multicall3 is not deployed), functions are called one by one.
+        Single function is called directly, Multicall3 would only add encoding overhead
+        """
+        # pylint: disable=protected-access
+        encoded = [(call.address, call._encode_transaction_data()) for call in calls]
+        key = (block_identifier, tuple(encoded))
+        # Tags like `latest` point to different blocks over time
+        memoise = not isinstance(block_identifier, str) or block_identifier.startswith('0x')
+        with self._batch_call_lock:
+            if memoise and key in self._batch_call_memo:
+                self._batch_call_memo.move_to_end(key)
+                return self._batch_call_memo[key]
+
+        if len(calls) == 1:
+            values = [calls[0].call(block_identifier=block_identifier)]
+        else:
+            values = self._aggregate(calls, encoded, block_identifier)
+
+        if not memoise:
+            return values
+        with self._batch_call_lock:
+            self._batch_call_memo[key] = values
+            while len(self._batch_call_memo) > BATCH_CALL_MEMO_SIZE:
+                self._batch_call_memo.popitem(last=False)
+        return values
+
+    def _aggregate(
+        self, calls: Sequence[ContractFunction], encoded: Sequence[tuple[str, Any]], block_identifier: BlockIdentifier
+    ) -> list[Any]:
+        try:
+            results = self.multicall.functions.aggregate3([(address, False, data) for address, data in encoded]).call(
+                block_identifier=block_identifier
             )
+            return [self._decode_output(call, return_data) for call, (_, return_data) in zip(calls, results)]
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning({'msg': 'Multicall3 batch failed, calling functions one by one', 'exception': str(e)})
+            return [call.call(block_identifier=block_identifier) for call in calls]
 
-        self._check_contracts()
+    def _decode_output(self, call: ContractFunction, data: bytes) -> Any:
+        output = self.w3.codec.decode(get_abi_output_types(call.abi), data)
+        return output[0] if len(output) == 1 else output
 
     @staticmethod
+    @functools.cache
     def load_abi(abi_name: str, abi_path: str = './assets/'):
+        """ABI is parsed once, contracts share it"""
         with open(f'{abi_path}{abi_name}.json') as f:
             return json.load(f)
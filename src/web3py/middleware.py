@@ -1,15 +1,21 @@
 import json
 import logging
 import os
+import threading
+from collections import OrderedDict
 from typing import Any, Callable
 from urllib.parse import urlparse
 
+from eth_utils import function_abi_to_4byte_selector
 from requests import HTTPError, Response
 from web3 import Web3
+from web3.middleware.cache import SIMPLE_CACHE_RPC_WHITELIST
 from web3.types import RPCEndpoint, RPCResponse
 from web3_multi_provider import NoActiveProviderError
 
-from src.metrics.prometheus.basic import EL_REQUESTS_DURATION
+from src.metrics.prometheus.basic import EL_CACHE_REQUESTS, EL_REQUESTS_DURATION
+from src.utils.events_cache import REORG_SAFE_DEPTH
+from src.variables import EL_CACHE_MAX_SIZE
 
 logger = logging.getLogger(__name__)
 
@@ -24,48 +30,36 @@ def metrics_collector(
     EL_REQUESTS_DURATION - HISTOGRAM with requests time, count, response codes and request domain.
     """
 
-    contracts = []
+    selectors = _load_function_selectors('./assets/')
 
-    abi_dir = './assets/'
-    for filename in os.listdir(abi_dir):
-        with open(os.path.join(abi_dir, filename), 'r') as f:
-            try:
-                contracts.append(w3.eth.contract(abi=json.load(f)))
-            except json.JSONDecodeError:
-                pass
+    try:
+        # Works only with HTTP and Websocket Provider
+        domain = urlparse(getattr(w3.provider, "endpoint_uri")).netloc
+    except:
+        domain = 'unavailable'
 
     def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
-        try:
-            # Works only with HTTP and Websocket Provider
-            domain = urlparse(getattr(w3.provider, "endpoint_uri")).netloc
-        except:
-            domain = 'unavailable'
-
         call_method = ''
         call_to = ''
         if method == 'eth_call':
             args = params[0]
             call_to = args['to']
-            for contract in contracts:
-                try:
-                    call_method = contract.get_function_by_selector(args['data']).fn_name
-                except ValueError:
-                    pass
-                if call_method:
-                    break
-        if method == 'eth_getBalance':
+            data = args.get('data') or ''
+            selector = data[:10] if isinstance(data, str) else '0x' + bytes(data[:4]).hex()
+            call_method = selectors.get(selector.lower(), '')
+        elif method == 'eth_getBalance':
             call_to = params[0]
 
         with EL_REQUESTS_DURATION.time() as t:
             try:
                 response = make_request(method, params)
             except HTTPError as ex:
-                failed: Response = ex.response
+                failed: Response | None = ex.response
                 t.labels(
                     endpoint=method,
                     call_method=call_method,
                     call_to=call_to,
-                    code=failed.status_code,
+                    code=failed.status_code if failed is not None else None,
                     domain=domain,
                 )
                 raise ex
@@ -96,3 +90,97 @@ def metrics_collector(
             return response
 
     return middleware
+
+
+def _load_function_selectors(abi_dir: str) -> dict[str, str]:
+    """Map of 4-byte selectors (`0x` prefixed hex) to function names from all the ABIs in the directory"""
+    selectors = {}
+    for filename in os.listdir(abi_dir):
+        with open(os.path.join(abi_dir, filename), 'r') as f:
+            try:
+                abi = json.load(f)
+            except json.JSONDecodeError:
+                continue
+        for entry in abi:
+            if entry.get('type') == 'function':
+                selectors['0x' + function_abi_to_4byte_selector(entry).hex()] = entry['name']
+    return selectors
+
+
+def el_cache(
+    make_request: Callable[[RPCEndpoint, Any], RPCResponse],
+    _: Web3,
+) -> Callable[[RPCEndpoint, Any], RPCResponse]:
+    """
+    LRU cache of EL responses that can't change.
+    Besides `simple_cache_middleware` methods, `eth_call` and `eth_getLogs` are cached if they are requested
+    by block hash or for a block that is `REORG_SAFE_DEPTH` blocks behind the highest requested one.
+    Block tags like `latest` are never cached.
+
+    EL_CACHE_REQUESTS - COUNTER with cache hits and misses.
+    """
+    cache: OrderedDict[tuple[str, str], RPCResponse] = OrderedDict()
+    lock = threading.Lock()
+    # The highest block number requested so far, the head is not lower than it
+    highest_block = 0
+
+    def is_cacheable(method: RPCEndpoint, params: Any) -> bool:
+        nonlocal highest_block
+        if method in SIMPLE_CACHE_RPC_WHITELIST:
+            return True
+        if method == 'eth_call':
+            blocks = [params[1] if len(params) > 1 else None]
+        elif method == 'eth_getLogs':
+            log_filter = params[0]
+            if 'blockHash' in log_filter:
+                return True
+            blocks = [log_filter.get('fromBlock'), log_filter.get('toBlock')]
+        else:
+            return False
+        numbers = []
+        for block in blocks:
+            if (number := _block_number(block)) is None:
+                return False
+            numbers.append(number)
+        highest_block = max(highest_block, *numbers)
+        return all(number <= highest_block - REORG_SAFE_DEPTH for number in numbers)
+
+    def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+        if not is_cacheable(method, params):
+            return make_request(method, params)
+
+        key = (method, json.dumps(params, sort_keys=True, default=str))
+        with lock:
+            if key in cache:
+                cache.move_to_end(key)
+                EL_CACHE_REQUESTS.labels(result='hit').inc()
+                return cache[key]
+        EL_CACHE_REQUESTS.labels(result='miss').inc()
+
+        response = make_request(method, params)
+        # Null result is returned for unknown block or transaction, it could be known by the node later
+        if 'error' not in response and response.get('result') is not None:
+            with lock:
+                cache[key] = response
+                while len(cache) > EL_CACHE_MAX_SIZE:
+                    cache.popitem(last=False)
+        return response
+
+    return middleware
+
+
+def _block_number(block: Any) -> int | None:
+    """Number of the block from the request param. Block hash is treated as the oldest block, tags are not numbers"""
+    if isinstance(block, dict):
+        # EIP-1898 block param
+        if 'blockHash' in block:
+            return 0
+        block = block.get('blockNumber')
+    if isinstance(block, int):
+        return block
+    if isinstance(block, (str, bytes)):
+        block = block if isinstance(block, str) else '0x' + block.hex()
+        if block.startswith('0x'):
+            # 32 bytes hex is a block hash
+            return 0 if len(block) == 66 else int(block, 16)
+    return None
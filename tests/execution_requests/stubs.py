@@ -2,7 +2,12 @@ from dataclasses import dataclass
 from unittest.mock import MagicMock
 
 from src.keys_source.base_source import BaseSource, NamedKey
+from src.metrics.prometheus.slot_timer import SlotTimer
 from src.providers.alertmanager.typings import AlertBody
+from src.providers.consensus.events import EventStream
+from src.typings import ValidatorIndex
+from src.utils.consolidation import ConsolidationRequestsIndex
+from src.utils.exit import ValidatorExitRequestsIndex
 from tests.execution_requests.helpers import gen_random_address, gen_random_pubkey
 
 
@@ -31,20 +36,29 @@ class ConsensusClientStub:
     def __init__(self):
         self.get_validators = MagicMock(return_value=[])
         self.get_pending_consolidations = MagicMock(return_value=[])
+        self.get_pool_attester_slashings = MagicMock(return_value=[])
+        self.get_pool_proposer_slashings = MagicMock(return_value=[])
+        self.get_pool_voluntary_exits = MagicMock(return_value=[])
 
 
 class WatcherStub:
     alertmanager: AlertmanagerStub
     consensus: ConsensusClientStub
     user_keys: dict[str, NamedKey]
-    indexed_validators_keys: dict[str, str]
+    indexed_validators_keys: dict[ValidatorIndex, str]
     valid_withdrawal_addresses: set[str]
     keys_source: BaseSource
+    slot_timer: SlotTimer | None
+    event_stream: EventStream
+    genesis_time: int
+    disable_unexpected_exit_alerts: list[str]
+    exit_requests: ValidatorExitRequestsIndex
+    consolidation_requests: ConsolidationRequestsIndex
 
     def __init__(
         self,
         user_keys: dict[str, NamedKey] = None,
-        indexed_validators_keys: dict[str, str] = None,
+        indexed_validators_keys: dict[ValidatorIndex, str] = None,
         valid_withdrawal_addresses: set[str] = None,
         keys_source: BaseSource = None,
     ):
@@ -54,3 +68,9 @@ class WatcherStub:
         self.indexed_validators_keys = indexed_validators_keys or {}
         self.valid_withdrawal_addresses = valid_withdrawal_addresses or set()
         self.keys_source = keys_source or {}
+        self.slot_timer = None
+        self.event_stream = EventStream(self.consensus)
+        self.genesis_time = 0
+        self.disable_unexpected_exit_alerts = []
+        self.exit_requests = ValidatorExitRequestsIndex()
+        self.consolidation_requests = ConsolidationRequestsIndex()
@@ -9,6 +9,7 @@ from src.providers.consensus.typings import (
     ValidatorState,
     ValidatorStatus,
 )
+from src.typings import BlockNumber, ValidatorIndex
 from tests.execution_requests.helpers import gen_random_pubkey, create_sample_block, gen_random_address
 from tests.execution_requests.stubs import TestValidator, WatcherStub
 
@@ -53,7 +54,7 @@ def test_consolidation_foreign_source_and_target_pubkey_from_user_withdrawal_add
     assert withdrawal_address in general_user_withdrawal_address_alert.annotations.description
     assert random_source_pubkey in general_user_withdrawal_address_alert.annotations.description
     assert random_target_pubkey in general_user_withdrawal_address_alert.annotations.description
-    assert block.message.slot in general_user_withdrawal_address_alert.annotations.description
+    assert str(block.message.slot) in general_user_withdrawal_address_alert.annotations.description
 
     foreign_source_alert = next(
         (
@@ -124,7 +125,7 @@ def test_consolidation_foreign_source_pubkey_from_user_withdrawal_address(
     assert withdrawal_address in foreign_source_alert.annotations.description
     assert random_source_pubkey in foreign_source_alert.annotations.description
     assert user_validator_2.pubkey in foreign_source_alert.annotations.description
-    assert block.message.slot in foreign_source_alert.annotations.description
+    assert str(block.message.slot) in foreign_source_alert.annotations.description
 
 
 def test_consolidation_foreign_target_pubkey_from_user_withdrawal_address(
@@ -175,7 +176,7 @@ def test_consolidation_foreign_target_pubkey_from_user_withdrawal_address(
     assert withdrawal_address in foreign_target_alert.annotations.description
     assert user_validator_1.pubkey in foreign_target_alert.annotations.description
     assert random_target_pubkey in foreign_target_alert.annotations.description
-    assert block.message.slot in foreign_target_alert.annotations.description
+    assert str(block.message.slot) in foreign_target_alert.annotations.description
 
 
 def test_consolidation_foreign_withdrawal_address_user_source_pubkey(
@@ -209,7 +210,7 @@ def test_consolidation_foreign_withdrawal_address_user_source_pubkey(
     assert random_source_address in alert.annotations.description
     assert user_validator_1.pubkey in alert.annotations.description
     assert random_target_pubkey in alert.annotations.description
-    assert block.message.slot in alert.annotations.description
+    assert str(block.message.slot) in alert.annotations.description
 
 
 def test_consolidation_foreign_withdrawal_address_user_target_pubkey(
@@ -243,7 +244,7 @@ def test_consolidation_foreign_withdrawal_address_user_target_pubkey(
     assert random_source_address in alert.annotations.description
     assert random_source_pubkey in alert.annotations.description
     assert user_validator_2.pubkey in alert.annotations.description
-    assert block.message.slot in alert.annotations.description
+    assert str(block.message.slot) in alert.annotations.description
 
 
 def test_absence_of_alerts_on_foreign_validators(watcher: WatcherStub):
@@ -284,16 +285,16 @@ def test_over_deposit_consolidation(
     source_validator_state = ValidatorState(
         pubkey=user_validator_1.pubkey,
         withdrawal_credentials=withdrawal_address,
-        effective_balance='1024000000000',
+        effective_balance=1024000000000,
         slashed=False,
-        activation_eligibility_epoch='2048',
-        activation_epoch='2048',
-        exit_epoch='1000000000',
-        withdrawable_epoch='1000000000',
+        activation_eligibility_epoch=2048,
+        activation_epoch=2048,
+        exit_epoch=1000000000,
+        withdrawable_epoch=1000000000,
     )
     source_validator = Validator(
-        index='1',
-        balance='1025000000001',
+        index=1,
+        balance=1025000000001,
         status=ValidatorStatus.ACTIVE_EXITING,
         validator=source_validator_state,
     )
@@ -301,16 +302,16 @@ def test_over_deposit_consolidation(
     target_validator_state = ValidatorState(
         pubkey=user_validator_2.pubkey,
         withdrawal_credentials=withdrawal_address,
-        effective_balance='1024000000000',
+        effective_balance=1024000000000,
         slashed=False,
-        activation_eligibility_epoch='2048',
-        activation_epoch='2048',
-        exit_epoch='1000000000',
-        withdrawable_epoch='1000000000',
+        activation_eligibility_epoch=2048,
+        activation_epoch=2048,
+        exit_epoch=1000000000,
+        withdrawable_epoch=1000000000,
     )
     target_validator = Validator(
-        index='2',
-        balance='1024000000001',
+        index=2,
+        balance=1024000000001,
         status=ValidatorStatus.ACTIVE_ONGOING,
         validator=target_validator_state,
     )
@@ -318,8 +319,8 @@ def test_over_deposit_consolidation(
     watcher.consensus.get_validators = MagicMock(return_value=[source_validator, target_validator])
 
     pending_consolidation = PendingConsolidation(
-        source_index='1',
-        target_index='2',
+        source_index=1,
+        target_index=2,
     )
     watcher.consensus.get_pending_consolidations = MagicMock(return_value=[pending_consolidation])
 
@@ -355,13 +356,13 @@ def test_over_deposit_consolidation(
         == "⚠️⚠️⚠️ Total balance of source and target validators during consolidation is greater than 2049 ETH"
     )
     assert withdrawal_address in over_deposit_consolidation_alert.annotations.description
-    assert source_validator.index in over_deposit_consolidation_alert.annotations.description
+    assert str(source_validator.index) in over_deposit_consolidation_alert.annotations.description
     assert user_validator_1.pubkey in over_deposit_consolidation_alert.annotations.description
-    assert source_validator.balance in over_deposit_consolidation_alert.annotations.description
-    assert target_validator.index in over_deposit_consolidation_alert.annotations.description
+    assert str(source_validator.balance) in over_deposit_consolidation_alert.annotations.description
+    assert str(target_validator.index) in over_deposit_consolidation_alert.annotations.description
     assert user_validator_2.pubkey in over_deposit_consolidation_alert.annotations.description
-    assert target_validator.balance in over_deposit_consolidation_alert.annotations.description
-    assert block.message.slot in over_deposit_consolidation_alert.annotations.description
+    assert str(target_validator.balance) in over_deposit_consolidation_alert.annotations.description
+    assert str(block.message.slot) in over_deposit_consolidation_alert.annotations.description
 
     rejected_consolidation_alert = next(
         (
@@ -390,16 +391,16 @@ def test_invalid_source_consolidation_status(
     source_validator_state = ValidatorState(
         pubkey=user_validator_1.pubkey,
         withdrawal_credentials=withdrawal_address,
-        effective_balance='32000000000',
+        effective_balance=32000000000,
         slashed=False,
-        activation_eligibility_epoch='2048',
-        activation_epoch='2048',
-        exit_epoch='1000',
-        withdrawable_epoch='2000',
+        activation_eligibility_epoch=2048,
+        activation_epoch=2048,
+        exit_epoch=1000,
+        withdrawable_epoch=2000,
     )
     source_validator = Validator(
-        index='1',
-        balance='32000000000',
+        index=1,
+        balance=32000000000,
         status=ValidatorStatus.PENDING_INITIALIZED,
         validator=source_validator_state,
     )
@@ -407,16 +408,16 @@ def test_invalid_source_consolidation_status(
     target_validator_state = ValidatorState(
         pubkey=user_validator_2.pubkey,
         withdrawal_credentials=withdrawal_address,
-        effective_balance='32000000000',
+        effective_balance=32000000000,
         slashed=False,
-        activation_eligibility_epoch='2048',
-        activation_epoch='2048',
-        exit_epoch='1000000000',
-        withdrawable_epoch='1000000000',
+        activation_eligibility_epoch=2048,
+        activation_epoch=2048,
+        exit_epoch=1000000000,
+        withdrawable_epoch=1000000000,
     )
     target_validator = Validator(
-        index='2',
-        balance='32000000000',
+        index=2,
+        balance=32000000000,
         status=ValidatorStatus.ACTIVE_ONGOING,
         validator=target_validator_state,
     )
@@ -456,15 +457,15 @@ def test_invalid_source_consolidation_status(
         == "⚠️⚠️⚠️ Attempt to consolidate validators in unexpected status (source must be active_exiting, target must be active_ongoing)"
     )
     assert withdrawal_address in invalid_status_alert.annotations.description
-    assert source_validator.index in invalid_status_alert.annotations.description
+    assert str(source_validator.index) in invalid_status_alert.annotations.description
     assert user_validator_1.pubkey in invalid_status_alert.annotations.description
     assert source_validator.status in invalid_status_alert.annotations.description
-    assert source_validator.validator.exit_epoch in invalid_status_alert.annotations.description
-    assert target_validator.index in invalid_status_alert.annotations.description
+    assert str(source_validator.validator.exit_epoch) in invalid_status_alert.annotations.description
+    assert str(target_validator.index) in invalid_status_alert.annotations.description
     assert user_validator_2.pubkey in invalid_status_alert.annotations.description
     assert target_validator.status in invalid_status_alert.annotations.description
-    assert target_validator.validator.exit_epoch in invalid_status_alert.annotations.description
-    assert block.message.slot in invalid_status_alert.annotations.description
+    assert str(target_validator.validator.exit_epoch) in invalid_status_alert.annotations.description
+    assert str(block.message.slot) in invalid_status_alert.annotations.description
 
     rejected_consolidation_alert = next(
         (
@@ -493,16 +494,16 @@ def test_invalid_target_consolidation_status(
     source_validator_state = ValidatorState(
         pubkey=user_validator_1.pubkey,
         withdrawal_credentials=withdrawal_address,
-        effective_balance='32000000000',
+        effective_balance=32000000000,
         slashed=False,
-        activation_eligibility_epoch='2048',
-        activation_epoch='2048',
-        exit_epoch='1000000000',
-        withdrawable_epoch='1000000000',
+        activation_eligibility_epoch=2048,
+        activation_epoch=2048,
+        exit_epoch=1000000000,
+        withdrawable_epoch=1000000000,
     )
     source_validator = Validator(
-        index='1',
-        balance='32000000000',
+        index=1,
+        balance=32000000000,
         status=ValidatorStatus.ACTIVE_EXITING,
         validator=source_validator_state,
     )
@@ -510,16 +511,16 @@ def test_invalid_target_consolidation_status(
     target_validator_state = ValidatorState(
         pubkey=user_validator_2.pubkey,
         withdrawal_credentials=withdrawal_address,
-        effective_balance='32000000000',
+        effective_balance=32000000000,
         slashed=False,
-        activation_eligibility_epoch='2048',
-        activation_epoch='2048',
-        exit_epoch='1000',
-        withdrawable_epoch='2000',
+        activation_eligibility_epoch=2048,
+        activation_epoch=2048,
+        exit_epoch=1000,
+        withdrawable_epoch=2000,
     )
     target_validator = Validator(
-        index='2',
-        balance='32000000000',
+        index=2,
+        balance=32000000000,
         status=ValidatorStatus.ACTIVE_EXITING,
         validator=target_validator_state,
     )
@@ -559,15 +560,15 @@ def test_invalid_target_consolidation_status(
         == "⚠️⚠️⚠️ Attempt to consolidate validators in unexpected status (source must be active_exiting, target must be active_ongoing)"
     )
     assert withdrawal_address in invalid_status_alert.annotations.description
-    assert source_validator.index in invalid_status_alert.annotations.description
+    assert str(source_validator.index) in invalid_status_alert.annotations.description
     assert user_validator_1.pubkey in invalid_status_alert.annotations.description
     assert source_validator.status in invalid_status_alert.annotations.description
-    assert source_validator.validator.exit_epoch in invalid_status_alert.annotations.description
-    assert target_validator.index in invalid_status_alert.annotations.description
+    assert str(source_validator.validator.exit_epoch) in invalid_status_alert.annotations.description
+    assert str(target_validator.index) in invalid_status_alert.annotations.description
     assert user_validator_2.pubkey in invalid_status_alert.annotations.description
     assert target_validator.status in invalid_status_alert.annotations.description
-    assert target_validator.validator.exit_epoch in invalid_status_alert.annotations.description
-    assert block.message.slot in invalid_status_alert.annotations.description
+    assert str(target_validator.validator.exit_epoch) in invalid_status_alert.annotations.description
+    assert str(block.message.slot) in invalid_status_alert.annotations.description
 
     rejected_consolidation_alert = next(
         (
@@ -596,16 +597,16 @@ def test_slashed_source_consolidation(
     source_validator_state = ValidatorState(
         pubkey=user_validator_1.pubkey,
         withdrawal_credentials=withdrawal_address,
-        effective_balance='32000000000',
+        effective_balance=32000000000,
         slashed=True,
-        activation_eligibility_epoch='2048',
-        activation_epoch='2048',
-        exit_epoch='1000',
-        withdrawable_epoch='2000',
+        activation_eligibility_epoch=2048,
+        activation_epoch=2048,
+        exit_epoch=1000,
+        withdrawable_epoch=2000,
     )
     source_validator = Validator(
-        index='1',
-        balance='32000000000',
+        index=1,
+        balance=32000000000,
         status=ValidatorStatus.ACTIVE_SLASHED,
         validator=source_validator_state,
     )
@@ -613,16 +614,16 @@ def test_slashed_source_consolidation(
     target_validator_state = ValidatorState(
         pubkey=user_validator_2.pubkey,
         withdrawal_credentials=withdrawal_address,
-        effective_balance='32000000000',
+        effective_balance=32000000000,
         slashed=False,
-        activation_eligibility_epoch='2048',
-        activation_epoch='2048',
-        exit_epoch='1000000000',
-        withdrawable_epoch='1000000000',
+        activation_eligibility_epoch=2048,
+        activation_epoch=2048,
+        exit_epoch=1000000000,
+        withdrawable_epoch=1000000000,
     )
     target_validator = Validator(
-        index='2',
-        balance='32000000000',
+        index=2,
+        balance=32000000000,
         status=ValidatorStatus.ACTIVE_ONGOING,
         validator=target_validator_state,
     )
@@ -662,15 +663,15 @@ def test_slashed_source_consolidation(
         == "⚠️⚠️⚠️ Attempt to consolidate validators in unexpected status (source must be active_exiting, target must be active_ongoing)"
     )
     assert withdrawal_address in invalid_status_alert.annotations.description
-    assert source_validator.index in invalid_status_alert.annotations.description
+    assert str(source_validator.index) in invalid_status_alert.annotations.description
     assert user_validator_1.pubkey in invalid_status_alert.annotations.description
     assert source_validator.status in invalid_status_alert.annotations.description
-    assert source_validator.validator.exit_epoch in invalid_status_alert.annotations.description
-    assert target_validator.index in invalid_status_alert.annotations.description
+    assert str(source_validator.validator.exit_epoch) in invalid_status_alert.annotations.description
+    assert str(target_validator.index) in invalid_status_alert.annotations.description
     assert user_validator_2.pubkey in invalid_status_alert.annotations.description
     assert target_validator.status in invalid_status_alert.annotations.description
-    assert target_validator.validator.exit_epoch in invalid_status_alert.annotations.description
-    assert block.message.slot in invalid_status_alert.annotations.description
+    assert str(target_validator.validator.exit_epoch) in invalid_status_alert.annotations.description
+    assert str(block.message.slot) in invalid_status_alert.annotations.description
 
     rejected_consolidation_alert = next(
         (
@@ -699,16 +700,16 @@ def test_slashed_target_consolidation(
     source_validator_state = ValidatorState(
         pubkey=user_validator_1.pubkey,
         withdrawal_credentials=withdrawal_address,
-        effective_balance='32000000000',
+        effective_balance=32000000000,
         slashed=False,
-        activation_eligibility_epoch='2048',
-        activation_epoch='2048',
-        exit_epoch='1000000000',
-        withdrawable_epoch='1000000000',
+        activation_eligibility_epoch=2048,
+        activation_epoch=2048,
+        exit_epoch=1000000000,
+        withdrawable_epoch=1000000000,
     )
     source_validator = Validator(
-        index='1',
-        balance='32000000000',
+        index=1,
+        balance=32000000000,
         status=ValidatorStatus.ACTIVE_ONGOING,
         validator=source_validator_state,
     )
@@ -716,16 +717,16 @@ def test_slashed_target_consolidation(
     target_validator_state = ValidatorState(
         pubkey=user_validator_2.pubkey,
         withdrawal_credentials=withdrawal_address,
-        effective_balance='32000000000',
+        effective_balance=32000000000,
         slashed=True,
-        activation_eligibility_epoch='2048',
-        activation_epoch='2048',
-        exit_epoch='1000',
-        withdrawable_epoch='2000',
+        activation_eligibility_epoch=2048,
+        activation_epoch=2048,
+        exit_epoch=1000,
+        withdrawable_epoch=2000,
     )
     target_validator = Validator(
-        index='2',
-        balance='32000000000',
+        index=2,
+        balance=32000000000,
         status=ValidatorStatus.ACTIVE_SLASHED,
         validator=target_validator_state,
     )
@@ -765,15 +766,15 @@ def test_slashed_target_consolidation(
         == "⚠️⚠️⚠️ Attempt to consolidate validators in unexpected status (source must be active_exiting, target must be active_ongoing)"
     )
     assert withdrawal_address in invalid_status_alert.annotations.description
-    assert source_validator.index in invalid_status_alert.annotations.description
+    assert str(source_validator.index) in invalid_status_alert.annotations.description
     assert user_validator_1.pubkey in invalid_status_alert.annotations.description
     assert source_validator.status in invalid_status_alert.annotations.description
-    assert source_validator.validator.exit_epoch in invalid_status_alert.annotations.description
-    assert target_validator.index in invalid_status_alert.annotations.description
+    assert str(source_validator.validator.exit_epoch) in invalid_status_alert.annotations.description
+    assert str(target_validator.index) in invalid_status_alert.annotations.description
     assert user_validator_2.pubkey in invalid_status_alert.annotations.description
     assert target_validator.status in invalid_status_alert.annotations.description
-    assert target_validator.validator.exit_epoch in invalid_status_alert.annotations.description
-    assert block.message.slot in invalid_status_alert.annotations.description
+    assert str(target_validator.validator.exit_epoch) in invalid_status_alert.annotations.description
+    assert str(block.message.slot) in invalid_status_alert.annotations.description
 
     rejected_consolidation_alert = next(
         (
@@ -802,16 +803,16 @@ def test_rejected_consolidation(
     source_validator_state = ValidatorState(
         pubkey=user_validator_1.pubkey,
         withdrawal_credentials=withdrawal_address,
-        effective_balance='32000000000',
+        effective_balance=32000000000,
         slashed=False,
-        activation_eligibility_epoch='2048',
-        activation_epoch='2048',
-        exit_epoch='1000',
-        withdrawable_epoch='2000',
+        activation_eligibility_epoch=2048,
+        activation_epoch=2048,
+        exit_epoch=1000,
+        withdrawable_epoch=2000,
     )
     source_validator = Validator(
-        index='1',
-        balance='32000000000',
+        index=1,
+        balance=32000000000,
         status=ValidatorStatus.PENDING_INITIALIZED,
         validator=source_validator_state,
     )
@@ -819,16 +820,16 @@ def test_rejected_consolidation(
     target_validator_state = ValidatorState(
         pubkey=user_validator_2.pubkey,
         withdrawal_credentials=withdrawal_address,
-        effective_balance='32000000000',
+        effective_balance=32000000000,
         slashed=False,
-        activation_eligibility_epoch='2048',
-        activation_epoch='2048',
-        exit_epoch='1000000000',
-        withdrawable_epoch='1000000000',
+        activation_eligibility_epoch=2048,
+        activation_epoch=2048,
+        exit_epoch=1000000000,
+        withdrawable_epoch=1000000000,
     )
     target_validator = Validator(
-        index='2',
-        balance='32000000000',
+        index=2,
+        balance=32000000000,
         status=ValidatorStatus.ACTIVE_ONGOING,
         validator=target_validator_state,
     )
@@ -877,7 +878,7 @@ def test_rejected_consolidation(
     assert withdrawal_address in rejected_consolidation_alert.annotations.description
     assert user_validator_1.pubkey in rejected_consolidation_alert.annotations.description
     assert user_validator_2.pubkey in rejected_consolidation_alert.annotations.description
-    assert block.message.slot in rejected_consolidation_alert.annotations.description
+    assert str(block.message.slot) in rejected_consolidation_alert.annotations.description
 
 
 def test_no_rejected_consolidation_alert_for_accepted_consolidations(
@@ -896,16 +897,16 @@ def test_no_rejected_consolidation_alert_for_accepted_consolidations(
     source_validator_state = ValidatorState(
         pubkey=user_validator_1.pubkey,
         withdrawal_credentials=withdrawal_address,
-        effective_balance='32000000000',
+        effective_balance=32000000000,
         slashed=False,
-        activation_eligibility_epoch='2048',
-        activation_epoch='2048',
-        exit_epoch='1000000000',
-        withdrawable_epoch='1000000000',
+        activation_eligibility_epoch=2048,
+        activation_epoch=2048,
+        exit_epoch=1000000000,
+        withdrawable_epoch=1000000000,
     )
     source_validator = Validator(
-        index='1',
-        balance='32000000000',
+        index=1,
+        balance=32000000000,
         status=ValidatorStatus.ACTIVE_EXITING,
         validator=source_validator_state,
     )
@@ -913,16 +914,16 @@ def test_no_rejected_consolidation_alert_for_accepted_consolidations(
     target_validator_state = ValidatorState(
         pubkey=user_validator_2.pubkey,
         withdrawal_credentials=withdrawal_address,
-        effective_balance='32000000000',
+        effective_balance=32000000000,
         slashed=False,
-        activation_eligibility_epoch='2048',
-        activation_epoch='2048',
-        exit_epoch='1000000000',
-        withdrawable_epoch='1000000000',
+        activation_eligibility_epoch=2048,
+        activation_epoch=2048,
+        exit_epoch=1000000000,
+        withdrawable_epoch=1000000000,
     )
     target_validator = Validator(
-        index='2',
-        balance='32000000000',
+        index=2,
+        balance=32000000000,
         status=ValidatorStatus.ACTIVE_ONGOING,
         validator=target_validator_state,
     )
@@ -930,8 +931,8 @@ def test_no_rejected_consolidation_alert_for_accepted_consolidations(
     watcher.consensus.get_validators = MagicMock(return_value=[source_validator, target_validator])
 
     pending_consolidation = PendingConsolidation(
-        source_index='1',
-        target_index='2',
+        source_index=1,
+        target_index=2,
     )
     watcher.consensus.get_pending_consolidations = MagicMock(return_value=[pending_consolidation])
 
@@ -979,16 +980,16 @@ def test_consolidation_for_source_requested_to_exit_by_vebo(
     source_validator_state = ValidatorState(
         pubkey=user_validator_1.pubkey,
         withdrawal_credentials=withdrawal_address,
-        effective_balance='32000000000',
+        effective_balance=32000000000,
         slashed=False,
-        activation_eligibility_epoch='2048',
-        activation_epoch='2048',
-        exit_epoch='1000000000',
-        withdrawable_epoch='1000000000',
+        activation_eligibility_epoch=2048,
+        activation_epoch=2048,
+        exit_epoch=1000000000,
+        withdrawable_epoch=1000000000,
     )
     source_validator = Validator(
-        index='1',
-        balance='32000000000',
+        index=1,
+        balance=32000000000,
         status=ValidatorStatus.ACTIVE_EXITING,
         validator=source_validator_state,
     )
@@ -996,16 +997,16 @@ def test_consolidation_for_source_requested_to_exit_by_vebo(
     target_validator_state = ValidatorState(
         pubkey=user_validator_2.pubkey,
         withdrawal_credentials=withdrawal_address,
-        effective_balance='32000000000',
+        effective_balance=32000000000,
         slashed=False,
-        activation_eligibility_epoch='2048',
-        activation_epoch='2048',
-        exit_epoch='1000000000',
-        withdrawable_epoch='1000000000',
+        activation_eligibility_epoch=2048,
+        activation_epoch=2048,
+        exit_epoch=1000000000,
+        withdrawable_epoch=1000000000,
     )
     target_validator = Validator(
-        index='2',
-        balance='32000000000',
+        index=2,
+        balance=32000000000,
         status=ValidatorStatus.ACTIVE_ONGOING,
         validator=target_validator_state,
     )
@@ -1013,14 +1014,13 @@ def test_consolidation_for_source_requested_to_exit_by_vebo(
     watcher.consensus.get_validators = MagicMock(return_value=[source_validator, target_validator])
 
     pending_consolidation = PendingConsolidation(
-        source_index='1',
-        target_index='2',
+        source_index=1,
+        target_index=2,
     )
     watcher.consensus.get_pending_consolidations = MagicMock(return_value=[pending_consolidation])
 
     handler = ConsolidationHandler()
-    handler.last_requested_exit_indexes = {1000: set()}
-    handler.last_requested_exit_indexes[1000].add(1)
+    watcher.exit_requests.add(BlockNumber(1000), ValidatorIndex(1))
 
     task = handler.handle(watcher, block)
     task.result()
@@ -1052,9 +1052,9 @@ def test_consolidation_for_source_requested_to_exit_by_vebo(
         == "⚠️⚠️⚠️ Attempt to consolidate validators that were requested to exit by VEBO"
     )
     assert withdrawal_address in requested_to_exit_consolidation_alert.annotations.description
-    assert source_validator.index in requested_to_exit_consolidation_alert.annotations.description
+    assert str(source_validator.index) in requested_to_exit_consolidation_alert.annotations.description
     assert user_validator_1.pubkey in requested_to_exit_consolidation_alert.annotations.description
-    assert target_validator.index in requested_to_exit_consolidation_alert.annotations.description
+    assert str(target_validator.index) in requested_to_exit_consolidation_alert.annotations.description
     assert user_validator_2.pubkey in requested_to_exit_consolidation_alert.annotations.description
 
 
@@ -1074,16 +1074,16 @@ def test_consolidation_for_target_requested_to_exit_by_vebo(
     source_validator_state = ValidatorState(
         pubkey=user_validator_1.pubkey,
         withdrawal_credentials=withdrawal_address,
-        effective_balance='32000000000',
+        effective_balance=32000000000,
         slashed=False,
-        activation_eligibility_epoch='2048',
-        activation_epoch='2048',
-        exit_epoch='1000000000',
-        withdrawable_epoch='1000000000',
+        activation_eligibility_epoch=2048,
+        activation_epoch=2048,
+        exit_epoch=1000000000,
+        withdrawable_epoch=1000000000,
     )
     source_validator = Validator(
-        index='1',
-        balance='32000000000',
+        index=1,
+        balance=32000000000,
         status=ValidatorStatus.ACTIVE_EXITING,
         validator=source_validator_state,
     )
@@ -1091,16 +1091,16 @@ def test_consolidation_for_target_requested_to_exit_by_vebo(
     target_validator_state = ValidatorState(
         pubkey=user_validator_2.pubkey,
         withdrawal_credentials=withdrawal_address,
-        effective_balance='32000000000',
+        effective_balance=32000000000,
         slashed=False,
-        activation_eligibility_epoch='2048',
-        activation_epoch='2048',
-        exit_epoch='1000000000',
-        withdrawable_epoch='1000000000',
+        activation_eligibility_epoch=2048,
+        activation_epoch=2048,
+        exit_epoch=1000000000,
+        withdrawable_epoch=1000000000,
     )
     target_validator = Validator(
-        index='2',
-        balance='32000000000',
+        index=2,
+        balance=32000000000,
         status=ValidatorStatus.ACTIVE_ONGOING,
         validator=target_validator_state,
     )
@@ -1108,14 +1108,13 @@ def test_consolidation_for_target_requested_to_exit_by_vebo(
     watcher.consensus.get_validators = MagicMock(return_value=[source_validator, target_validator])
 
     pending_consolidation = PendingConsolidation(
-        source_index='1',
-        target_index='2',
+        source_index=1,
+        target_index=2,
     )
     watcher.consensus.get_pending_consolidations = MagicMock(return_value=[pending_consolidation])
 
     handler = ConsolidationHandler()
-    handler.last_requested_exit_indexes = {1000: set()}
-    handler.last_requested_exit_indexes[1000].add(2)
+    watcher.exit_requests.add(BlockNumber(1000), ValidatorIndex(2))
 
     task = handler.handle(watcher, block)
     task.result()
@@ -1147,9 +1146,9 @@ def test_consolidation_for_target_requested_to_exit_by_vebo(
         == "⚠️⚠️⚠️ Attempt to consolidate validators that were requested to exit by VEBO"
     )
     assert withdrawal_address in requested_to_exit_consolidation_alert.annotations.description
-    assert source_validator.index in requested_to_exit_consolidation_alert.annotations.description
+    assert str(source_validator.index) in requested_to_exit_consolidation_alert.annotations.description
     assert user_validator_1.pubkey in requested_to_exit_consolidation_alert.annotations.description
-    assert target_validator.index in requested_to_exit_consolidation_alert.annotations.description
+    assert str(target_validator.index) in requested_to_exit_consolidation_alert.annotations.description
     assert user_validator_2.pubkey in requested_to_exit_consolidation_alert.annotations.description
 
 
@@ -1189,4 +1188,4 @@ def test_group_similar_alerts(user_validator_1: TestValidator, watcher: WatcherS
     assert user_validator_1.pubkey in alert.annotations.description
     assert random_target_pubkey_1 in alert.annotations.description
     assert random_target_pubkey_2 in alert.annotations.description
-    assert block.message.slot in alert.annotations.description
+    assert str(block.message.slot) in alert.annotations.description
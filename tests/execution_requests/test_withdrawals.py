@@ -13,7 +13,7 @@ def test_user_validator_full_withdrawal_from_valid_source_triggers_info_alert(
             WithdrawalRequest(
                 source_address=withdrawal_address,
                 validator_pubkey=user_validator_1.pubkey,
-                amount='0',
+                amount=0,
             )
         ]
     )
@@ -30,7 +30,7 @@ def test_user_validator_full_withdrawal_from_valid_source_triggers_info_alert(
     assert user_validator_1.pubkey in alert.annotations.description
     assert withdrawal_address in alert.annotations.description
     assert '0' in alert.annotations.description
-    assert block.message.slot in alert.annotations.description
+    assert str(block.message.slot) in alert.annotations.description
 
 
 def test_user_validator_full_withdrawal_unknown_source_triggers_alert(
@@ -39,7 +39,7 @@ def test_user_validator_full_withdrawal_unknown_source_triggers_alert(
     random_address = gen_random_address()
     block = create_sample_block(
         withdrawals=[
-            WithdrawalRequest(source_address=random_address, validator_pubkey=user_validator_1.pubkey, amount='0')
+            WithdrawalRequest(source_address=random_address, validator_pubkey=user_validator_1.pubkey, amount=0)
         ]
     )
     handler = ElTriggeredExitHandler()
@@ -55,7 +55,7 @@ def test_user_validator_full_withdrawal_unknown_source_triggers_alert(
     assert user_validator_1.pubkey in alert.annotations.description
     assert random_address in alert.annotations.description
     assert '0' in alert.annotations.description
-    assert block.message.slot in alert.annotations.description
+    assert str(block.message.slot) in alert.annotations.description
 
 
 def test_user_validator_partial_withdrawal_from_valid_source(
@@ -63,7 +63,7 @@ def test_user_validator_partial_withdrawal_from_valid_source(
 ):
     block = create_sample_block(
         withdrawals=[
-            WithdrawalRequest(source_address=withdrawal_address, validator_pubkey=user_validator_1.pubkey, amount='32')
+            WithdrawalRequest(source_address=withdrawal_address, validator_pubkey=user_validator_1.pubkey, amount=32)
         ]
     )
     handler = ElTriggeredExitHandler()
@@ -79,13 +79,13 @@ def test_user_validator_partial_withdrawal_from_valid_source(
     assert user_validator_1.pubkey in alert.annotations.description
     assert withdrawal_address in alert.annotations.description
     assert '32' in alert.annotations.description
-    assert block.message.slot in alert.annotations.description
+    assert str(block.message.slot) in alert.annotations.description
 
 
 def test_no_alerts_for_foreign_validator(validator: TestValidator, watcher: WatcherStub):
     block = create_sample_block(
         withdrawals=[
-            WithdrawalRequest(source_address=gen_random_address(), validator_pubkey=validator.pubkey, amount='32')
+            WithdrawalRequest(source_address=gen_random_address(), validator_pubkey=validator.pubkey, amount=32)
         ]
     )
     handler = ElTriggeredExitHandler()
@@ -101,7 +101,7 @@ def test_from_user_withdrawal_address_for_foreign_validator_triggers_alert(
 ):
     block = create_sample_block(
         withdrawals=[
-            WithdrawalRequest(source_address=withdrawal_address, validator_pubkey=validator.pubkey, amount='32')
+            WithdrawalRequest(source_address=withdrawal_address, validator_pubkey=validator.pubkey, amount=32)
         ]
     )
     handler = ElTriggeredExitHandler()
@@ -119,7 +119,7 @@ def test_from_user_withdrawal_address_for_foreign_validator_triggers_alert(
     assert validator.pubkey in alert.annotations.description
     assert withdrawal_address in alert.annotations.description
     assert '32' in alert.annotations.description
-    assert block.message.slot in alert.annotations.description
+    assert str(block.message.slot) in alert.annotations.description
 
 
 def test_no_withdrawals_produce_no_alerts(watcher: WatcherStub):
@@ -184,12 +184,12 @@ def test_group_similar_partial_withdrawal_alerts():
             WithdrawalRequest(
                 source_address=addr1,
                 validator_pubkey=validator1.pubkey,
-                amount='10',
+                amount=10,
             ),
             WithdrawalRequest(
                 source_address=addr2,
                 validator_pubkey=validator2.pubkey,
-                amount='20',
+                amount=20,
             ),
         ]
     )
@@ -209,7 +209,7 @@ def test_group_similar_partial_withdrawal_alerts():
     assert 'test operator 2' in alert.annotations.description
     assert '10' in alert.annotations.description
     assert '20' in alert.annotations.description
-    assert block.message.slot in alert.annotations.description
+    assert str(block.message.slot) in alert.annotations.description
 
 
 def test_multiple_full_withdrawals_grouped_into_one_alert(user_validator_1: TestValidator, watcher: WatcherStub):
@@ -221,8 +221,8 @@ def test_multiple_full_withdrawals_grouped_into_one_alert(user_validator_1: Test
     watcher.valid_withdrawal_addresses.add(addr)
     block = create_sample_block(
         withdrawals=[
-            WithdrawalRequest(source_address=addr, validator_pubkey=user_validator_1.pubkey, amount='0'),
-            WithdrawalRequest(source_address=addr, validator_pubkey=second_validator.pubkey, amount='0'),
+            WithdrawalRequest(source_address=addr, validator_pubkey=user_validator_1.pubkey, amount=0),
+            WithdrawalRequest(source_address=addr, validator_pubkey=second_validator.pubkey, amount=0),
         ]
     )
 
@@ -237,7 +237,7 @@ def test_multiple_full_withdrawals_grouped_into_one_alert(user_validator_1: Test
     assert user_validator_1.pubkey in alert.annotations.description
     assert second_validator.pubkey in alert.annotations.description
     assert '0' in alert.annotations.description
-    assert block.message.slot in alert.annotations.description
+    assert str(block.message.slot) in alert.annotations.description
 
 
 def test_mixed_user_full_and_partial_generate_two_alerts(
@@ -250,8 +250,8 @@ def test_mixed_user_full_and_partial_generate_two_alerts(
     watcher.valid_withdrawal_addresses.add(withdrawal_address)
     block = create_sample_block(
         withdrawals=[
-            WithdrawalRequest(source_address=withdrawal_address, validator_pubkey=user_validator_1.pubkey, amount='0'),
-            WithdrawalRequest(source_address=withdrawal_address, validator_pubkey=second_validator.pubkey, amount='5'),
+            WithdrawalRequest(source_address=withdrawal_address, validator_pubkey=user_validator_1.pubkey, amount=0),
+            WithdrawalRequest(source_address=withdrawal_address, validator_pubkey=second_validator.pubkey, amount=5),
         ]
     )
 
@@ -270,7 +270,7 @@ def test_mixed_user_full_and_partial_generate_two_alerts(
     assert second_validator.pubkey in joined_desc
     assert '0' in joined_desc
     assert '5' in joined_desc
-    assert block.message.slot in joined_desc
+    assert str(block.message.slot) in joined_desc
 
 
 def test_mixed_unknown_source_for_our_and_our_source_for_foreign_generate_two_alerts(
@@ -280,8 +280,8 @@ def test_mixed_unknown_source_for_our_and_our_source_for_foreign_generate_two_al
     watcher.valid_withdrawal_addresses.add(withdrawal_address)
     block = create_sample_block(
         withdrawals=[
-            WithdrawalRequest(source_address=unknown_addr, validator_pubkey=user_validator_1.pubkey, amount='1'),
-            WithdrawalRequest(source_address=withdrawal_address, validator_pubkey=validator.pubkey, amount='2'),
+            WithdrawalRequest(source_address=unknown_addr, validator_pubkey=user_validator_1.pubkey, amount=1),
+            WithdrawalRequest(source_address=withdrawal_address, validator_pubkey=validator.pubkey, amount=2),
         ]
     )
 
@@ -312,4 +312,4 @@ def test_mixed_unknown_source_for_our_and_our_source_for_foreign_generate_two_al
     assert withdrawal_address in joined_desc
     assert '1' in joined_desc
     assert '2' in joined_desc
-    assert block.message.slot in joined_desc
+    assert str(block.message.slot) in joined_desc
@@ -0,0 +1,103 @@
+from unittest.mock import MagicMock
+
+import pytest
+from eth_abi import encode
+from web3 import Web3
+from web3.contract.contract import ContractFunction
+
+from src.web3py.extensions import contracts as contracts_module
+from src.web3py.extensions.contracts import LidoContracts
+
+ACCOUNTING_ORACLE = Web3.to_checksum_address('0x' + '11' * 20)
+LOCATOR = Web3.to_checksum_address('0x' + '22' * 20)
+
+
+@pytest.fixture
+def lido_contracts(monkeypatch) -> LidoContracts:
+    monkeypatch.setattr(LidoContracts, '_load_in_background', lambda self: None)
+    lido_contracts = LidoContracts(Web3())
+    lido_contracts.multicall = MagicMock()
+    lido_contracts.multicall.functions.aggregate3.return_value.call.return_value = [
+        (True, encode(['address'], [ACCOUNTING_ORACLE])),
+        (True, encode(['uint256', 'uint256'], [10, 20])),
+    ]
+    return lido_contracts
+
+
+def calls(lido_contracts: LidoContracts) -> list[ContractFunction]:
+    # pylint: disable=protected-access
+    return [
+        lido_contracts._contract(LOCATOR, 'LidoLocator').functions.accountingOracle(),
+        lido_contracts._contract(ACCOUNTING_ORACLE, 'AccountingOracle').functions.getCurrentFrame(),
+    ]
+
+
+def aggregate3_calls(lido_contracts: LidoContracts) -> int:
+    return lido_contracts.multicall.functions.aggregate3.return_value.call.call_count
+
+
+def test_outputs_are_decoded(lido_contracts):
+    accounting_oracle, frame = lido_contracts.batch_call(calls(lido_contracts), 100)
+
+    # Single output is unwrapped, multiple outputs are returned as is
+    assert accounting_oracle == ACCOUNTING_ORACLE
+    assert frame == (10, 20)
+    batch = lido_contracts.multicall.functions.aggregate3.call_args.args[0]
+    assert [(address, allow_failure) for address, allow_failure, _ in batch] == [
+        (LOCATOR, False),
+        (ACCOUNTING_ORACLE, False),
+    ]
+    assert lido_contracts.multicall.functions.aggregate3.return_value.call.call_args.kwargs == {'block_identifier': 100}
+
+
+def test_functions_are_called_one_by_one_if_batch_failed(lido_contracts, monkeypatch):
+    lido_contracts.multicall.functions.aggregate3.return_value.call.side_effect = ValueError('execution reverted')
+    call = MagicMock(side_effect=[ACCOUNTING_ORACLE, [10, 20]])
+    monkeypatch.setattr(ContractFunction, 'call', call)
+
+    assert lido_contracts.batch_call(calls(lido_contracts), 100) == [ACCOUNTING_ORACLE, [10, 20]]
+    assert [c.kwargs for c in call.call_args_list] == [{'block_identifier': 100}] * 2
+
+
+def test_results_for_the_block_are_memoised(lido_contracts):
+    first = lido_contracts.batch_call(calls(lido_contracts), 100)
+    second = lido_contracts.batch_call(calls(lido_contracts), 100)
+
+    assert first == second
+    assert aggregate3_calls(lido_contracts) == 1
+
+    lido_contracts.batch_call(calls(lido_contracts), 101)
+
+    assert aggregate3_calls(lido_contracts) == 2
+
+
+def test_least_recently_used_results_are_evicted(lido_contracts, monkeypatch):
+    monkeypatch.setattr(contracts_module, 'BATCH_CALL_MEMO_SIZE', 2)
+
+    for block in (100, 101, 100, 102):
+        lido_contracts.batch_call(calls(lido_contracts), block)
+    assert aggregate3_calls(lido_contracts) == 3
+
+    lido_contracts.batch_call(calls(lido_contracts), 100)
+    assert aggregate3_calls(lido_contracts) == 3
+
+    lido_contracts.batch_call(calls(lido_contracts), 101)
+    assert aggregate3_calls(lido_contracts) == 4
+
+
+def test_results_for_latest_block_are_not_memoised(lido_contracts):
+    lido_contracts.batch_call(calls(lido_contracts), 'latest')
+    lido_contracts.batch_call(calls(lido_contracts), 'latest')
+
+    assert aggregate3_calls(lido_contracts) == 2
+
+
+def test_single_function_is_called_directly(lido_contracts, monkeypatch):
+    call = MagicMock(return_value=ACCOUNTING_ORACLE)
+    monkeypatch.setattr(ContractFunction, 'call', call)
+
+    for _ in range(2):
+        assert lido_contracts.batch_call(calls(lido_contracts)[:1], 100) == [ACCOUNTING_ORACLE]
+
+    assert call.call_count == 1
+    assert aggregate3_calls(lido_contracts) == 0
@@ -0,0 +1,33 @@
+import threading
+
+from src.utils.channel import EventChannel
+
+
+def test_drain_returns_items_in_order():
+    channel: EventChannel[int] = EventChannel()
+    for i in range(3):
+        channel.put(i)
+
+    assert len(channel) == 3
+    assert channel.drain() == [0, 1, 2]
+    assert len(channel) == 0
+    assert not channel.drain()
+
+
+def test_concurrent_producer_loses_nothing():
+    channel: EventChannel[int] = EventChannel()
+    count = 10_000
+
+    def produce():
+        for i in range(count):
+            channel.put(i)
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    received = []
+    while producer.is_alive():
+        received.extend(channel.drain())
+    producer.join()
+    received.extend(channel.drain())
+
+    assert received == list(range(count))
@@ -0,0 +1,57 @@
+from unittest.mock import MagicMock
+
+from eth_abi import encode
+
+from src.keys_source.keys_api_source import KeysApiSource
+from src.typings import BlockNumber
+from src.utils.consolidation import BATCH_TUPLE_TYPE, ConsolidationRequestsIndex
+from tests.execution_requests.helpers import gen_random_pubkey
+
+
+def watcher_with_events(events_by_block: dict[int, list[tuple[list[str], str]]]):
+    def get_logs(fromBlock, toBlock):  # pylint: disable=invalid-name
+        return [
+            {'blockNumber': block, 'args': {'batchData': encode([BATCH_TUPLE_TYPE], [batches_to_bytes(batches)])}}
+            for block, batches in events_by_block.items()
+            if fromBlock <= block <= toBlock
+        ]
+
+    watcher = MagicMock()
+    watcher.keys_source = MagicMock(spec=KeysApiSource, modules_operators_dict={'module': ['operator']})
+    watcher.execution.lido_contracts.get_exit_events_lookback_window.return_value = 100
+    watcher.execution.lido_contracts.consolidation_bus.events.RequestsAdded.get_logs = MagicMock(side_effect=get_logs)
+    return watcher
+
+
+def batches_to_bytes(batches: list[tuple[list[str], str]]):
+    return [([bytes.fromhex(s[2:]) for s in sources], bytes.fromhex(target[2:])) for sources, target in batches]
+
+
+def test_update_reads_only_new_blocks():
+    source, target = gen_random_pubkey(), gen_random_pubkey()
+    watcher = watcher_with_events({950: [([source], target)]})
+    get_logs = watcher.execution.lido_contracts.consolidation_bus.events.RequestsAdded.get_logs
+    index = ConsolidationRequestsIndex()
+
+    index.update(watcher, BlockNumber(1000))
+    index.update(watcher, BlockNumber(1000))
+
+    assert get_logs.call_count == 1
+    assert source in index and target in index
+
+    index.update(watcher, BlockNumber(1001))
+
+    assert get_logs.call_count == 2
+    assert get_logs.call_args.kwargs == {'fromBlock': 1001, 'toBlock': 1001}
+
+
+def test_outdated_requests_are_forgotten():
+    source, target = gen_random_pubkey(), gen_random_pubkey()
+    watcher = watcher_with_events({950: [([source], target)]})
+    index = ConsolidationRequestsIndex()
+
+    index.update(watcher, BlockNumber(1000))
+    index.update(watcher, BlockNumber(1051))
+
+    assert len(index) == 0
+    assert source not in index and target not in index
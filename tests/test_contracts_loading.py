@@ -0,0 +1,162 @@
+# pylint: disable=protected-access
+from unittest.mock import MagicMock
+
+import pytest
+from web3 import Web3
+
+from src.handlers.consolidation import ConsolidationHandler
+from src.handlers.el_triggered_exit import ElTriggeredExitHandler
+from src.handlers.exit import ExitsHandler
+from src.keys_source.base_source import NamedKey
+from src.providers.consensus.typings import (
+    BlockVoluntaryExit,
+    ConsolidationRequest,
+    PendingConsolidation,
+    ValidatorStatus,
+    VoluntaryExit,
+    WithdrawalRequest,
+)
+from src.typings import BlockNumber, SlotNumber, ValidatorIndex
+from src.web3py.extensions import contracts as contracts_module
+from src.web3py.extensions.contracts import ContractsNotLoaded, LidoContracts
+from tests.execution_requests.helpers import (
+    create_sample_block,
+    gen_random_address,
+    gen_random_pubkey,
+)
+from tests.execution_requests.stubs import WatcherStub
+
+
+def test_contracts_are_loaded_again_after_failure(monkeypatch):
+    sleep = MagicMock()
+    monkeypatch.setattr(contracts_module, 'sleep', sleep)
+    load_contracts = MagicMock(side_effect=[ConnectionError('EL is down'), None])
+    monkeypatch.setattr(LidoContracts, '_load_contracts', load_contracts)
+
+    lido_contracts = LidoContracts(Web3())
+
+    assert lido_contracts.loaded.wait(5)
+    assert load_contracts.call_count == 2
+    sleep.assert_called_once_with(60)
+
+
+def test_contracts_are_not_waited_for_until_loaded(monkeypatch):
+    monkeypatch.setattr(LidoContracts, '_load_in_background', lambda self: None)
+    lido_contracts = LidoContracts(Web3())
+
+    with pytest.raises(ContractsNotLoaded):
+        lido_contracts.get_withdrawal_vault()
+    with pytest.raises(ContractsNotLoaded):
+        lido_contracts.get_exit_requests_state(100)
+    assert lido_contracts.consolidation_bus is None
+
+
+@pytest.fixture
+def watcher() -> WatcherStub:
+    key = gen_random_pubkey()
+    watcher = WatcherStub(
+        user_keys={key: NamedKey(key=key, operatorName='Operator', operatorIndex='1', moduleIndex='1')},
+        indexed_validators_keys={ValidatorIndex(0): key},
+    )
+    watcher.exit_requests = MagicMock()
+    watcher.exit_requests.update.side_effect = ContractsNotLoaded
+    return watcher
+
+
+def voluntary_exit(index: int) -> BlockVoluntaryExit:
+    return BlockVoluntaryExit(message=VoluntaryExit(validator_index=ValidatorIndex(index)), signature='0x')
+
+
+def alert_names(watcher: WatcherStub) -> list[str]:
+    # Alert name is suffixed with the timestamp
+    return [alert.labels.alertname.rstrip('0123456789.') for alert in watcher.alertmanager.sent_alerts]
+
+
+def test_exits_are_alerted_as_unverified_until_contracts_are_loaded(watcher):
+    handler = ExitsHandler()
+    block = create_sample_block()
+    block.message.body.voluntary_exits = [voluntary_exit(0)]
+
+    handler.handle(watcher, block).result()
+
+    assert alert_names(watcher) == ['HeadWatcherUserUnexpectedExit']
+    assert 'Lido contracts are not loaded yet' in watcher.alertmanager.sent_alerts[0].annotations.description
+
+
+def test_pool_exits_are_alerted_as_unverified_until_contracts_are_loaded(watcher):
+    handler = ExitsHandler()
+
+    handler._process_pool_exits(watcher, SlotNumber(32), BlockNumber(31), [voluntary_exit(0)])
+
+    assert alert_names(watcher) == ['HeadWatcherUserUnexpectedExitInPool']
+    assert 'Lido contracts are not loaded yet' in watcher.alertmanager.sent_alerts[0].annotations.description
+    assert handler.exits_seen_in_pool == {0}
+
+
+@pytest.fixture
+def withdrawal_addresses(monkeypatch) -> dict[str, set[str] | None]:
+    """Valid withdrawal addresses are not known until the test sets them"""
+    addresses: dict[str, set[str] | None] = {'value': None}
+
+    def valid_withdrawal_addresses(_):
+        if addresses['value'] is None:
+            raise ContractsNotLoaded
+        return addresses['value']
+
+    monkeypatch.setattr(WatcherStub, 'valid_withdrawal_addresses', property(valid_withdrawal_addresses), raising=False)
+    return addresses
+
+
+def test_withdrawal_requests_are_deferred_until_contracts_are_loaded(watcher, withdrawal_addresses):
+    address = gen_random_address()
+    handler = ElTriggeredExitHandler()
+    block = create_sample_block(
+        withdrawals=[
+            WithdrawalRequest(source_address=address, validator_pubkey=next(iter(watcher.user_keys)), amount=0)
+        ]
+    )
+
+    handler.handle(watcher, block).result()
+    handler.handle(watcher, create_sample_block()).result()
+
+    assert not watcher.alertmanager.sent_alerts
+    assert list(handler.deferred_blocks) == [block]
+
+    withdrawal_addresses['value'] = {address}
+    handler.handle(watcher, create_sample_block()).result()
+
+    assert alert_names(watcher) == ['HeadWatcherFullELWithdrawalObserved']
+    assert not handler.deferred_blocks
+
+
+def test_consolidations_are_deferred_until_exit_requests_are_read(watcher, withdrawal_addresses):
+    address = gen_random_address()
+    withdrawal_addresses['value'] = {address}
+    source, target = gen_random_pubkey(), next(iter(watcher.user_keys))
+    watcher.user_keys[source] = NamedKey(key=source, operatorName='Operator', operatorIndex='1', moduleIndex='1')
+    watcher.consensus.get_validators.return_value = [
+        MagicMock(index=1, balance=0, status=ValidatorStatus.ACTIVE_EXITING, validator=MagicMock(pubkey=source)),
+        MagicMock(index=2, balance=0, status=ValidatorStatus.ACTIVE_ONGOING, validator=MagicMock(pubkey=target)),
+    ]
+    watcher.consensus.get_pending_consolidations = MagicMock(
+        return_value=[PendingConsolidation(source_index=1, target_index=2)]
+    )
+    watcher.exit_requests.indexes = {1}
+    handler = ConsolidationHandler()
+    block = create_sample_block(
+        consolidations=[ConsolidationRequest(source_address=address, source_pubkey=source, target_pubkey=target)]
+    )
+
+    handler.handle(watcher, block).result()
+
+    assert not watcher.alertmanager.sent_alerts
+    assert list(handler.deferred_blocks) == [block]
+
+    watcher.exit_requests.update.side_effect = None
+    handler.handle(watcher, create_sample_block()).result()
+
+    assert set(alert_names(watcher)) == {
+        'HeadWatcherConsolidationSourceWithdrawalAddress',
+        'HeadWatcherConsolidationRequestedToExit',
+    }
+    assert not handler.deferred_blocks
@@ -0,0 +1,88 @@
+# pylint: disable=protected-access
+from dataclasses import replace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.typings import BlockNumber, SlotNumber, ValidatorIndex
+from src.utils.exit import ValidatorExitRequestsIndex
+from src.variables import CONTRACTS_REFRESH_INTERVAL_IN_EPOCHS
+from src.watcher import Watcher
+from tests.execution_requests.helpers import create_sample_block
+
+
+@pytest.fixture
+def watcher() -> Watcher:
+    # Consensus client is not needed to refresh contracts
+    watcher = Watcher.__new__(Watcher)
+    watcher.execution = MagicMock()
+    watcher.execution.lido_contracts.has_contract_address_changed.return_value = False
+    watcher.contracts_refreshed_epoch = None
+    watcher.exit_requests = ValidatorExitRequestsIndex()
+    return watcher
+
+
+def block_at(epoch: int):
+    block = create_sample_block()
+    return replace(block, message=replace(block.message, slot=SlotNumber(epoch * 32)))
+
+
+def test_contracts_are_refreshed_every_interval(watcher):
+    for epoch in range(10, 10 + 2 * CONTRACTS_REFRESH_INTERVAL_IN_EPOCHS + 1):
+        watcher._update_contracts(block_at(epoch)).result()
+
+    assert watcher.execution.lido_contracts.has_contract_address_changed.call_count == 2
+
+
+def test_config_updates_are_checked_every_interval(watcher):
+    for epoch in range(10, 10 + 2 * CONTRACTS_REFRESH_INTERVAL_IN_EPOCHS + 1):
+        watcher._update_contracts(block_at(epoch)).result()
+
+    # First call only remembers the block config values are read from
+    assert watcher.execution.lido_contracts.invalidate_updated_config.call_count == 3
+
+
+def test_config_check_error_is_not_raised(watcher):
+    watcher.execution.lido_contracts.invalidate_updated_config.side_effect = ConnectionError('EL is down')
+
+    for epoch in (10, 10 + CONTRACTS_REFRESH_INTERVAL_IN_EPOCHS):
+        watcher._update_contracts(block_at(epoch)).result()
+
+    assert watcher.execution.lido_contracts.has_contract_address_changed.call_count == 1
+
+
+def test_contracts_are_not_refreshed_until_loaded(watcher):
+    watcher.execution.lido_contracts.loaded.is_set.return_value = False
+
+    for epoch in (10, 10 + CONTRACTS_REFRESH_INTERVAL_IN_EPOCHS):
+        watcher._update_contracts(block_at(epoch)).result()
+
+    assert watcher.contracts_refreshed_epoch is None
+    watcher.execution.lido_contracts.has_contract_address_changed.assert_not_called()
+    watcher.execution.lido_contracts.invalidate_updated_config.assert_not_called()
+
+
+def test_exit_requests_are_kept_when_addresses_changed(watcher):
+    watcher.exit_requests.add(BlockNumber(100), ValidatorIndex(1))
+    watcher.exit_requests.last_total_requests_processed = 10
+    watcher.exit_requests.last_block_number = BlockNumber(200)
+    exit_requests = watcher.exit_requests
+    watcher.execution.lido_contracts.has_contract_address_changed.return_value = True
+
+    for epoch in (10, 10 + CONTRACTS_REFRESH_INTERVAL_IN_EPOCHS):
+        watcher._update_contracts(block_at(epoch)).result()
+
+    assert watcher.exit_requests is exit_requests
+    assert ValidatorIndex(1) in watcher.exit_requests
+    assert watcher.exit_requests.last_block_number == 200
+    # Requests counter of the new VEBO starts over
+    assert watcher.exit_requests.last_total_requests_processed == 0
+
+
+def test_refresh_error_is_not_raised(watcher):
+    watcher.execution.lido_contracts.has_contract_address_changed.side_effect = ConnectionError('EL is down')
+
+    for epoch in (10, 10 + CONTRACTS_REFRESH_INTERVAL_IN_EPOCHS):
+        watcher._update_contracts(block_at(epoch)).result()
+
+    assert watcher.contracts_refreshed_epoch == 10 + CONTRACTS_REFRESH_INTERVAL_IN_EPOCHS
@@ -0,0 +1,74 @@
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+from src.providers.consensus.typings import Validator
+from src.utils.dataclass import FromResponse, Nested
+
+
+@dataclass
+class Leaf(FromResponse):
+    value: str
+
+
+@dataclass(slots=True)
+class Tree(Nested, FromResponse):
+    leaf: Leaf
+    leaves: list[Leaf]
+    optional_leaf: Optional[Leaf] = None
+
+
+def test_from_response_ignores_extra_fields():
+    assert Leaf.from_response(value='1', extra='2') == Leaf(value='1')
+
+
+def test_nested_dataclasses_are_decoded():
+    tree = Tree.from_response(
+        leaf={'value': '1', 'extra': 'x'},
+        leaves=[{'value': '2'}, Leaf(value='3')],
+        extra='y',
+    )
+
+    assert tree == Tree(leaf=Leaf(value='1'), leaves=[Leaf(value='2'), Leaf(value='3')], optional_leaf=None)
+    assert not hasattr(tree, '__dict__'), 'Slots should be kept'
+
+    tree = Tree.from_response(leaf={'value': '1'}, leaves=[], optional_leaf={'value': '4'})
+    assert tree.optional_leaf == Leaf(value='4')
+
+
+def test_validator_round_trip():
+    response = {
+        'index': '1',
+        'balance': '32000000000',
+        'status': 'active_ongoing',
+        'validator': {
+            'pubkey': '0x01',
+            'withdrawal_credentials': '0x02',
+            'effective_balance': '32000000000',
+            'slashed': False,
+            'activation_eligibility_epoch': '0',
+            'activation_epoch': '0',
+            'exit_epoch': '18446744073709551615',
+            'withdrawable_epoch': '18446744073709551615',
+        },
+    }
+
+    validator = Validator.from_response(**response)
+
+    assert validator.validator.pubkey == '0x01'
+    assert validator.index == 1
+    assert validator.validator.exit_epoch == 2**64 - 1
+    assert asdict(validator) == {
+        'index': 1,
+        'balance': 32000000000,
+        'status': 'active_ongoing',
+        'validator': {
+            'pubkey': '0x01',
+            'withdrawal_credentials': '0x02',
+            'effective_balance': 32000000000,
+            'slashed': False,
+            'activation_eligibility_epoch': 0,
+            'activation_epoch': 0,
+            'exit_epoch': 2**64 - 1,
+            'withdrawable_epoch': 2**64 - 1,
+        },
+    }
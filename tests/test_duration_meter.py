@@ -0,0 +1,57 @@
+import pytest
+
+from src.metrics.prometheus.basic import FUNCTIONS_DURATION, Status
+from src.metrics.prometheus.duration_meter import duration_meter
+
+
+def observed_exemplars(name: str, status: Status) -> list[dict[str, str]]:
+    return [
+        sample.exemplar.labels
+        for metric in FUNCTIONS_DURATION.collect()
+        for sample in metric.samples
+        if sample.name.endswith('_bucket')
+        and sample.labels['name'] == name
+        and sample.labels['status'] == str(status)
+        and sample.exemplar is not None
+    ]
+
+
+def observed_count(name: str, status: Status) -> float:
+    return next(
+        sample.value
+        for metric in FUNCTIONS_DURATION.collect()
+        for sample in metric.samples
+        if sample.name.endswith('_count') and sample.labels == {'name': name, 'status': str(status)}
+    )
+
+
+def test_duration_is_observed_with_exemplar():
+    @duration_meter(lambda slot: {'slot': str(slot)})
+    def handle(slot: int) -> int:
+        return slot
+
+    assert handle(10) == 10
+
+    name = f'{__name__}.handle'
+    # Label values are kept as they were exported before, dashboards rely on them
+    assert {'name': name, 'status': 'Status.SUCCESS'} in [
+        sample.labels for metric in FUNCTIONS_DURATION.collect() for sample in metric.samples
+    ]
+    assert observed_count(name, Status.SUCCESS) == 1
+    assert observed_exemplars(name, Status.SUCCESS) == [{'slot': '10'}]
+
+
+def test_exemplar_error_does_not_replace_function_error():
+    def broken_exemplar(*_):
+        raise KeyError('slot')
+
+    @duration_meter(broken_exemplar)
+    def fail() -> None:
+        raise ConnectionError('CL is down')
+
+    with pytest.raises(ConnectionError):
+        fail()
+
+    name = f'{__name__}.fail'
+    assert observed_count(name, Status.FAILURE) == 1
+    assert not observed_exemplars(name, Status.FAILURE)
@@ -0,0 +1,79 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.utils.events_cache import REORG_SAFE_DEPTH
+from src.web3py import middleware
+from src.web3py.middleware import el_cache
+
+
+@pytest.fixture
+def make_request():
+    return MagicMock(side_effect=lambda method, params: {'jsonrpc': '2.0', 'id': 1, 'result': '0x01'})
+
+
+def call(block) -> tuple[str, list]:
+    return 'eth_call', [{'to': '0x01', 'data': '0x82ad56cb'}, block]
+
+
+def test_old_blocks_are_cached(make_request):
+    request = el_cache(make_request, MagicMock())
+    request(*call(hex(1000 + REORG_SAFE_DEPTH)))
+
+    request(*call(hex(1000)))
+    request(*call(hex(1000)))
+
+    assert make_request.call_count == 2
+
+
+def test_recent_blocks_and_tags_are_not_cached(make_request):
+    request = el_cache(make_request, MagicMock())
+
+    for block in ('latest', 'latest', hex(1000), hex(1000)):
+        request(*call(block))
+
+    assert make_request.call_count == 4
+
+
+def test_logs_by_block_hash_are_cached(make_request):
+    request = el_cache(make_request, MagicMock())
+    params = [{'address': '0x01', 'blockHash': '0x' + '11' * 32}]
+
+    request('eth_getLogs', params)
+    request('eth_getLogs', params)
+
+    assert make_request.call_count == 1
+
+
+def test_errors_are_not_cached():
+    make_request = MagicMock(return_value={'jsonrpc': '2.0', 'id': 1, 'error': {'code': -32000}})
+    request = el_cache(make_request, MagicMock())
+    params = [{'address': '0x01', 'blockHash': '0x' + '11' * 32}]
+
+    request('eth_getLogs', params)
+    request('eth_getLogs', params)
+
+    assert make_request.call_count == 2
+
+
+def test_null_results_are_not_cached():
+    make_request = MagicMock(return_value={'jsonrpc': '2.0', 'id': 1, 'result': None})
+    request = el_cache(make_request, MagicMock())
+    params = ['0x' + '11' * 32, False]
+
+    request('eth_getBlockByHash', params)
+    request('eth_getBlockByHash', params)
+
+    assert make_request.call_count == 2
+
+
+def test_least_recently_used_response_is_evicted(make_request, monkeypatch):
+    monkeypatch.setattr(middleware, 'EL_CACHE_MAX_SIZE', 2)
+    request = el_cache(make_request, MagicMock())
+    request(*call(hex(1000 + REORG_SAFE_DEPTH)))
+
+    for block in (1, 2, 1, 3, 1, 2):
+        request(*call(hex(block)))
+
+    # Block 2 is evicted by block 3, block 1 stays in the cache as the most used one
+    assert make_request.call_count == 1 + 4
@@ -0,0 +1,177 @@
+import threading
+
+import pytest
+
+from src.typings import BlockNumber
+from src.utils import events as events_module
+from src.utils import events_cache
+from src.utils.events import InconsistentEvents, get_events_in_range
+from src.utils.events_cache import REORG_SAFE_DEPTH
+
+
+class EventStub:
+    event_name = 'Stub'
+    address = '0xAbC'
+
+    def __init__(self, blocks: list[int], max_range: int | None = None, shift: int = 0, max_events: int | None = None):
+        self.blocks = blocks
+        self.max_range = max_range
+        self.max_events = max_events
+        self.shift = shift
+        self.requested_ranges: list[tuple[int, int]] = []
+        self._lock = threading.Lock()
+
+    def get_logs(self, fromBlock, toBlock):  # pylint: disable=invalid-name
+        with self._lock:
+            self.requested_ranges.append((fromBlock, toBlock))
+        if self.max_range is not None and toBlock - fromBlock > self.max_range:
+            raise ValueError({'code': -32005, 'message': 'query exceeds max block range'})
+        events = [
+            {'blockNumber': b + self.shift, 'args': {'data': b.to_bytes(2, 'big')}}
+            for b in self.blocks
+            if fromBlock <= b <= toBlock
+        ]
+        if self.max_events is not None and len(events) > self.max_events:
+            raise ValueError({'code': -32005, 'message': 'query returned more than 3 results'})
+        return events
+
+
+@pytest.fixture(autouse=True)
+def small_step(monkeypatch):
+    monkeypatch.setattr(events_module, 'EVENTS_SEARCH_STEP', 9)
+
+
+def test_events_are_yielded_in_blocks_order():
+    blocks = list(range(0, 100, 3))
+    event = EventStub(blocks)
+
+    found = [e['blockNumber'] for e in get_events_in_range(event, BlockNumber(0), BlockNumber(99))]
+
+    assert found == blocks
+    assert len(event.requested_ranges) == 10
+
+
+def test_rejected_range_is_split():
+    blocks = list(range(0, 100, 7))
+    event = EventStub(blocks, max_range=2)
+
+    found = [e['blockNumber'] for e in get_events_in_range(event, BlockNumber(0), BlockNumber(99))]
+
+    assert found == blocks
+    accepted = sorted(r for r in event.requested_ranges if r[1] - r[0] <= 2)
+    assert accepted[0][0] == 0 and accepted[-1][1] == 99
+    assert all(prev[1] + 1 == cur[0] for prev, cur in zip(accepted, accepted[1:]))
+
+
+def test_step_grows_back_after_dense_range():
+    # Dense range at the start needs short chunks, the rest is fetched with the full step again
+    blocks = list(range(0, 10)) + list(range(10, 300, 50))
+    event = EventStub(blocks, max_events=3)
+
+    found = [e['blockNumber'] for e in get_events_in_range(event, BlockNumber(0), BlockNumber(299))]
+
+    assert found == blocks
+    lengths = [r[1] - r[0] for r in event.requested_ranges]
+    shortest = lengths.index(min(lengths[:-1]))
+    assert 9 in lengths[shortest:]
+    assert len(event.requested_ranges) < 60
+
+
+def test_single_block_error_is_raised():
+    event = EventStub([], max_range=-1)
+
+    with pytest.raises(ValueError):
+        list(get_events_in_range(event, BlockNumber(0), BlockNumber(3)))
+
+
+def test_event_outside_range_is_inconsistent():
+    event = EventStub([5], shift=10)
+
+    with pytest.raises(InconsistentEvents):
+        list(get_events_in_range(event, BlockNumber(0), BlockNumber(9)))
+
+
+def test_invalid_range():
+    with pytest.raises(ValueError):
+        list(get_events_in_range(EventStub([]), BlockNumber(10), BlockNumber(9)))
+
+
+@pytest.fixture
+def cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(events_module, 'EVENTS_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(events_cache, '_caches', {})
+    return tmp_path
+
+
+def restart(monkeypatch):
+    monkeypatch.setattr(events_cache, '_caches', {})
+
+
+def test_cached_events_are_not_fetched_after_restart(cache_dir, monkeypatch):
+    blocks = list(range(0, 200, 10))
+    first_run = EventStub(blocks)
+    assert list(get_events_in_range(first_run, BlockNumber(0), BlockNumber(199))) == first_run.get_logs(0, 199)
+
+    restart(monkeypatch)
+    second_run = EventStub(blocks)
+    found = list(get_events_in_range(second_run, BlockNumber(50), BlockNumber(199)))
+
+    assert [e['blockNumber'] for e in found] == blocks[5:]
+    assert found[0]['args']['data'] == (50).to_bytes(2, 'big')
+    assert min(l_block for l_block, _ in second_run.requested_ranges) == 200 - REORG_SAFE_DEPTH
+    assert (cache_dir / '0xabc_Stub.jsonl').exists()
+
+
+def test_cache_follows_the_head(cache_dir):  # pylint: disable=unused-argument
+    event = EventStub(list(range(0, 300, 10)))
+    list(get_events_in_range(event, BlockNumber(0), BlockNumber(199)))
+    event.requested_ranges.clear()
+
+    found = list(get_events_in_range(event, BlockNumber(200), BlockNumber(209)))
+
+    assert [e['blockNumber'] for e in found] == [200]
+    assert event.requested_ranges[0][0] == 200 - REORG_SAFE_DEPTH
+
+
+def test_broken_tail_of_cache_is_ignored(cache_dir, monkeypatch):
+    blocks = list(range(0, 200, 10))
+    list(get_events_in_range(EventStub(blocks), BlockNumber(0), BlockNumber(99)))
+    list(get_events_in_range(EventStub(blocks), BlockNumber(100), BlockNumber(199)))
+    cache_file = cache_dir / '0xabc_Stub.jsonl'
+    content = cache_file.read_text()
+    cache_file.write_text(content[: len(content) - 10])
+
+    restart(monkeypatch)
+    event = EventStub(blocks)
+    found = list(get_events_in_range(event, BlockNumber(0), BlockNumber(199)))
+
+    assert [e['blockNumber'] for e in found] == blocks
+    assert min(l_block for l_block, _ in event.requested_ranges) == 100 - REORG_SAFE_DEPTH
+
+
+def test_events_before_keep_from_are_dropped_from_cache(cache_dir, monkeypatch):
+    monkeypatch.setattr(events_cache, 'COMPACT_AFTER_CHUNKS', 2)
+    event = EventStub(list(range(0, 300, 10)))
+    list(get_events_in_range(event, BlockNumber(0), BlockNumber(199)))
+
+    for block in range(200, 204):
+        found = list(get_events_in_range(event, BlockNumber(block), BlockNumber(block), BlockNumber(block - 100)))
+        assert [e['blockNumber'] for e in found] == ([200] if block == 200 else [])
+
+    cache = events_cache.get_events_cache(str(cache_dir), event)
+    assert cache.from_block == 103
+    assert [e['blockNumber'] for e in cache.events] == [110, 120, 130]
+
+    restart(monkeypatch)
+    cache = events_cache.get_events_cache(str(cache_dir), event)
+    assert cache.from_block == 103
+    assert [e['blockNumber'] for e in cache.events] == [110, 120, 130]
+
+
+def test_cache_lock_is_not_held_by_consumer(cache_dir):
+    event = EventStub(list(range(0, 100, 10)))
+    events = get_events_in_range(event, BlockNumber(0), BlockNumber(99))
+
+    next(events)
+
+    assert not events_cache.get_events_cache(str(cache_dir), event).lock.locked()
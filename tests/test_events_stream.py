@@ -0,0 +1,60 @@
+# pylint: disable=protected-access
+from unittest.mock import MagicMock
+
+from src.providers.consensus.events import EventStream, EventTopic
+from src.providers.consensus.typings import ChainReorgEvent, HeadEvent
+
+HEAD_EVENT = (
+    b'id: 1\nevent: head\ndata: {"slot": "10", "block": "0x01", "state": "0x02", "epoch_transition": false}\n\n'
+)
+REORG_EVENT = (
+    b'id: 2\nevent: chain_reorg\n'
+    b'data: {"slot": "11", "depth": "2", "old_head_block": "0x03", "new_head_block": "0x04", "epoch": "0"}\n\n'
+)
+
+
+def make_stream(*chunks: bytes) -> EventStream:
+    consensus = MagicMock()
+    consensus.get_events_stream.return_value.iter_content.return_value = iter(chunks)
+    return EventStream(consensus)
+
+
+def test_typed_events_are_dispatched_to_subscribers():
+    # Event is split between chunks on purpose
+    stream = make_stream(HEAD_EVENT[:20], HEAD_EVENT[20:] + REORG_EVENT + b'event: heartbeat\ndata: {}\n\n')
+    heads, reorgs = [], []
+    stream.subscribe(EventTopic.HEAD, heads.append)
+    stream.subscribe(EventTopic.CHAIN_REORG, reorgs.append)
+
+    list(stream._receive())
+
+    stream.consensus.get_events_stream.assert_called_once_with(['head', 'chain_reorg'], None)
+    assert heads == [HeadEvent(slot=10, block='0x01', state='0x02', epoch_transition=False)]
+    assert reorgs == [ChainReorgEvent(depth=2, slot=11, old_head_block='0x03', new_head_block='0x04')]
+    assert stream.connected.is_set()
+
+
+def test_reconnect_resumes_from_last_event_id():
+    stream = make_stream(HEAD_EVENT, REORG_EVENT)
+    stream.subscribe(EventTopic.HEAD, lambda _: None)
+
+    list(stream._receive())
+    list(stream._receive())
+
+    assert stream.last_event_id == '2'
+    stream.consensus.get_events_stream.assert_called_with(['head'], '2')
+
+
+def test_failed_subscriber_does_not_affect_others():
+    stream = make_stream(HEAD_EVENT)
+    received = []
+
+    def fail(_):
+        raise ValueError('Unexpected')
+
+    stream.subscribe(EventTopic.HEAD, fail)
+    stream.subscribe(EventTopic.HEAD, received.append)
+
+    list(stream._receive())
+
+    assert len(received) == 1
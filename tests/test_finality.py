@@ -0,0 +1,83 @@
+from dataclasses import replace
+from unittest.mock import MagicMock
+
+from src.handlers.finality import FinalityHandler
+from src.providers.consensus.typings import (
+    Checkpoint,
+    FinalityCheckpoints,
+    FinalizedCheckpointEvent,
+)
+from src.typings import EpochNumber, SlotNumber
+from tests.execution_requests.helpers import create_sample_block
+from tests.execution_requests.stubs import WatcherStub
+
+
+def block_at(epoch: int, slot_in_epoch: int = 0):
+    block = create_sample_block()
+    return replace(block, message=replace(block.message, slot=SlotNumber(epoch * 32 + slot_in_epoch)))
+
+
+def checkpoints(finalized_epoch: int) -> FinalityCheckpoints:
+    checkpoint = Checkpoint(epoch=EpochNumber(finalized_epoch), root='0x')
+    return FinalityCheckpoints(previous_justified=checkpoint, current_justified=checkpoint, finalized=checkpoint)
+
+
+def test_checkpoints_are_requested_once_per_epoch_without_events():
+    watcher = WatcherStub()
+    # Events stream is started, but the node is not connected
+    watcher.event_stream.listener = MagicMock()
+    watcher.consensus.get_finality_checkpoints = MagicMock(return_value=checkpoints(8))
+    handler = FinalityHandler()
+
+    for slot in range(3):
+        handler.handle(watcher, block_at(10, slot)).result()
+    handler.handle(watcher, block_at(11)).result()
+
+    assert watcher.consensus.get_finality_checkpoints.call_count == 2
+    assert handler.finalized_epoch == 8
+    assert not watcher.alertmanager.sent_alerts
+
+
+def test_lag_is_alerted_once_per_finalized_epoch():
+    watcher = WatcherStub()
+    watcher.consensus.get_finality_checkpoints = MagicMock(return_value=checkpoints(8))
+    handler = FinalityHandler()
+
+    for epoch in range(13, 16):
+        handler.handle(watcher, block_at(epoch)).result()
+
+    assert len(watcher.alertmanager.sent_alerts) == 1
+    alert = watcher.alertmanager.sent_alerts[0]
+    assert alert.labels.alertname.startswith('HeadWatcherFinalityLag')
+    assert 'not finalized for 5 epochs' in alert.annotations.summary
+
+
+def test_finalized_epoch_from_events():
+    watcher = WatcherStub()
+    watcher.consensus.get_finality_checkpoints = MagicMock()
+    watcher.event_stream.connected.set()
+    handler = FinalityHandler()
+    handler.subscribe(watcher)
+
+    event = FinalizedCheckpointEvent(block='0x', state='0x', epoch=EpochNumber(8))
+    for callback in watcher.event_stream.subscribers['finalized_checkpoint']:
+        callback(event)
+    handler.handle(watcher, block_at(10)).result()
+
+    watcher.consensus.get_finality_checkpoints.assert_not_called()
+    assert handler.finalized_epoch == 8
+
+
+def test_failed_request_is_retried_with_next_head():
+    watcher = WatcherStub()
+    watcher.consensus.get_finality_checkpoints = MagicMock(
+        side_effect=[ConnectionError('node is down'), checkpoints(8)]
+    )
+    handler = FinalityHandler()
+
+    handler.handle(watcher, block_at(10)).result()
+    assert handler.finalized_epoch is None
+
+    handler.handle(watcher, block_at(10, 1)).result()
+    assert handler.finalized_epoch == 8
+    assert watcher.consensus.get_finality_checkpoints.call_count == 2
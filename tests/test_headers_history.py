@@ -0,0 +1,58 @@
+from src.typings import BlockNumber, BlockRoot, SlotNumber
+from src.utils.headers_history import HeadersHistory, HeaderSummary
+from tests.execution_requests.helpers import create_sample_block, random_hex
+
+
+def make_header(slot: int, parent_root: str | None = None) -> HeaderSummary:
+    return HeaderSummary(
+        root=BlockRoot(random_hex(32)),
+        parent_root=BlockRoot(parent_root or random_hex(32)),
+        slot=SlotNumber(slot),
+        block_number=BlockNumber(slot),
+    )
+
+
+def test_summary_from_block():
+    block = create_sample_block()
+
+    assert HeaderSummary.from_block(block) == HeaderSummary(
+        root=block.root,
+        parent_root=block.header.message.parent_root,
+        slot=SlotNumber(33),
+        block_number=BlockNumber(31),
+    )
+
+
+def test_headers_are_evicted_in_order():
+    history = HeadersHistory(depth=3)
+    headers = [make_header(slot) for slot in range(5)]
+    for header in headers:
+        history.append(header)
+
+    assert len(history) == 3
+    assert list(history) == headers[2:]
+    assert history.last is headers[-1]
+    assert history.get(headers[1].root) is None
+    assert history.get_by_slot(SlotNumber(1)) is None
+    assert history.get(headers[2].root) is headers[2]
+    assert history.get_by_slot(SlotNumber(4)) is headers[4]
+
+
+def test_reorged_slot_points_to_the_latest_header():
+    history = HeadersHistory(depth=2)
+    orphaned = make_header(10)
+    canonical = make_header(10)
+    history.append(orphaned)
+    history.append(canonical)
+    history.append(make_header(11, parent_root=canonical.root))
+
+    assert history.get(orphaned.root) is None
+    assert history.get_by_slot(SlotNumber(10)) is canonical
+
+
+def test_empty_history():
+    history = HeadersHistory(depth=2)
+
+    assert not history
+    assert history.last is None
+    assert history.get(BlockRoot(random_hex(32))) is None
@@ -0,0 +1,21 @@
+import logging
+import queue
+from unittest.mock import MagicMock
+
+from src.metrics.logging import DeferredQueueHandler, JsonFormatter, Lazy
+
+
+def test_lazy_value_is_evaluated_only_when_formatted():
+    log_queue: queue.Queue = queue.Queue()
+    logger = logging.getLogger('test_deferred')
+    logger.addHandler(DeferredQueueHandler(log_queue))
+    # Captured by pytest handlers of the root logger otherwise
+    logger.propagate = False
+    dump = MagicMock(return_value={'slot': 1})
+
+    logger.warning({'msg': 'State', 'state': Lazy(dump)})
+
+    dump.assert_not_called()
+    record = log_queue.get_nowait()
+    assert '"state": {"slot": 1}' in JsonFormatter().format(record)
+    dump.assert_called_once()
@@ -0,0 +1,27 @@
+import sys
+
+from src.keys_source.base_source import NamedKey
+from src.utils.memory import approximate_size
+
+
+def test_approximate_size_of_homogeneous_dict():
+    keys = {
+        f'0x{i:096x}': NamedKey(key=f'0x{i:096x}', operatorIndex='1', operatorName='Operator', moduleIndex='1')
+        for i in range(10_000)
+    }
+    exact = sys.getsizeof(keys) + sum(
+        sys.getsizeof(pubkey)
+        + sys.getsizeof(key)
+        + sys.getsizeof(vars(key))
+        + sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in vars(key).items())
+        for pubkey, key in keys.items()
+    )
+
+    assert approximate_size(keys) == exact
+
+
+def test_approximate_size_of_nested_containers():
+    state = {block: set(range(block, block + 10)) for block in range(1000)}
+
+    assert approximate_size(state) > sys.getsizeof(state) + 1000 * sys.getsizeof(state[0])
+    assert approximate_size([]) == sys.getsizeof([])
@@ -0,0 +1,95 @@
+# pylint: disable=protected-access
+from unittest.mock import MagicMock
+
+import pytest
+
+from src import variables
+from src.handlers.exit import ExitsHandler
+from src.keys_source.base_source import NamedKey
+from src.providers.consensus.typings import BlockVoluntaryExit, VoluntaryExit
+from src.typings import BlockNumber, SlotNumber, ValidatorIndex
+from tests.execution_requests.helpers import create_sample_block, gen_random_pubkey
+from tests.execution_requests.stubs import WatcherStub
+
+
+@pytest.fixture
+def watcher(monkeypatch) -> WatcherStub:
+    # There are no requested exits for validators from the keys file, so EL is not used
+    monkeypatch.setattr(variables, 'KEYS_SOURCE', 'file')
+    keys = [gen_random_pubkey() for _ in range(2)]
+    return WatcherStub(
+        user_keys={key: NamedKey(key=key, operatorName='Operator', operatorIndex='1', moduleIndex='1') for key in keys},
+        indexed_validators_keys={ValidatorIndex(i): key for i, key in enumerate(keys)},
+    )
+
+
+def alert_name(alert) -> str:
+    # Alert name is suffixed with the timestamp
+    return alert.labels.alertname.rstrip('0123456789.')
+
+
+def voluntary_exit(index: int) -> BlockVoluntaryExit:
+    return BlockVoluntaryExit(message=VoluntaryExit(validator_index=ValidatorIndex(index)), signature='0x')
+
+
+def test_exit_from_pool_is_not_alerted_again_when_included(watcher):
+    handler = ExitsHandler()
+
+    handler._process_pool_exits(watcher, SlotNumber(32), BlockNumber(31), [voluntary_exit(0)])
+    handler._process_pool_exits(watcher, SlotNumber(33), BlockNumber(31), [voluntary_exit(0)])
+
+    assert len(watcher.alertmanager.sent_alerts) == 1
+    assert alert_name(watcher.alertmanager.sent_alerts[0]) == 'HeadWatcherUserUnexpectedExitInPool'
+
+    block = create_sample_block()
+    block.message.body.voluntary_exits = [voluntary_exit(0), voluntary_exit(1)]
+    handler.handle(watcher, block).result()
+
+    assert len(watcher.alertmanager.sent_alerts) == 2
+    alert = watcher.alertmanager.sent_alerts[1]
+    assert alert_name(alert) == 'HeadWatcherUserUnexpectedExit'
+    assert '[1]' in alert.annotations.description
+    assert '[0]' not in alert.annotations.description
+    assert not handler.exits_seen_in_pool
+
+
+def test_exit_from_pool_is_alerted_when_included_if_pool_alert_failed(watcher):
+    handler = ExitsHandler()
+    send_alerts = watcher.alertmanager.send_alerts
+    watcher.alertmanager.send_alerts = MagicMock(side_effect=ConnectionError)
+
+    with pytest.raises(ConnectionError):
+        handler._process_pool_exits(watcher, SlotNumber(32), BlockNumber(31), [voluntary_exit(0)])
+
+    assert not handler.exits_seen_in_pool
+
+    watcher.alertmanager.send_alerts = send_alerts
+    block = create_sample_block()
+    block.message.body.voluntary_exits = [voluntary_exit(0)]
+    handler.handle(watcher, block).result()
+
+    assert len(watcher.alertmanager.sent_alerts) == 1
+    assert alert_name(watcher.alertmanager.sent_alerts[0]) == 'HeadWatcherUserUnexpectedExit'
+    assert '[0]' in watcher.alertmanager.sent_alerts[0].annotations.description
+
+
+def test_foreign_exits_from_pool_are_ignored(watcher):
+    handler = ExitsHandler()
+
+    handler._process_pool_exits(watcher, SlotNumber(32), BlockNumber(31), [voluntary_exit(100)])
+
+    assert not watcher.alertmanager.sent_alerts
+    assert not handler.exits_seen_in_pool
+
+
+def test_pool_poll_error_does_not_fail_head(watcher):
+    handler = ExitsHandler()
+    # Events stream is started, but the node is not connected
+    watcher.event_stream.listener = MagicMock()
+    watcher.consensus.get_pool_voluntary_exits.side_effect = ConnectionError('pool is unavailable')
+    block = create_sample_block()
+    block.message.body.voluntary_exits = [voluntary_exit(0)]
+
+    handler.handle(watcher, block).result()
+
+    assert [alert_name(alert) for alert in watcher.alertmanager.sent_alerts] == ['HeadWatcherUserUnexpectedExit']
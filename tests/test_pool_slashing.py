@@ -0,0 +1,85 @@
+# pylint: disable=protected-access
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.handlers.pool_slashing import PoolSlashingHandler
+from src.keys_source.base_source import NamedKey
+from src.typings import SlotNumber, ValidatorIndex
+from tests.execution_requests.helpers import create_sample_block, gen_random_pubkey
+from tests.execution_requests.stubs import WatcherStub
+
+USER_INDEX = ValidatorIndex(5)
+OTHER_INDEX = ValidatorIndex(6)
+
+
+@pytest.fixture
+def watcher() -> WatcherStub:
+    user_key, other_key = gen_random_pubkey(), gen_random_pubkey()
+    return WatcherStub(
+        user_keys={user_key: NamedKey(key=user_key, operatorName='Operator', operatorIndex='1', moduleIndex='1')},
+        indexed_validators_keys={USER_INDEX: user_key, OTHER_INDEX: other_key},
+    )
+
+
+def attester_slashing(*indexes: int) -> dict:
+    attesting_indices = [str(i) for i in indexes]
+    return {
+        'attestation_1': {'attesting_indices': attesting_indices},
+        'attestation_2': {'attesting_indices': attesting_indices},
+    }
+
+
+def proposer_slashing(index: int) -> dict:
+    return {'signed_header_1': {'message': {'proposer_index': str(index)}}}
+
+
+def test_user_slashing_in_pool_is_alerted_once(watcher):
+    handler = PoolSlashingHandler()
+
+    handler._process(watcher, SlotNumber(10), [], [attester_slashing(USER_INDEX, OTHER_INDEX)])
+    handler._process(watcher, SlotNumber(11), [], [attester_slashing(USER_INDEX)])
+
+    assert len(watcher.alertmanager.sent_alerts) == 1
+    alert = watcher.alertmanager.sent_alerts[0]
+    assert alert.labels.alertname.startswith('HeadWatcherUserSlashingInPool')
+    assert f'[{USER_INDEX}]' in alert.annotations.description
+    assert f'[{OTHER_INDEX}]' not in alert.annotations.description
+
+
+def test_other_slashings_in_pool_are_ignored(watcher):
+    handler = PoolSlashingHandler()
+
+    handler._process(watcher, SlotNumber(10), [proposer_slashing(OTHER_INDEX)], [attester_slashing(100)])
+
+    assert not watcher.alertmanager.sent_alerts
+
+
+def test_pool_is_polled_only_while_started_stream_is_disconnected(watcher):
+    handler = PoolSlashingHandler()
+    watcher.consensus.get_pool_proposer_slashings.return_value = [proposer_slashing(USER_INDEX)]
+
+    handler.handle(watcher, create_sample_block()).result()
+    watcher.consensus.get_pool_proposer_slashings.assert_not_called()
+
+    watcher.event_stream.listener = MagicMock()
+    watcher.event_stream.connected.set()
+    handler.handle(watcher, create_sample_block()).result()
+    assert not watcher.alertmanager.sent_alerts
+    watcher.consensus.get_pool_proposer_slashings.assert_not_called()
+
+    watcher.event_stream.connected.clear()
+    handler.handle(watcher, create_sample_block()).result()
+    assert len(watcher.alertmanager.sent_alerts) == 1
+    assert 'proposer' in watcher.alertmanager.sent_alerts[0].annotations.description
+
+
+def test_pool_poll_error_does_not_fail_head(watcher):
+    handler = PoolSlashingHandler()
+    watcher.event_stream.listener = MagicMock()
+    watcher.consensus.get_pool_proposer_slashings.side_effect = ConnectionError('pool is unavailable')
+
+    handler.handle(watcher, create_sample_block()).result()
+
+    assert not watcher.alertmanager.sent_alerts
+    assert not handler.seen_slashings
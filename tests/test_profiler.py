@@ -0,0 +1,29 @@
+import threading
+import time
+
+from src.metrics.profiler import sample_stacks, to_collapsed, to_speedscope
+
+
+def _spin(stop: threading.Event):
+    while not stop.is_set():
+        time.sleep(0.001)
+
+
+def test_sample_stacks_of_other_threads():
+    stop = threading.Event()
+    thread = threading.Thread(target=_spin, args=(stop,), name='spinner', daemon=True)
+    thread.start()
+    try:
+        stacks = sample_stacks(0.1, 0.005)
+    finally:
+        stop.set()
+
+    collapsed = to_collapsed(stacks)
+    assert any(line.startswith('spinner;') and '_spin' in line for line in collapsed.splitlines())
+    assert 'sample_stacks' not in collapsed, 'Sampling thread should be excluded'
+
+    speedscope = to_speedscope(stacks, 0.005, 'test')
+    spinner = next(p for p in speedscope['profiles'] if p['name'] == 'spinner')
+    assert len(spinner['samples']) == len(spinner['weights'])
+    frame_names = {speedscope['shared']['frames'][i]['name'] for sample in spinner['samples'] for i in sample}
+    assert '_spin' in frame_names
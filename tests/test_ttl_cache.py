@@ -0,0 +1,29 @@
+from unittest.mock import MagicMock
+
+from src.utils import ttl_cache
+from src.utils.ttl_cache import TTLCache
+
+
+def test_value_is_loaded_again_when_expired(monkeypatch):
+    now = MagicMock(return_value=100.0)
+    monkeypatch.setattr(ttl_cache.time, 'monotonic', now)
+    cache = TTLCache()
+    load = MagicMock(side_effect=[1, 2])
+
+    assert cache.get('key', load, ttl=10) == 1
+    now.return_value = 109.0
+    assert cache.get('key', load, ttl=10) == 1
+    now.return_value = 110.0
+    assert cache.get('key', load, ttl=10) == 2
+    assert load.call_count == 2
+
+
+def test_invalidated_value_is_loaded_again():
+    cache = TTLCache()
+    cache.get('key', lambda: 1, ttl=60)
+    cache.get('other', lambda: 1, ttl=60)
+
+    cache.invalidate('key')
+
+    assert cache.get('key', lambda: 2, ttl=60) == 2
+    assert cache.get('other', lambda: 2, ttl=60) == 1
@@ -1,7 +1,7 @@
 def test_processing(watcher):
     watcher.run("6213851-6213858")
 
-    assert [h.header.message.slot for h in watcher.handled_headers] == [str(s) for s in range(6213851, 6213859)]
+    assert [h.slot for h in watcher.handled_headers] == list(range(6213851, 6213859))
 
     assert watcher.keys_updater.done(), "Keys updater should be done"
     assert watcher.validators_updater.done(), "Validators updater should be done"
@@ -21,7 +21,7 @@ slashing_alerts = [
     },
     {
         'summary': '🚨🚨🚨 2 Our validators were slashed! 🚨🚨🚨',
-        'description': '\nRockLogic GmbH - Violated duty: attester | Validators: [[459093](http://mainnet.beaconcha.in/validator/459093), [458562](http://mainnet.beaconcha.in/validator/458562)]\n\nslot: [6213854](https://mainnet.beaconcha.in/slot/6213854)',
+        'description': '\nRockLogic GmbH - Violated duty: attester | Validators: [[458562](http://mainnet.beaconcha.in/validator/458562), [459093](http://mainnet.beaconcha.in/validator/459093)]\n\nslot: [6213854](https://mainnet.beaconcha.in/slot/6213854)',
     },
     {
         'summary': '🚨🚨🚨 2 Our validators were slashed! 🚨🚨🚨',
@@ -29,7 +29,7 @@ slashing_alerts = [
     },
     {
         'summary': '🚨🚨🚨 2 Our validators were slashed! 🚨🚨🚨',
-        'description': '\nRockLogic GmbH - Violated duty: attester | Validators: [[459140](http://mainnet.beaconcha.in/validator/459140), [459098](http://mainnet.beaconcha.in/validator/459098)]\n\nslot: [6213856](https://mainnet.beaconcha.in/slot/6213856)',
+        'description': '\nRockLogic GmbH - Violated duty: attester | Validators: [[459098](http://mainnet.beaconcha.in/validator/459098), [459140](http://mainnet.beaconcha.in/validator/459140)]\n\nslot: [6213856](https://mainnet.beaconcha.in/slot/6213856)',
     },
     {
         'summary': '🚨🚨🚨 1 Our validators were slashed! 🚨🚨🚨',